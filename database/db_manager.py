@@ -1,8 +1,10 @@
 import sqlite3
 import os
+import re
 from datetime import datetime
 from typing import List, Optional, Tuple
 from contextlib import contextmanager
+from functools import lru_cache
 from utils.logger import logger
 from config import DATABASE_PATH
 
@@ -12,12 +14,16 @@ class DatabaseManager:
     
     def __init__(self, db_path: str = DATABASE_PATH):
         self.db_path = db_path
+        self.products_fts_enabled = False
+        # Recent customer searches; cleared whenever customers change
+        self._customer_search_cache = lru_cache(maxsize=128)(self._query_customers)
         self.ensure_database_exists()
         # Run migration for batch/expiry columns
         self.add_batch_expiry_columns()
         self.migrate_dual_banking()
         self.migrate_add_igst_column()
         self.migrate_banking_fields()  # ← ADD THIS
+        self.migrate_products_fts()
 
     
     def ensure_database_exists(self):
@@ -206,16 +212,66 @@ class DatabaseManager:
             logger.error(f"Error getting product: {e}")
             return None
     
+    def get_product_by_name(self, name: str) -> Optional[dict]:
+        """Get product by exact name, ignoring case"""
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.execute(
+                    "SELECT * FROM products WHERE name=? COLLATE NOCASE LIMIT 1", (name,)
+                )
+                product = cursor.fetchone()
+                return dict(product) if product else None
+        except Exception as e:
+            logger.error(f"Error getting product by name: {e}")
+            return None
+    
     def search_products(self, search_term: str) -> List[dict]:
         """Search products by name or barcode"""
+        return self.query_products(search_term)
+    
+    def query_products(self, search_term: str, category: Optional[str] = None) -> List[dict]:
+        """Search products by name or barcode, optionally within one category"""
+        # Category predicate appended to each search query
+        category_sql = " AND category=?" if category else ""
+        category_params = (category,) if category else ()
         try:
             with self.get_connection() as conn:
-                cursor = conn.execute("""
+                # Scanned barcodes are all digits: try an indexed exact match first
+                if search_term.isdigit():
+                    cursor = conn.execute(
+                        f"SELECT * FROM products WHERE barcode=?{category_sql} ORDER BY name LIMIT 50",
+                        (search_term,) + category_params
+                    )
+                    rows = cursor.fetchall()
+                    if rows:
+                        return [dict(row) for row in rows]
+                
+                # Word-prefix match through the full-text index
+                tokens = re.findall(r'\w+', search_term)
+                if self.products_fts_enabled and tokens:
+                    match = ' '.join(f'"{token}"*' for token in tokens)
+                    try:
+                        cursor = conn.execute(f"""
+                            SELECT * FROM products
+                            WHERE id IN (SELECT rowid FROM products_fts WHERE products_fts MATCH ?){category_sql}
+                            ORDER BY name
+                            LIMIT 50
+                        """, (match,) + category_params)
+                        rows = cursor.fetchall()
+                    except sqlite3.OperationalError as e:
+                        # e.g. a restored backup that predates the index
+                        logger.error(f"Full-text product search failed: {e}")
+                        rows = []
+                    if rows:
+                        return [dict(row) for row in rows]
+                
+                # Fall back to substring matching for mid-word searches
+                cursor = conn.execute(f"""
                     SELECT * FROM products 
-                    WHERE name LIKE ? OR barcode LIKE ?
+                    WHERE (name LIKE ? OR barcode LIKE ?){category_sql}
                     ORDER BY name
                     LIMIT 50
-                """, (f'%{search_term}%', f'%{search_term}%'))
+                """, (f'%{search_term}%', f'%{search_term}%') + category_params)
                 return [dict(row) for row in cursor.fetchall()]
         except Exception as e:
             logger.error(f"Error searching products: {e}")
@@ -304,21 +360,6 @@ class DatabaseManager:
     
     # ==================== CUSTOMER OPERATIONS ====================
     
-    def search_customers(self, search_text: str) -> List[dict]:
-        """Search customers by name or phone"""
-        try:
-            with self.get_connection() as conn:
-                cursor = conn.execute("""
-                    SELECT * FROM customers 
-                    WHERE name LIKE ? OR phone LIKE ?
-                    ORDER BY name
-                    LIMIT 20
-                """, (f'%{search_text}%', f'%{search_text}%'))
-                return [dict(row) for row in cursor.fetchall()]
-        except Exception as e:
-            logger.error(f"Error searching customers: {e}")
-            return []
-    
     def get_customer_by_phone(self, phone: str) -> Optional[dict]:
         """Get customer by phone number"""
         try:
@@ -360,6 +401,7 @@ class DatabaseManager:
                         existing_customer['id']
                     ))
                     conn.commit()
+                    self._customer_search_cache.cache_clear()
                     logger.info(f"Customer updated: {customer_data['name']}")
                     return True, "Customer updated", existing_customer['id']
                 else:
@@ -378,6 +420,7 @@ class DatabaseManager:
                         customer_data.get('gstin', '')
                     ))
                     conn.commit()
+                    self._customer_search_cache.cache_clear()
                     logger.info(f"Customer added: {customer_data['name']}")
                     return True, "Customer added", cursor.lastrowid
         except Exception as e:
@@ -416,6 +459,7 @@ class DatabaseManager:
                     customer_data.get('gstin', '')
                 ))
                 conn.commit()
+                self._customer_search_cache.cache_clear()
                 logger.info(f"Customer added: {customer_data['name']}")
                 return cursor.lastrowid
         except Exception as e:
@@ -425,17 +469,36 @@ class DatabaseManager:
     def search_customers(self, search_term: str) -> List[dict]:
         """Search customers by name or phone"""
         try:
-            with self.get_connection() as conn:
+            rows = self._customer_search_cache(search_term.strip())
+            return [dict(row) for row in rows]
+        except Exception as e:
+            logger.error(f"Error searching customers: {e}")
+            return []
+    
+    def _query_customers(self, search_term: str) -> tuple:
+        """Run the customer search query; errors propagate so they aren't cached"""
+        with self.get_connection() as conn:
+            # Prefix matches can range-scan idx_customers_name_nocase / idx_customers_phone
+            name_prefix = re.sub(r'([\\%_])', r'\\\1', search_term) + '%'
+            phone_prefix = re.sub(r'([*?\[])', r'[\1]', search_term) + '*'
+            cursor = conn.execute("""
+                SELECT * FROM customers 
+                WHERE name LIKE ? ESCAPE '\\' OR phone GLOB ?
+                ORDER BY name
+                LIMIT 50
+            """, (name_prefix, phone_prefix))
+            rows = cursor.fetchall()
+            
+            # Fall back to substring matching, e.g. a surname mid-name
+            if not rows:
                 cursor = conn.execute("""
                     SELECT * FROM customers 
                     WHERE name LIKE ? OR phone LIKE ?
                     ORDER BY name
                     LIMIT 50
                 """, (f'%{search_term}%', f'%{search_term}%'))
-                return [dict(row) for row in cursor.fetchall()]
-        except Exception as e:
-            logger.error(f"Error searching customers: {e}")
-            return []
+                rows = cursor.fetchall()
+            return tuple(dict(row) for row in rows)
     
     def get_customer_by_id(self, customer_id: int) -> Optional[dict]:
         """Get customer by ID"""
@@ -946,6 +1009,9 @@ class DatabaseManager:
             
             # Restore from backup
             shutil.copy2(backup_path, self.db_path)
+            self._customer_search_cache.cache_clear()
+            # Backups taken before the full-text index existed lack it
+            self.migrate_products_fts()
             logger.info(f"Database restored from {backup_path}")
             return True
         except Exception as e:
@@ -997,6 +1063,21 @@ class DatabaseManager:
             logger.error(f"Error getting sales persons: {e}")
             return []
     
+    def get_billing_page_bootstrap(self) -> Tuple[List[dict], List[dict]]:
+        """Get all products and active sales persons in one read transaction"""
+        try:
+            with self.get_connection() as conn:
+                conn.execute("BEGIN")
+                products = conn.execute("SELECT * FROM products ORDER BY name").fetchall()
+                sales_persons = conn.execute(
+                    "SELECT * FROM salespersons WHERE is_active=1 ORDER BY name"
+                ).fetchall()
+                conn.commit()
+                return [dict(row) for row in products], [dict(row) for row in sales_persons]
+        except Exception as e:
+            logger.error(f"Error loading billing page data: {e}")
+            return [], []
+    
     def get_sales_person_by_id(self, sales_person_id: int) -> Optional[dict]:
         """Get sales person by ID"""
         try:
@@ -1268,6 +1349,50 @@ class DatabaseManager:
             logger.error(f"Error adding igst_amount column: {e}")
             return False
 
+    def migrate_products_fts(self) -> bool:
+        """Ensure the products_fts full-text index and its sync triggers exist"""
+        try:
+            with self.get_connection() as conn:
+                exists = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type='table' AND name='products_fts'"
+                ).fetchone()
+
+                if not exists:
+                    conn.executescript("""
+                        CREATE VIRTUAL TABLE products_fts USING fts5(
+                            name, barcode, content='products', content_rowid='id'
+                        );
+
+                        CREATE TRIGGER IF NOT EXISTS products_fts_ai AFTER INSERT ON products BEGIN
+                            INSERT INTO products_fts(rowid, name, barcode)
+                            VALUES (new.id, new.name, new.barcode);
+                        END;
+
+                        CREATE TRIGGER IF NOT EXISTS products_fts_ad AFTER DELETE ON products BEGIN
+                            INSERT INTO products_fts(products_fts, rowid, name, barcode)
+                            VALUES ('delete', old.id, old.name, old.barcode);
+                        END;
+
+                        CREATE TRIGGER IF NOT EXISTS products_fts_au AFTER UPDATE OF name, barcode ON products BEGIN
+                            INSERT INTO products_fts(products_fts, rowid, name, barcode)
+                            VALUES ('delete', old.id, old.name, old.barcode);
+                            INSERT INTO products_fts(rowid, name, barcode)
+                            VALUES (new.id, new.name, new.barcode);
+                        END;
+
+                        INSERT INTO products_fts(products_fts) VALUES ('rebuild');
+                    """)
+                    conn.commit()
+                    logger.info("Created products_fts full-text index")
+
+            self.products_fts_enabled = True
+            return True
+        except Exception as e:
+            # SQLite builds without FTS5 keep using LIKE searches
+            logger.error(f"Error creating products_fts index: {e}")
+            self.products_fts_enabled = False
+            return False
+
 
 
 # Create global instance
@@ -1,4 +1,5 @@
 from typing import List, Tuple, Optional, Dict
+from dataclasses import dataclass, asdict
 from datetime import datetime
 from database.db_manager import db
 from modules.gst_calculator import gst_calculator
@@ -8,7 +9,24 @@ from utils.company_settings import company_settings
 from utils.logger import logger
 
 
-
+@dataclass(slots=True)
+class CartItem:
+    """Single line item in the billing cart"""
+    product_id: int
+    product_name: str
+    hsn_code: str
+    batch_number: str
+    expiry_date: str
+    quantity: int
+    unit: str
+    mrp: float
+    discount_percent: float
+    rate: float
+    amount: float
+    
+    def to_dict(self) -> dict:
+        """Convert to a plain dict for database and PDF code"""
+        return asdict(self)
 
 
 class BillingManager:
@@ -17,6 +35,11 @@ class BillingManager:
     def __init__(self):
         self.cart_items = []
         self.current_invoice_number = None
+        # calculate_totals results keyed by is_gst_bill; cleared on cart mutation
+        self._totals_cache = {}
+        # Running sums of item amounts and MRP value, kept in cart order
+        self._subtotal = 0.0
+        self._total_mrp = 0.0
     
     def add_item_to_cart(self, product: dict, quantity: int, batch_number: str = "", expiry_date: str = "") -> Tuple[bool, str]:
         """Add item to cart"""
@@ -28,49 +51,73 @@ class BillingManager:
         
         # Check if product already in cart
         for item in self.cart_items:
-            if item['product_id'] == product['id']:
+            if item.product_id == product['id']:
                 # Update quantity
-                new_quantity = item['quantity'] + quantity
+                new_quantity = item.quantity + quantity
                 if new_quantity > product['current_stock']:
                     return False, f"Total quantity exceeds stock. Available: {product['current_stock']}"
                 
-                item['quantity'] = new_quantity
-                item['amount'] = item['rate'] * new_quantity
+                item.quantity = new_quantity
+                item.amount = item.rate * new_quantity
+                self._recount_sums()
                 return True, "Quantity updated in cart"
         
         # Add new item
-        item = {
-            'product_id': product['id'],
-            'product_name': product['name'],
-            'hsn_code': product.get('hsn_code', '30049012'),
-            'batch_number': batch_number,
-            'expiry_date': expiry_date,
-            'quantity': quantity,
-            'unit': product.get('unit', 'Nos'),
-            'mrp': product['mrp'],
-            'discount_percent': product['discount_percent'],
-            'rate': product['selling_price'],
-            'amount': product['selling_price'] * quantity
-        }
+        item = CartItem(
+            product_id=product['id'],
+            product_name=product['name'],
+            hsn_code=product.get('hsn_code', '30049012'),
+            batch_number=batch_number,
+            expiry_date=expiry_date,
+            quantity=quantity,
+            unit=product.get('unit', 'Nos'),
+            mrp=product['mrp'],
+            discount_percent=product['discount_percent'],
+            rate=product['selling_price'],
+            amount=product['selling_price'] * quantity
+        )
         
         self.cart_items.append(item)
+        # Appending keeps the sums in the order a full recount would use
+        self._subtotal += item.amount
+        self._total_mrp += item.mrp * item.quantity
+        self._totals_cache.clear()
         return True, "Item added to cart"
     
     def remove_item_from_cart(self, index: int) -> bool:
         """Remove item from cart by index"""
         if 0 <= index < len(self.cart_items):
             self.cart_items.pop(index)
+            self._recount_sums()
             return True
         return False
     
     def clear_cart(self):
         """Clear all items from cart"""
         self.cart_items = []
+        self._subtotal = 0.0
+        self._total_mrp = 0.0
+        self._totals_cache.clear()
     
-    def get_cart_items(self) -> List[dict]:
+    def _recount_sums(self):
+        """Recompute the running sums after an item changed or was removed"""
+        subtotal = 0.0
+        total_mrp = 0.0
+        for item in self.cart_items:
+            subtotal += item.amount
+            total_mrp += item.mrp * item.quantity
+        self._subtotal = subtotal
+        self._total_mrp = total_mrp
+        self._totals_cache.clear()
+    
+    def get_cart_items(self) -> List[CartItem]:
         """Get all items in cart"""
         return self.cart_items
     
+    def cart_is_empty(self) -> bool:
+        """Check whether the cart has no items"""
+        return not self.cart_items
+    
     def calculate_totals(self, is_gst_bill: bool = False) -> dict:
         """
         Calculate bill totals with or without GST
@@ -85,6 +132,11 @@ class BillingManager:
             Distribution (CGST/SGST vs IGST) is decided later in create_bill,
             but we still need total_tax and grand_total here.
         """
+        cached = self._totals_cache.get(is_gst_bill)
+        if cached is not None:
+            # Callers add their own keys, so never hand out the cached dict
+            return dict(cached)
+        
         if not self.cart_items:
             return {
                 'subtotal': 0.0,
@@ -98,11 +150,10 @@ class BillingManager:
                 'grand_total': 0.0
             }
         
-        # Calculate subtotal and discount
-        subtotal = sum(item['amount'] for item in self.cart_items)
+        subtotal = self._subtotal
+        total_mrp = self._total_mrp
         
         # Calculate total discount given
-        total_mrp = sum(item['mrp'] * item['quantity'] for item in self.cart_items)
         discount_amount = total_mrp - subtotal
         
         # Taxable amount is the subtotal (after discount)
@@ -127,7 +178,7 @@ class BillingManager:
         grand_total = round(grand_total_before_round)
         round_off = grand_total - grand_total_before_round
         
-        return {
+        totals = {
             'subtotal': subtotal,
             'discount_amount': discount_amount,
             'taxable_amount': taxable_amount,
@@ -138,6 +189,8 @@ class BillingManager:
             'round_off': round_off,
             'grand_total': grand_total
         }
+        self._totals_cache[is_gst_bill] = totals
+        return dict(totals)
     
     def generate_invoice_number(self) -> str:
         """Generate next invoice number based on prefix, FY, and configurable start"""
@@ -290,12 +343,13 @@ class BillingManager:
             }
             
             # Create bill in database
-            success, message, bill_id = db.create_bill(bill_data, self.cart_items)
+            items = [item.to_dict() for item in self.cart_items]
+            success, message, bill_id = db.create_bill(bill_data, items)
             
             if success:
                 # Get complete bill data for PDF generation
                 bill_data['id'] = bill_id
-                bill_data['items'] = self.cart_items.copy()
+                bill_data['items'] = items
                 bill_data['created_at'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
                 
                 logger.info(f"Bill created: {invoice_number}")
@@ -2,6 +2,7 @@ from typing import List, Optional, Tuple
 from datetime import datetime
 from database.db_manager import db
 from modules.auth import auth_manager
+from modules.gst_calculator import gst_calculator
 from utils.signals import app_signals
 from utils.logger import logger
 from utils.validators import (validate_product_name, validate_price, 
@@ -34,7 +35,6 @@ class InventoryManager:
         product_data['discount_percent'] = discount
         
         # Calculate selling price
-        from modules.gst_calculator import gst_calculator
         product_data['selling_price'] = gst_calculator.calculate_selling_price(
             mrp, discount
         )
@@ -43,6 +43,7 @@ class InventoryManager:
         product_id = db.add_product(product_data)
         
         if product_id:
+            app_signals.inventory_updated.emit()
             return True, "Product added successfully", product_id
         else:
             return False, "Failed to add product. Name or barcode may already exist.", None
@@ -67,7 +68,6 @@ class InventoryManager:
         product_data['discount_percent'] = discount
         
         # Calculate selling price
-        from modules.gst_calculator import gst_calculator
         product_data['selling_price'] = gst_calculator.calculate_selling_price(
             mrp, discount
         )
@@ -76,6 +76,7 @@ class InventoryManager:
         success = db.update_product(product_id, product_data)
         
         if success:
+            app_signals.inventory_updated.emit()
             return True, "Product updated successfully"
         else:
             return False, "Failed to update product"
@@ -94,6 +95,7 @@ class InventoryManager:
         success = db.delete_product(product_id)
         
         if success:
+            app_signals.inventory_updated.emit()
             return True, "Product deleted successfully"
         else:
             return False, "Failed to delete product"
@@ -106,10 +108,20 @@ class InventoryManager:
         """Get all products"""
         return db.get_all_products(category)
     
+    def query_products(self, search_term: str = "", category: Optional[str] = None) -> List[dict]:
+        """Get products matching a search term and/or category in one query"""
+        if search_term:
+            return db.query_products(search_term, category)
+        return db.get_all_products(category)
+    
     def get_product_by_id(self, product_id: int) -> Optional[dict]:
         """Get product by ID"""
         return db.get_product_by_id(product_id)
     
+    def get_product_by_name(self, name: str) -> Optional[dict]:
+        """Get product by name (case-insensitive)"""
+        return db.get_product_by_name(name)
+    
     def update_stock(self, product_id: int, quantity: int, change_type: str, notes: str = "") -> Tuple[bool, str]:
         """
         Update product stock
@@ -1,46 +1,587 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-                            QLineEdit, QPushButton, QTableWidget, QTableWidgetItem,
+                            QLineEdit, QPushButton, QTableView, QAbstractItemView,
                             QComboBox, QSpinBox, QTextEdit, QMessageBox, QFrame,
                             QHeaderView, QCompleter, QGroupBox, QGridLayout, QCheckBox,
-                            QDialog, QListWidget, QDialogButtonBox, QScrollArea, QDoubleSpinBox)
-from PyQt5.QtCore import Qt, QStringListModel
+                            QDialog, QListWidget, QDialogButtonBox, QScrollArea, QDoubleSpinBox,
+                            QProgressDialog)
+from PyQt5.QtCore import (Qt, QStringListModel, QObject, QRunnable, QThreadPool, pyqtSignal,
+                          QAbstractTableModel, QModelIndex, QTimer)
 from PyQt5.QtGui import QFont, QColor
+from PyQt5.QtSql import QSqlDatabase, QSqlTableModel
 from modules.billing import billing_manager
 from modules.inventory import inventory_manager
 from modules.gst_calculator import gst_calculator
 from modules.auth import auth_manager
 from utils.gst_states import get_state_from_gstin
+from utils.validators import validate_gstin, validate_phone
 from utils.company_settings import company_settings
 from database.db_manager import db
 from utils.signals import app_signals
 from utils.logger import logger
 
 
+# Bound formatters for the money/percent strings rebuilt on every cart change
+_RUPEE = "₹{:.2f}".format
+_PCT = "{:.0f}%".format
+
+# Shared strings for S.No cells and whole-number discounts, the common cases
+_ROW_LABELS = tuple(str(n) for n in range(1, 101))
+_PCT_LABELS = {d: f"{d}%" for d in range(101)}
+
+
+def _row_label(row: int) -> str:
+    """S.No text for a zero-based cart row"""
+    return _ROW_LABELS[row] if row < len(_ROW_LABELS) else str(row + 1)
+
+
+def _pct_label(value: float) -> str:
+    """Discount text; whole numbers (10.0 hashes like 10) hit the shared table"""
+    label = _PCT_LABELS.get(value)
+    return label if label is not None else _PCT(value)
+
+# Styling for the page's message boxes, built once
+MESSAGE_BOX_STYLE = """
+    QMessageBox {
+        background-color: #EBF4DD;
+    }
+    QLabel {
+        color: #3B4953;
+        font-size: 11pt;
+    }
+    QPushButton {
+        background-color: #5A7863;
+        color: #EBF4DD;
+        padding: 8px 20px;
+        border-radius: 5px;
+        font-weight: bold;
+        min-width: 80px;
+    }
+    QPushButton:hover {
+        background-color: #90AB8B;
+    }
+"""
+
+# Styling for the product selection dialog
+SELECTION_DIALOG_STYLE = """
+    QDialog {
+        background-color: #EBF4DD;
+    }
+    QLabel {
+        color: #3B4953;
+    }
+    QListWidget {
+        background-color: white;
+        border: 2px solid #90AB8B;
+        border-radius: 5px;
+        color: #3B4953;
+    }
+    QListWidget::item:selected {
+        background-color: #90AB8B;
+        color: #EBF4DD;
+    }
+    QPushButton {
+        background-color: #5A7863;
+        color: #EBF4DD;
+        padding: 8px 20px;
+        border-radius: 5px;
+        font-weight: bold;
+        min-width: 80px;
+    }
+    QPushButton:hover {
+        background-color: #90AB8B;
+    }
+"""
+
+# Fonts shared by every BillingPage instead of being rebuilt per widget
+FONT_TITLE = QFont("Arial", 14, QFont.Bold)
+FONT_HEADING = QFont("Arial", 12, QFont.Bold)
+FONT_VALUE = QFont("Arial", 11, QFont.Bold)
+FONT_LABEL = QFont("Arial", 11)
+FONT_CAPTION = QFont("Arial", 12)
+FONT_GRAND = QFont("Arial", 16)
+
+# Shared look for every text/number input on the page; widgets opt in with
+# setProperty("billingInput", True) instead of carrying their own QSS
+INPUT_QSS = """
+#billingPage QLineEdit[billingInput="true"],
+#billingPage QTextEdit[billingInput="true"],
+#billingPage QAbstractSpinBox[billingInput="true"] {
+    background-color: #EBF4DD;
+    border: 2px solid #90AB8B;
+    border-radius: 5px;
+    padding: 5px;
+    color: #3B4953;
+}
+#billingPage QLineEdit[billingInput="true"]:focus,
+#billingPage QTextEdit[billingInput="true"]:focus,
+#billingPage QAbstractSpinBox[billingInput="true"]:focus {
+    border: 2px solid #5A7863;
+}
+#billingPage QAbstractSpinBox[billingInput="true"] {
+    font-weight: bold;
+}
+"""
+
+# Page-wide stylesheet, applied once on the BillingPage root. Ancestor-wide
+# rules come first so the per-widget rules below override them.
+STYLESHEET = INPUT_QSS + """
+QScrollArea#pageScroll, #pageScroll QWidget {
+    background-color: #EBF4DD;
+}
+QFrame#leftPanel, #leftPanel QFrame,
+QFrame#rightPanel, #rightPanel QFrame {
+    background-color: #EBF4DD;
+    border-radius: 10px;
+    padding: 15px;
+    border: 2px solid #90AB8B;
+}
+#rightPanel QWidget {
+    background-color: transparent;
+    border: none;
+}
+QFrame#gstFrame, #gstFrame QWidget {
+    background-color: transparent;
+    border: none;
+}
+QFrame#grandTotalFrame, #grandTotalFrame QFrame {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+        stop:0 #5A7863, stop:1 #3B4953);
+    padding: 10px;
+    border-radius: 8px;
+}
+
+QLabel#panelTitle, QLabel#cartTitle {
+    color: #5A7863;
+    border: none;
+}
+QLabel#productSearchLabel {
+    color: #5A7863;
+    font-weight: bold;
+}
+QLabel#productFieldLabel, QLabel#salesPersonLabel {
+    color: #3B4953;
+    font-weight: bold;
+}
+QLabel#selectedProductLabel {
+    color: #90AB8B;
+    font-style: italic;
+}
+QLabel#mrpLabel, QLabel#stockLabel {
+    color: #3B4953;
+}
+QLabel#rateLabel {
+    color: #5A7863;
+}
+QLabel#customerFieldLabel {
+    color: #EBF4DD;
+    font-weight: bold;
+}
+QLabel#gstinLabel {
+    color: #3B4953;
+    font-weight: bold;
+}
+QLabel#gstinStateLabel {
+    color: #EBF4DD;
+    font-style: italic;
+}
+QLabel#summaryLabel {
+    color: #3B4953;
+}
+QLabel#discountTotalLabel {
+    color: #90AB8B;
+    font-weight: bold;
+}
+QLabel#taxLabel {
+    color: #5A7863;
+}
+QLabel#grandTotalCaption, QLabel#grandTotalLabel {
+    color: #EBF4DD;
+    font-weight: bold;
+}
+QFrame#customerSeparator {
+    background-color: #90AB8B;
+}
+
+#billingPage QLineEdit#productSearch {
+    padding: 5px 10px;
+    font-size: 11pt;
+}
+QComboBox#salesPersonCombo {
+    padding: 5px;
+    font-weight: bold;
+    background-color: #EBF4DD;
+    border: 2px solid #90AB8B;
+    border-radius: 5px;
+    color: #3B4953;
+}
+QComboBox#salesPersonCombo:focus {
+    border: 2px solid #5A7863;
+}
+QComboBox#salesPersonCombo::drop-down {
+    border: none;
+}
+#salesPersonCombo QAbstractItemView {
+    background-color: #EBF4DD;
+    selection-background-color: #90AB8B;
+    selection-color: #EBF4DD;
+}
+QCheckBox#gstBillCheckbox {
+    font-weight: bold;
+    color: #5A7863;
+}
+QCheckBox#gstBillCheckbox::indicator {
+    width: 20px;
+    height: 20px;
+    border: 2px solid #90AB8B;
+    border-radius: 4px;
+}
+QCheckBox#gstBillCheckbox::indicator:checked {
+    background-color: #5A7863;
+    border: 2px solid #5A7863;
+}
+
+QPushButton#searchButton {
+    background-color: #5A7863;
+    color: #EBF4DD;
+    padding: 8px 15px;
+    border-radius: 5px;
+    font-weight: bold;
+}
+QPushButton#searchButton:hover {
+    background-color: #90AB8B;
+}
+QPushButton#addToCartButton {
+    background-color: #3B4953;
+    color: #EBF4DD;
+    font-weight: bold;
+    padding: 8px;
+    border-radius: 5px;
+}
+QPushButton#addToCartButton:hover {
+    background-color: #90AB8B;
+}
+QPushButton#removeButton {
+    background-color: #3B4953;
+    color: #EBF4DD;
+    padding: 8px;
+    border-radius: 5px;
+    font-weight: bold;
+}
+QPushButton#clearButton {
+    background-color: #90AB8B;
+    color: #EBF4DD;
+    padding: 8px;
+    border-radius: 5px;
+    font-weight: bold;
+}
+QPushButton#removeButton:hover, QPushButton#clearButton:hover {
+    background-color: #5A7863;
+}
+QPushButton#generateButton {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+        stop:0 #5A7863, stop:1 #90AB8B);
+    color: #EBF4DD;
+    font-size: 16px;
+    font-weight: bold;
+    padding: 15px;
+    border-radius: 8px;
+}
+QPushButton#generateButton:hover {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+        stop:0 #90AB8B, stop:1 #5A7863);
+}
+QPushButton#generateButton:pressed {
+    background: #3B4953;
+}
+
+QGroupBox#productGroup {
+    background-color: #5A7863;
+    border: 2px solid #90AB8B;
+    border-radius: 8px;
+    margin-top: 15px;
+    padding-top: 15px;
+    font-weight: bold;
+    color: #5A7863;
+}
+QGroupBox#customerGroup {
+    background-color: #5A7863;
+    border: 2px solid #90AB8B;
+    border-radius: 8px;
+    margin-top: 20px;
+    padding-top: 15px;
+    padding-bottom: 15px;
+    font-weight: bold;
+    color: #3B4953;
+}
+QGroupBox#summaryGroup {
+    background-color: #EBF4DD;
+    border: 2px solid #90AB8B;
+    border-radius: 8px;
+    margin-top: 10px;
+    padding-top: 15px;
+    font-weight: bold;
+    color: #5A7863;
+}
+QGroupBox#productGroup::title, QGroupBox#summaryGroup::title {
+    subcontrol-origin: margin;
+    left: 10px;
+    padding: 0 5px;
+}
+QGroupBox#customerGroup::title {
+    subcontrol-origin: margin;
+    left: 10px;
+    padding: 0 5px;
+    padding-bottom: 15px;
+}
+
+QTableView#cartTable {
+    background-color: #90AB8B;
+    alternate-background-color: #EBF4DD;
+    border: 2px solid #90AB8B;
+    border-radius: 5px;
+    gridline-color: #90AB8B;
+    color: #3B4953;
+}
+QTableView#cartTable::item:selected {
+    background-color: #90AB8B;
+    color: #EBF4DD;
+}
+#cartTable QHeaderView::section {
+    background-color: #5A7863;
+    color: #EBF4DD;
+    padding: 8px;
+    border: none;
+    font-weight: bold;
+}
+"""
+
+
+class CustomerSearchSignals(QObject):
+    """Signals emitted by CustomerSearchTask"""
+    finished = pyqtSignal(str, list)
+
+
+class CustomerSearchTask(QRunnable):
+    """Run a customer search off the GUI thread"""
+    
+    def __init__(self, search_text: str):
+        super().__init__()
+        self.search_text = search_text
+        self.signals = CustomerSearchSignals()
+    
+    def run(self):
+        customers = db.search_customers(self.search_text)
+        self.signals.finished.emit(self.search_text, customers)
+
+
+class PdfJobSignals(QObject):
+    """Signals emitted by PdfJob"""
+    finished = pyqtSignal(dict, bool, str)
+
+
+class PdfJob(QRunnable):
+    """Render an invoice PDF off the GUI thread"""
+    
+    def __init__(self, bill_data: dict):
+        super().__init__()
+        self.bill_data = bill_data
+        self.signals = PdfJobSignals()
+    
+    def run(self):
+        from utils.pdf_generator import pdf_generator
+        pdf_success, pdf_path = pdf_generator.generate_invoice(self.bill_data)
+        self.signals.finished.emit(self.bill_data, pdf_success, pdf_path or "")
+
+
+class PdfProgressDialog(QProgressDialog):
+    """Busy dialog shown while a bill's PDF renders
+    
+    It cannot be dismissed (Esc or the title bar close button), so the
+    page stays blocked until on_pdf_finished resets the cart and form.
+    """
+    
+    def reject(self):
+        pass
+    
+    def closeEvent(self, event):
+        event.ignore()
+
+
+class PdfWarmupJob(QRunnable):
+    """Import ReportLab and build invoice styles before the first bill"""
+    
+    def run(self):
+        from utils.pdf_generator import pdf_generator
+        pdf_generator.prepare()
+
+
+class CartModel(QAbstractTableModel):
+    """Table model for the billing cart
+    
+    Rows are kept as tuples of pre-formatted strings so that painting a
+    cell is a single tuple lookup.
+    """
+    
+    HEADERS = ("S.No", "Product", "MRP", "Disc%", "Rate", "Qty", "Amount")
+    QTY_COLUMN = 5
+    AMOUNT_COLUMN = 6
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+    
+    @staticmethod
+    def format_row(row: int, item) -> tuple:
+        """Build the display strings for a cart item"""
+        return (
+            _row_label(row),
+            item.product_name,
+            _RUPEE(item.mrp),
+            _pct_label(item.discount_percent),
+            _RUPEE(item.rate),
+            str(item.quantity),
+            _RUPEE(item.amount),
+        )
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+    
+    def set_items(self, items):
+        """Replace all rows, notifying the view only about rows that changed"""
+        rows = [self.format_row(row, item) for row, item in enumerate(items)]
+        common = min(len(rows), len(self._rows))
+        
+        if len(self._rows) > common:
+            self.beginRemoveRows(QModelIndex(), common, len(self._rows) - 1)
+            del self._rows[common:]
+            self.endRemoveRows()
+        
+        changed = [row for row in range(common) if rows[row] != self._rows[row]]
+        if changed:
+            self._rows[:common] = rows[:common]
+            self.dataChanged.emit(self.index(changed[0], 0),
+                                  self.index(changed[-1], len(self.HEADERS) - 1))
+        
+        if len(rows) > common:
+            self.beginInsertRows(QModelIndex(), common, len(rows) - 1)
+            self._rows.extend(rows[common:])
+            self.endInsertRows()
+    
+    def append_item(self, item):
+        """Append a single row"""
+        row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.append(self.format_row(row, item))
+        self.endInsertRows()
+    
+    def update_item(self, row: int, item):
+        """Refresh a single existing row"""
+        self._rows[row] = self.format_row(row, item)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+    
+    def update_quantity(self, row: int, item):
+        """Refresh only the Qty and Amount cells of a row after a merge"""
+        cells = self._rows[row]
+        self._rows[row] = cells[:self.QTY_COLUMN] + (str(item.quantity), _RUPEE(item.amount))
+        self.dataChanged.emit(self.index(row, self.QTY_COLUMN), self.index(row, self.AMOUNT_COLUMN),
+                              [Qt.DisplayRole])
+    
+    def remove_row(self, row: int):
+        """Remove a single row and renumber the rows after it"""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        self.endRemoveRows()
+        
+        if row < len(self._rows):
+            for r in range(row, len(self._rows)):
+                self._rows[r] = (_row_label(r),) + self._rows[r][1:]
+            self.dataChanged.emit(self.index(row, 0), self.index(len(self._rows) - 1, 0))
+
+
+# Qt-side connection used only by the product completer model
+COMPLETER_CONNECTION = "billing_completer"
+
+
+def completer_database() -> QSqlDatabase:
+    """Return the Qt connection to the app database, opening it once"""
+    if QSqlDatabase.contains(COMPLETER_CONNECTION):
+        return QSqlDatabase.database(COMPLETER_CONNECTION)
+    conn = QSqlDatabase.addDatabase("QSQLITE", COMPLETER_CONNECTION)
+    conn.setDatabaseName(db.db_path)
+    if not conn.open():
+        logger.error(f"Error opening completer database: {conn.lastError().text()}")
+    return conn
+
+
 class BillingPage(QWidget):
     """Billing page for creating invoices"""
     
     def __init__(self):
         super().__init__()
+        self.product_model = None
+        self.products_dict = {}
+        self._products_complete = False
+        self.pdf_progress = None
+        self._product_dialog = None
+        
+        # Debounce customer search so a burst of keystrokes runs one query
+        self._cust_timer = QTimer(self)
+        self._cust_timer.setSingleShot(True)
+        self._cust_timer.setInterval(250)
+        self._cust_timer.timeout.connect(self._do_customer_search)
+        
+        # Coalesce auto-repeat steps on the discount spinbox into one rate update
+        self._discount_timer = QTimer(self)
+        self._discount_timer.setSingleShot(True)
+        self._discount_timer.setInterval(80)
+        self._discount_timer.timeout.connect(self.update_rate_from_discount)
+        
         self.init_ui()
-        self.load_products()
-        self.load_sales_persons()
         
-        # Connect signal for real-time updates
-        app_signals.inventory_updated.connect(self.load_products)
+        # Products and sales persons come back from one DB round-trip
+        products, sales_persons = db.get_billing_page_bootstrap()
+        self.load_products(products)
+        self.load_sales_persons(sales_persons)
+        
+        # Reload on inventory or sales person changes; deferred while hidden
+        self._products_dirty = False
+        self._sales_persons_dirty = False
+        self._skip_inventory_reload = False
+        app_signals.inventory_updated.connect(self.on_inventory_updated, Qt.UniqueConnection)
+        app_signals.sales_persons_updated.connect(self.on_sales_persons_updated, Qt.UniqueConnection)
+        
+        # Warm up the PDF generator once the page is up
+        QTimer.singleShot(0, lambda: QThreadPool.globalInstance().start(PdfWarmupJob()))
     
     def init_ui(self):
         """Initialize the user interface"""
+        # One stylesheet for the whole page, set before any child is polished
+        self.setObjectName("billingPage")
+        self.setStyleSheet(STYLESHEET)
+        
         # CREATE SCROLL AREA
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         scroll.setFrameShape(QFrame.NoFrame)
-        scroll.setStyleSheet("background-color: #EBF4DD;")
+        scroll.setObjectName("pageScroll")
         
         # Content widget
         content = QWidget()
-        content.setStyleSheet("background-color: #EBF4DD;")
         main_layout = QHBoxLayout(content)
         main_layout.setSpacing(10)
         main_layout.setContentsMargins(5, 5, 5, 5)
@@ -67,14 +608,7 @@ class BillingPage(QWidget):
     def create_left_panel(self) -> QFrame:
         """Create left panel with product search and cart"""
         panel = QFrame()
-        panel.setStyleSheet("""
-            QFrame {
-                background-color: #EBF4DD;
-                border-radius: 10px;
-                padding: 15px;
-                border: 2px solid #90AB8B;
-            }
-        """)
+        panel.setObjectName("leftPanel")
         panel.setMinimumWidth(500)
         
         layout = QVBoxLayout(panel)
@@ -82,8 +616,8 @@ class BillingPage(QWidget):
         
         # Title
         title = QLabel("Add Products to Bill")
-        title.setFont(QFont("Arial", 14, QFont.Bold))
-        title.setStyleSheet("color: #5A7863; border: none;")
+        title.setFont(FONT_TITLE)
+        title.setObjectName("panelTitle")
         layout.addWidget(title)
         
         # Product search section
@@ -91,39 +625,17 @@ class BillingPage(QWidget):
         
         search_label = QLabel("Search:")
         search_label.setMinimumWidth(60)
-        search_label.setStyleSheet("color: #5A7863; font-weight: bold;")
+        search_label.setObjectName("productSearchLabel")
         
         self.product_search = QLineEdit()
         self.product_search.setPlaceholderText("Type product name or scan barcode...")
         self.product_search.returnPressed.connect(self.on_search_product)
         self.product_search.setMinimumHeight(35)
-        self.product_search.setStyleSheet("""
-            QLineEdit {
-                background-color: #EBF4DD;
-                border: 2px solid #90AB8B;
-                border-radius: 5px;
-                padding: 5px 10px;
-                color: #3B4953;
-                font-size: 11pt;
-            }
-            QLineEdit:focus {
-                border: 2px solid #5A7863;
-            }
-        """)
+        self.product_search.setObjectName("productSearch")
+        self.product_search.setProperty("billingInput", True)
         
         search_btn = QPushButton("🔍")
-        search_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #5A7863;
-                color: #EBF4DD;
-                padding: 8px 15px;
-                border-radius: 5px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #90AB8B;
-            }
-        """)
+        search_btn.setObjectName("searchButton")
         search_btn.setMinimumHeight(35)
         search_btn.clicked.connect(self.on_search_product)
         
@@ -135,43 +647,28 @@ class BillingPage(QWidget):
         
         # Product details section
         product_group = QGroupBox("Selected Product Details")
-        product_group.setStyleSheet("""
-            QGroupBox {
-                background-color: #5A7863;
-                border: 2px solid #90AB8B;
-                border-radius: 8px;
-                margin-top: 15px;
-                padding-top: 15px;
-                font-weight: bold;
-                color: #5A7863;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """)
+        product_group.setObjectName("productGroup")
         
         product_layout = QGridLayout()
         product_layout.setSpacing(8)
         
         self.selected_product_label = QLabel("No product selected")
-        self.selected_product_label.setStyleSheet("color: #90AB8B; font-style: italic;")
+        self.selected_product_label.setObjectName("selectedProductLabel")
         self.selected_product_label.setWordWrap(True)
         
-        label_style = "color: #3B4953; font-weight: bold;"
+        label_name = "productFieldLabel"
         
-        product_layout.addWidget(self.create_label("Product:", label_style), 0, 0)
+        product_layout.addWidget(self.create_label("Product:", label_name), 0, 0)
         product_layout.addWidget(self.selected_product_label, 0, 1, 1, 3)
         
-        product_layout.addWidget(self.create_label("MRP:", label_style), 1, 0)
+        product_layout.addWidget(self.create_label("MRP:", label_name), 1, 0)
         self.mrp_label = QLabel("₹0.00")
-        self.mrp_label.setFont(QFont("Arial", 11, QFont.Bold))
-        self.mrp_label.setStyleSheet("color: #3B4953;")
+        self.mrp_label.setFont(FONT_VALUE)
+        self.mrp_label.setObjectName("mrpLabel")
         product_layout.addWidget(self.mrp_label, 1, 1)
         
         # Discount input (QDoubleSpinBox)
-        product_layout.addWidget(self.create_label("Discount %:", label_style), 1, 2)
+        product_layout.addWidget(self.create_label("Discount %:", label_name), 1, 2)
         self.discount_input = QDoubleSpinBox()
         self.discount_input.setMinimum(0)
         self.discount_input.setMaximum(100)
@@ -180,68 +677,33 @@ class BillingPage(QWidget):
         self.discount_input.setDecimals(1)
         self.discount_input.setSuffix("%")
         self.discount_input.setMinimumHeight(30)
-        self.discount_input.setStyleSheet("""
-            QDoubleSpinBox {
-                background-color: #EBF4DD;
-                border: 2px solid #90AB8B;
-                border-radius: 5px;
-                padding: 5px;
-                color: #3B4953;
-                font-weight: bold;
-            }
-            QDoubleSpinBox:focus {
-                border: 2px solid #5A7863;
-            }
-        """)
-        self.discount_input.valueChanged.connect(self.update_rate_from_discount)
+        self.discount_input.setProperty("billingInput", True)
+        self.discount_input.valueChanged.connect(lambda _: self._discount_timer.start())
         product_layout.addWidget(self.discount_input, 1, 3)
         
-        product_layout.addWidget(self.create_label("Rate:", label_style), 2, 0)
+        product_layout.addWidget(self.create_label("Rate:", label_name), 2, 0)
         self.rate_label = QLabel("₹0.00")
-        self.rate_label.setFont(QFont("Arial", 12, QFont.Bold))
-        self.rate_label.setStyleSheet("color: #5A7863;")
+        self.rate_label.setFont(FONT_HEADING)
+        self.rate_label.setObjectName("rateLabel")
         product_layout.addWidget(self.rate_label, 2, 1)
         
-        product_layout.addWidget(self.create_label("Stock:", label_style), 2, 2)
+        product_layout.addWidget(self.create_label("Stock:", label_name), 2, 2)
         self.stock_label = QLabel("0")
-        self.stock_label.setFont(QFont("Arial", 11, QFont.Bold))
-        self.stock_label.setStyleSheet("color: #3B4953;")
+        self.stock_label.setFont(FONT_VALUE)
+        self.stock_label.setObjectName("stockLabel")
         product_layout.addWidget(self.stock_label, 2, 3)
         
-        product_layout.addWidget(self.create_label("Quantity:", label_style), 3, 0)
+        product_layout.addWidget(self.create_label("Quantity:", label_name), 3, 0)
         self.quantity_spin = QSpinBox()
         self.quantity_spin.setMinimum(1)
         self.quantity_spin.setMaximum(10000)
         self.quantity_spin.setValue(1)
         self.quantity_spin.setMinimumHeight(30)
-        self.quantity_spin.setStyleSheet("""
-            QSpinBox {
-                background-color: #EBF4DD;
-                border: 2px solid #90AB8B;
-                border-radius: 5px;
-                padding: 5px;
-                color: #3B4953;
-                font-weight: bold;
-            }
-            QSpinBox:focus {
-                border: 2px solid #5A7863;
-            }
-        """)
+        self.quantity_spin.setProperty("billingInput", True)
         product_layout.addWidget(self.quantity_spin, 3, 1)
         
         add_btn = QPushButton("➕ Add to Cart")
-        add_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3B4953;
-                color: #EBF4DD;
-                font-weight: bold;
-                padding: 8px;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #90AB8B;
-            }
-        """)
+        add_btn.setObjectName("addToCartButton")
         add_btn.setMinimumHeight(30)
         add_btn.clicked.connect(self.add_to_cart)
         product_layout.addWidget(add_btn, 3, 2, 1, 2)
@@ -251,41 +713,22 @@ class BillingPage(QWidget):
         
         # Cart table
         cart_label = QLabel("Shopping Cart")
-        cart_label.setFont(QFont("Arial", 12, QFont.Bold))
-        cart_label.setStyleSheet("color: #5A7863; border: none;")
+        cart_label.setFont(FONT_HEADING)
+        cart_label.setObjectName("cartTitle")
         layout.addWidget(cart_label)
         
-        self.cart_table = QTableWidget()
-        self.cart_table.setColumnCount(7)
-        self.cart_table.setHorizontalHeaderLabels([
-            "S.No", "Product", "MRP", "Disc%", "Rate", "Qty", "Amount"
-        ])
+        self.cart_model = CartModel(self)
+        self.cart_table = QTableView()
+        self.cart_table.setModel(self.cart_model)
         self.cart_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
-        self.cart_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.cart_table.setSelectionBehavior(QTableWidget.SelectRows)
+        # All rows share one height, so Qt never has to measure them
+        self.cart_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.cart_table.verticalHeader().setDefaultSectionSize(30)
+        self.cart_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.cart_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.cart_table.setAlternatingRowColors(True)
         self.cart_table.setMinimumHeight(200)
-        self.cart_table.setStyleSheet("""
-            QTableWidget {
-                background-color: #90AB8B;
-                alternate-background-color: #EBF4DD;
-                border: 2px solid #90AB8B;
-                border-radius: 5px;
-                gridline-color: #90AB8B;
-                color: #3B4953;
-            }
-            QTableWidget::item:selected {
-                background-color: #90AB8B;
-                color: #EBF4DD;
-            }
-            QHeaderView::section {
-                background-color: #5A7863;
-                color: #EBF4DD;
-                padding: 8px;
-                border: none;
-                font-weight: bold;
-            }
-        """)
+        self.cart_table.setObjectName("cartTable")
         
         layout.addWidget(self.cart_table)
         
@@ -293,33 +736,11 @@ class BillingPage(QWidget):
         cart_actions = QHBoxLayout()
         
         remove_btn = QPushButton("🗑️ Remove Selected")
-        remove_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3B4953;
-                color: #EBF4DD;
-                padding: 8px;
-                border-radius: 5px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #5A7863;
-            }
-        """)
+        remove_btn.setObjectName("removeButton")
         remove_btn.clicked.connect(self.remove_from_cart)
         
         clear_btn = QPushButton("🧹 Clear Cart")
-        clear_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #90AB8B;
-                color: #EBF4DD;
-                padding: 8px;
-                border-radius: 5px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #5A7863;
-            }
-        """)
+        clear_btn.setObjectName("clearButton")
         clear_btn.clicked.connect(self.clear_cart)
         
         cart_actions.addWidget(remove_btn)
@@ -330,73 +751,38 @@ class BillingPage(QWidget):
         
         return panel
     
-    def create_label(self, text: str, style: str = "") -> QLabel:
-        """Helper to create styled labels"""
+    def create_label(self, text: str, name: str = "") -> QLabel:
+        """Helper to create labels styled by object name"""
         label = QLabel(text)
-        if style:
-            label.setStyleSheet(style)
+        if name:
+            label.setObjectName(name)
         return label
     
     def create_right_panel(self) -> QFrame:
         """Create right panel with customer info and totals"""
         panel = QFrame()
-        panel.setStyleSheet("""
-            QFrame {
-                background-color: #EBF4DD;
-                border-radius: 10px;
-                padding: 15px;
-                border: 2px solid #90AB8B;
-            }
-        """)
+        panel.setObjectName("rightPanel")
         panel.setMinimumWidth(350)
         panel.setMaximumWidth(500)
         
-        # ADD SCROLL AREA FOR RIGHT PANEL
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setFrameShape(QFrame.NoFrame)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        scroll.setStyleSheet("background-color: transparent; border: none;")
-        
-        content = QWidget()
-        content.setStyleSheet("background-color: transparent;")
-        layout = QVBoxLayout(content)
+        # The page-level scroll area already scrolls this panel
+        layout = QVBoxLayout(panel)
         layout.setSpacing(10)
         
         # Title
         title = QLabel("Customer & Billing")
-        title.setFont(QFont("Arial", 14, QFont.Bold))
-        title.setStyleSheet("color: #5A7863; border: none;")
+        title.setFont(FONT_TITLE)
+        title.setObjectName("panelTitle")
         layout.addWidget(title)
         
         # Sales Person Selection
         sp_layout = QHBoxLayout()
         sp_label = QLabel("Sales Person: *")
-        sp_label.setStyleSheet("color: #3B4953; font-weight: bold;")
+        sp_label.setObjectName("salesPersonLabel")
         sp_layout.addWidget(sp_label)
         
         self.sales_person_combo = QComboBox()
-        self.sales_person_combo.setStyleSheet("""
-            QComboBox {
-                padding: 5px;
-                font-weight: bold;
-                background-color: #EBF4DD;
-                border: 2px solid #90AB8B;
-                border-radius: 5px;
-                color: #3B4953;
-            }
-            QComboBox:focus {
-                border: 2px solid #5A7863;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #EBF4DD;
-                selection-background-color: #90AB8B;
-                selection-color: #EBF4DD;
-            }
-        """)
+        self.sales_person_combo.setObjectName("salesPersonCombo")
         self.sales_person_combo.setMinimumHeight(30)
         sp_layout.addWidget(self.sales_person_combo, 1)
         layout.addLayout(sp_layout)
@@ -404,22 +790,7 @@ class BillingPage(QWidget):
         # GST Bill Toggle
         gst_layout = QHBoxLayout()
         self.gst_bill_checkbox = QCheckBox("GST Bill (5% Tax)")
-        self.gst_bill_checkbox.setStyleSheet("""
-            QCheckBox {
-                font-weight: bold;
-                color: #5A7863;
-            }
-            QCheckBox::indicator {
-                width: 20px;
-                height: 20px;
-                border: 2px solid #90AB8B;
-                border-radius: 4px;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #5A7863;
-                border: 2px solid #5A7863;
-            }
-        """)
+        self.gst_bill_checkbox.setObjectName("gstBillCheckbox")
         self.gst_bill_checkbox.stateChanged.connect(self.on_gst_toggle)
         gst_layout.addWidget(self.gst_bill_checkbox)
         gst_layout.addStretch()
@@ -427,24 +798,7 @@ class BillingPage(QWidget):
         
         # Customer info
         customer_group = QGroupBox("Customer Information")
-        customer_group.setStyleSheet("""
-            QGroupBox {
-                background-color: #5A7863;
-                border: 2px solid #90AB8B;
-                border-radius: 8px;
-                margin-top: 20px;
-                padding-top: 15px;
-                padding-bottom: 15px;
-                font-weight: bold;
-                color: #3B4953;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-                padding-bottom: 15px;
-            }
-        """)
+        customer_group.setObjectName("customerGroup")
         customer_layout = QVBoxLayout()
         customer_layout.setSpacing(8)
         
@@ -452,24 +806,22 @@ class BillingPage(QWidget):
         search_customer_layout = QHBoxLayout()
         search_customer_label = QLabel("Search:")
         search_customer_label.setMinimumWidth(60)
-        search_customer_label.setStyleSheet("color: #EBF4DD; font-weight: bold;")
+        search_customer_label.setObjectName("customerFieldLabel")
         
         self.customer_search = QLineEdit()
         self.customer_search.setPlaceholderText("Name or phone...")
-        self.customer_search.textChanged.connect(self.on_customer_search)
+        self.customer_search.textChanged.connect(lambda _: self._cust_timer.start())
         self.customer_search.setMinimumHeight(30)
-        self.customer_search.setStyleSheet("""
-            QLineEdit {
-                background-color: #EBF4DD;
-                border: 2px solid #90AB8B;
-                border-radius: 5px;
-                padding: 5px;
-                color: #3B4953;
-            }
-            QLineEdit:focus {
-                border: 2px solid #5A7863;
-            }
-        """)
+        self.customer_search.setProperty("billingInput", True)
+        
+        # Matches from the debounced search feed one persistent completer
+        self._cust_results = []
+        self._cust_model = QStringListModel(self)
+        self._cust_completer = QCompleter(self._cust_model, self)
+        self._cust_completer.setCaseSensitivity(Qt.CaseInsensitive)
+        self._cust_completer.setFilterMode(Qt.MatchContains)
+        self._cust_completer.activated[QModelIndex].connect(self.on_customer_activated)
+        self.customer_search.setCompleter(self._cust_completer)
         
         search_customer_layout.addWidget(search_customer_label)
         search_customer_layout.addWidget(self.customer_search)
@@ -478,189 +830,85 @@ class BillingPage(QWidget):
         # Separator
         separator = QFrame()
         separator.setFrameShape(QFrame.HLine)
-        separator.setStyleSheet("background-color: #90AB8B;")
+        separator.setObjectName("customerSeparator")
         customer_layout.addWidget(separator)
         
-        customer_layout.addWidget(self.create_label("Customer Name: *", "color: #EBF4DD; font-weight: bold;"))
+        customer_layout.addWidget(self.create_label("Customer Name: *", "customerFieldLabel"))
         self.customer_name = QLineEdit()
         self.customer_name.setPlaceholderText("Enter customer name")
         self.customer_name.setMinimumHeight(30)
-        self.customer_name.setStyleSheet("""
-            QLineEdit {
-                background-color: #EBF4DD;
-                border: 2px solid #90AB8B;
-                border-radius: 5px;
-                padding: 5px;
-                color: #3B4953;
-            }
-            QLineEdit:focus {
-                border: 2px solid #5A7863;
-            }
-        """)
+        self.customer_name.setProperty("billingInput", True)
         customer_layout.addWidget(self.customer_name)
         
-        customer_layout.addWidget(self.create_label("Phone:", "color: #EBF4DD; font-weight: bold;"))
+        customer_layout.addWidget(self.create_label("Phone:", "customerFieldLabel"))
         self.customer_phone = QLineEdit()
         self.customer_phone.setPlaceholderText("Enter phone number")
         self.customer_phone.setMinimumHeight(30)
-        self.customer_phone.setStyleSheet("""
-            QLineEdit {
-                background-color: #EBF4DD;
-                border: 2px solid #90AB8B;
-                border-radius: 5px;
-                padding: 5px;
-                color: #3B4953;
-            }
-            QLineEdit:focus {
-                border: 2px solid #5A7863;
-            }
-        """)
+        self.customer_phone.setProperty("billingInput", True)
         customer_layout.addWidget(self.customer_phone)
         
-        customer_layout.addWidget(self.create_label("Address:", "color: #EBF4DD; font-weight: bold;"))
+        customer_layout.addWidget(self.create_label("Address:", "customerFieldLabel"))
         self.customer_address = QTextEdit()
         self.customer_address.setPlaceholderText("Enter address")
         self.customer_address.setMaximumHeight(60)
-        self.customer_address.setStyleSheet("""
-            QTextEdit {
-                background-color: #EBF4DD;
-                border: 2px solid #90AB8B;
-                border-radius: 5px;
-                padding: 5px;
-                color: #3B4953;
-            }
-            QTextEdit:focus {
-                border: 2px solid #5A7863;
-            }
-        """)
+        self.customer_address.setProperty("billingInput", True)
         customer_layout.addWidget(self.customer_address)
         
-        # GSTIN field (shown only for GST bills)
-        self.gstin_label = QLabel("GSTIN: *")
-        self.gstin_label.setStyleSheet("color: #3B4953; font-weight: bold;")
-        self.gstin_label.setVisible(False)
-        customer_layout.addWidget(self.gstin_label)
-        
-        self.customer_gstin = QLineEdit()
-        self.customer_gstin.setPlaceholderText("Enter GSTIN")
-        self.customer_gstin.setMinimumHeight(30)
-        self.customer_gstin.setStyleSheet("""
-            QLineEdit {
-                background-color: #EBF4DD;
-                border: 2px solid #90AB8B;
-                border-radius: 5px;
-                padding: 5px;
-                color: #3B4953;
-            }
-            QLineEdit:focus {
-                border: 2px solid #5A7863;
-            }
-        """)
-        self.customer_gstin.textChanged.connect(self.on_gstin_changed)
-        self.customer_gstin.setVisible(False)
-        customer_layout.addWidget(self.customer_gstin)
-        
-        # State from GSTIN label
-        self.gstin_state_label = QLabel("State from GSTIN: -")
-        self.gstin_state_label.setStyleSheet("color: #EBF4DD; font-style: italic;")
-        self.gstin_state_label.setVisible(False)
-        customer_layout.addWidget(self.gstin_state_label)
+        # GSTIN fields are built on first need (see create_gstin_fields)
+        self._customer_layout = customer_layout
+        self.gstin_label = None
+        self.customer_gstin = None
+        self.gstin_state_label = None
         
         customer_group.setLayout(customer_layout)
         layout.addWidget(customer_group)
         
         # Bill summary
         summary_group = QGroupBox("Bill Summary")
-        summary_group.setStyleSheet("""
-            QGroupBox {
-                background-color: #EBF4DD;
-                border: 2px solid #90AB8B;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 15px;
-                font-weight: bold;
-                color: #5A7863;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """)
+        summary_group.setObjectName("summaryGroup")
+        self.summary_group = summary_group
+        # (item count, totals) last painted; None while the zero state shows
+        self._last_summary = None
         summary_layout = QVBoxLayout()
         summary_layout.setSpacing(5)
         
         self.item_count_label = QLabel("Items: 0")
-        self.item_count_label.setFont(QFont("Arial", 11))
-        self.item_count_label.setStyleSheet("color: #3B4953;")
+        self.item_count_label.setFont(FONT_LABEL)
+        self.item_count_label.setObjectName("summaryLabel")
         summary_layout.addWidget(self.item_count_label)
         
         self.subtotal_label = QLabel("Subtotal: ₹0.00")
-        self.subtotal_label.setFont(QFont("Arial", 11))
-        self.subtotal_label.setStyleSheet("color: #3B4953;")
+        self.subtotal_label.setFont(FONT_LABEL)
+        self.subtotal_label.setObjectName("summaryLabel")
         summary_layout.addWidget(self.subtotal_label)
         
         self.discount_total_label = QLabel("Total Discount: ₹0.00")
-        self.discount_total_label.setFont(QFont("Arial", 11))
-        self.discount_total_label.setStyleSheet("color: #90AB8B; font-weight: bold;")
+        self.discount_total_label.setFont(FONT_LABEL)
+        self.discount_total_label.setObjectName("discountTotalLabel")
         summary_layout.addWidget(self.discount_total_label)
         
-        # GST details (hidden by default)
-        self.gst_frame = QFrame()
-        self.gst_frame.setStyleSheet("background-color: transparent; border: none;")
-        gst_details_layout = QVBoxLayout(self.gst_frame)
-        gst_details_layout.setContentsMargins(0, 0, 0, 0)
-        gst_details_layout.setSpacing(5)
-        
-        self.cgst_label = QLabel("CGST @ 2.5%: ₹0.00")
-        self.cgst_label.setFont(QFont("Arial", 11))
-        self.cgst_label.setStyleSheet("color: #5A7863;")
-        gst_details_layout.addWidget(self.cgst_label)
-        
-        self.sgst_label = QLabel("SGST @ 2.5%: ₹0.00")
-        self.sgst_label.setFont(QFont("Arial", 11))
-        self.sgst_label.setStyleSheet("color: #5A7863;")
-        gst_details_layout.addWidget(self.sgst_label)
-
-        # NEW IGST LABEL
-        self.igst_label = QLabel("IGST @ 5%: ₹0.00")
-        self.igst_label.setFont(QFont("Arial", 11))
-        self.igst_label.setStyleSheet("color: #5A7863;")
-        self.igst_label.setVisible(False)
-        gst_details_layout.addWidget(self.igst_label)
-        
-        self.total_tax_label = QLabel("Total Tax: ₹0.00")
-        self.total_tax_label.setFont(QFont("Arial", 11, QFont.Bold))
-        self.total_tax_label.setStyleSheet("color: #5A7863;")
-        gst_details_layout.addWidget(self.total_tax_label)
-        
-        self.gst_frame.setVisible(False)
-        summary_layout.addWidget(self.gst_frame)
+        # GST details are built on first GST total (see create_gst_frame)
+        self._summary_layout = summary_layout
+        self._gst_frame_index = summary_layout.count()
+        self.gst_frame = None
         
         self.roundoff_label = QLabel("Round Off: ₹0.00")
-        self.roundoff_label.setFont(QFont("Arial", 11))
-        self.roundoff_label.setStyleSheet("color: #3B4953;")
+        self.roundoff_label.setFont(FONT_LABEL)
+        self.roundoff_label.setObjectName("summaryLabel")
         summary_layout.addWidget(self.roundoff_label)
         
         # Grand total
         grand_total_frame = QFrame()
-        grand_total_frame.setStyleSheet("""
-            QFrame {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #5A7863, stop:1 #3B4953);
-                padding: 10px;
-                border-radius: 8px;
-            }
-        """)
+        grand_total_frame.setObjectName("grandTotalFrame")
         grand_total_layout = QHBoxLayout(grand_total_frame)
         
         grand_label = QLabel("GRAND TOTAL:")
-        grand_label.setStyleSheet("color: #EBF4DD; font-weight: bold;")
-        grand_label.setFont(QFont("Arial", 12))
+        grand_label.setObjectName("grandTotalCaption")
+        grand_label.setFont(FONT_CAPTION)
         
         self.grand_total_label = QLabel("₹0.00")
-        self.grand_total_label.setStyleSheet("color: #EBF4DD; font-weight: bold;")
-        self.grand_total_label.setFont(QFont("Arial", 16))
+        self.grand_total_label.setObjectName("grandTotalLabel")
+        self.grand_total_label.setFont(FONT_GRAND)
         
         grand_total_layout.addWidget(grand_label)
         grand_total_layout.addStretch()
@@ -672,57 +920,65 @@ class BillingPage(QWidget):
         layout.addWidget(summary_group)
         
         # Generate bill button
-        generate_btn = QPushButton("💰 Generate Bill")
-        generate_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #5A7863, stop:1 #90AB8B);
-                color: #EBF4DD;
-                font-size: 16px;
-                font-weight: bold;
-                padding: 15px;
-                border-radius: 8px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #90AB8B, stop:1 #5A7863);
-            }
-            QPushButton:pressed {
-                background: #3B4953;
-            }
-        """)
-        generate_btn.setMinimumHeight(50)
-        generate_btn.clicked.connect(self.generate_bill)
-        layout.addWidget(generate_btn)
+        self.generate_btn = QPushButton("💰 Generate Bill")
+        self.generate_btn.setObjectName("generateButton")
+        self.generate_btn.setMinimumHeight(50)
+        self.generate_btn.clicked.connect(self.generate_bill)
+        layout.addWidget(self.generate_btn)
         
         layout.addStretch()
         
-        # Set scroll content
-        scroll.setWidget(content)
-        
-        # Panel layout
-        panel_layout = QVBoxLayout(panel)
-        panel_layout.setContentsMargins(0, 0, 0, 0)
-        panel_layout.addWidget(scroll)
-        
         return panel
     
-    def load_products(self):
-        """Load products for autocomplete"""
-        products = inventory_manager.get_all_products()
-        self.products_dict = {p['name']: p for p in products}
+    def load_products(self, products=None):
+        """Load products for autocomplete, priming the lookup cache if products are given"""
+        # Cached lookups may be stale after an inventory change
+        self.products_dict.clear()
+        for p in products or []:
+            self.products_dict[p['name'].casefold()] = self.prepare_product_display(p)
+        # A fully primed cache can answer misses without a DB round-trip
+        self._products_complete = products is not None
+        
+        if self.product_model is None:
+            # Completer reads product names straight from SQLite
+            self.product_model = QSqlTableModel(self, completer_database())
+            self.product_model.setTable('products')
+            self.product_model.setSort(self.product_model.fieldIndex('name'), Qt.AscendingOrder)
+            
+            completer = QCompleter(self.product_model, self)
+            completer.setCompletionColumn(self.product_model.fieldIndex('name'))
+            completer.setCaseSensitivity(Qt.CaseInsensitive)
+            completer.setFilterMode(Qt.MatchContains)
+            self.product_search.setCompleter(completer)
         
-        # Setup autocomplete
-        product_names = list(self.products_dict.keys())
-        completer = QCompleter(product_names)
-        completer.setCaseSensitivity(Qt.CaseInsensitive)
-        self.product_search.setCompleter(completer)
+        self.product_model.select()
+        while self.product_model.canFetchMore():
+            self.product_model.fetchMore()
         
         self.current_product = None
     
-    def load_sales_persons(self):
+    def lookup_product(self, name: str):
+        """Return the product with this exact name, caching hits"""
+        key = name.casefold()
+        product = self.products_dict.get(key)
+        if product is None and not self._products_complete:
+            product = inventory_manager.get_product_by_name(name)
+            if product:
+                # Keyed case-insensitively so lowercase input still hits the cache
+                self.products_dict[key] = self.prepare_product_display(product)
+        return product
+    
+    @staticmethod
+    def prepare_product_display(product: dict) -> dict:
+        """Pre-format the strings shown in the product details panel"""
+        product['_mrp_s'] = _RUPEE(product['mrp'])
+        product['_stock_s'] = str(product['current_stock'])
+        return product
+    
+    def load_sales_persons(self, sales_persons=None):
         """Load sales persons into dropdown"""
-        sales_persons = db.get_all_sales_persons(active_only=True)
+        if sales_persons is None:
+            sales_persons = db.get_all_sales_persons(active_only=True)
         
         self.sales_person_combo.clear()
         self.sales_persons_dict = {}
@@ -731,17 +987,66 @@ class BillingPage(QWidget):
             self.sales_person_combo.addItem(sp['name'], sp['id'])
             self.sales_persons_dict[sp['id']] = sp
     
+    def create_gstin_fields(self):
+        """Build the GSTIN label, input and state label the first time they are needed"""
+        self.gstin_label = QLabel("GSTIN: *")
+        self.gstin_label.setObjectName("gstinLabel")
+        self.gstin_label.setVisible(False)
+        self._customer_layout.addWidget(self.gstin_label)
+        
+        self.customer_gstin = QLineEdit()
+        self.customer_gstin.setPlaceholderText("Enter GSTIN")
+        self.customer_gstin.setMinimumHeight(30)
+        self.customer_gstin.setProperty("billingInput", True)
+        self.customer_gstin.textChanged.connect(self.on_gstin_changed)
+        self.customer_gstin.setVisible(False)
+        self._customer_layout.addWidget(self.customer_gstin)
+        
+        # State from GSTIN label
+        self.gstin_state_label = QLabel("State from GSTIN: -")
+        self.gstin_state_label.setObjectName("gstinStateLabel")
+        self.gstin_state_label.setVisible(False)
+        self._customer_layout.addWidget(self.gstin_state_label)
+    
+    def create_gst_frame(self):
+        """Build the GST breakdown the first time a GST total is shown"""
+        self.gst_frame = QFrame()
+        self.gst_frame.setObjectName("gstFrame")
+        gst_details_layout = QVBoxLayout(self.gst_frame)
+        gst_details_layout.setContentsMargins(0, 0, 0, 0)
+        gst_details_layout.setSpacing(5)
+        
+        # One label for the whole breakdown so a recalc repaints a single widget
+        self.gst_breakdown_label = QLabel()
+        self.gst_breakdown_label.setFont(FONT_LABEL)
+        self.gst_breakdown_label.setObjectName("taxLabel")
+        self.gst_breakdown_label.setTextFormat(Qt.RichText)
+        gst_details_layout.addWidget(self.gst_breakdown_label)
+        
+        self._summary_layout.insertWidget(self._gst_frame_index, self.gst_frame)
+    
+    def get_customer_gstin(self) -> str:
+        """Return the entered GSTIN in upper case, or an empty string if the field was never shown"""
+        if self.customer_gstin is None:
+            return ""
+        # GSTINs are stored and printed in upper case, as validate_gstin checks them
+        return self.customer_gstin.text().strip().upper()
+    
     def on_gst_toggle(self):
         """Handle GST checkbox toggle"""
         is_gst = self.gst_bill_checkbox.isChecked()
         
-        # Show/hide GSTIN field and state label
-        self.gstin_label.setVisible(is_gst)
-        self.customer_gstin.setVisible(is_gst)
-        self.gstin_state_label.setVisible(is_gst and bool(self.customer_gstin.text().strip()))
+        if is_gst and self.customer_gstin is None:
+            self.create_gstin_fields()
         
-        # Recalculate totals
-        self.refresh_cart()
+        if self.customer_gstin is not None:
+            # Show/hide GSTIN field and state label
+            self.gstin_label.setVisible(is_gst)
+            self.customer_gstin.setVisible(is_gst)
+            self.gstin_state_label.setVisible(is_gst and bool(self.get_customer_gstin()))
+        
+        # Recalculate totals (cart rows are unaffected)
+        self.refresh_totals()
     
     def on_gstin_changed(self, text: str):
         """Update GSTIN state label when GSTIN changes"""
@@ -759,7 +1064,7 @@ class BillingPage(QWidget):
         self.gstin_state_label.setVisible(self.gst_bill_checkbox.isChecked() and bool(gstin))
         
         # Recalculate GST breakdown when GSTIN changes
-        self.refresh_cart()
+        self.refresh_totals()
     
     def on_search_product(self):
         """Handle product search"""
@@ -769,13 +1074,16 @@ class BillingPage(QWidget):
             return
         
         # Check if exact match in autocomplete
-        if search_text in self.products_dict:
-            self.current_product = self.products_dict[search_text]
+        hit = self.lookup_product(search_text)
+        if hit:
+            self.current_product = hit
             self.display_product_details()
             return
         
         # Search in database
         results = inventory_manager.search_products(search_text)
+        for p in results:
+            self.prepare_product_display(p)
         
         if not results:
             self.show_styled_message("Not Found", "Product not found", QMessageBox.Warning)
@@ -790,56 +1098,33 @@ class BillingPage(QWidget):
     
     def show_product_selection_dialog(self, results):
         """Show dialog to select from multiple products"""
-        dialog = QDialog(self)
-        dialog.setWindowTitle("Select Product")
-        dialog.setMinimumWidth(400)
-        dialog.setStyleSheet("""
-            QDialog {
-                background-color: #EBF4DD;
-            }
-            QLabel {
-                color: #3B4953;
-            }
-            QListWidget {
-                background-color: white;
-                border: 2px solid #90AB8B;
-                border-radius: 5px;
-                color: #3B4953;
-            }
-            QListWidget::item:selected {
-                background-color: #90AB8B;
-                color: #EBF4DD;
-            }
-            QPushButton {
-                background-color: #5A7863;
-                color: #EBF4DD;
-                padding: 8px 20px;
-                border-radius: 5px;
-                font-weight: bold;
-                min-width: 80px;
-            }
-            QPushButton:hover {
-                background-color: #90AB8B;
-            }
-        """)
-        
-        layout = QVBoxLayout()
-        list_widget = QListWidget()
-        
-        for product in results:
-            list_widget.addItem(f"{product['name']} - Stock: {product['current_stock']}")
-        
-        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-        buttons.accepted.connect(dialog.accept)
-        buttons.rejected.connect(dialog.reject)
-        
-        layout.addWidget(QLabel("Multiple products found. Please select one:"))
-        layout.addWidget(list_widget)
-        layout.addWidget(buttons)
-        
-        dialog.setLayout(layout)
-        
-        if dialog.exec_() == QDialog.Accepted and list_widget.currentRow() >= 0:
+        # The dialog is built once and refilled on each search
+        if self._product_dialog is None:
+            dialog = QDialog(self)
+            dialog.setWindowTitle("Select Product")
+            dialog.setMinimumWidth(400)
+            dialog.setStyleSheet(SELECTION_DIALOG_STYLE)
+            
+            layout = QVBoxLayout()
+            self._product_list = QListWidget()
+            
+            buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+            buttons.accepted.connect(dialog.accept)
+            buttons.rejected.connect(dialog.reject)
+            
+            layout.addWidget(QLabel("Multiple products found. Please select one:"))
+            layout.addWidget(self._product_list)
+            layout.addWidget(buttons)
+            
+            dialog.setLayout(layout)
+            self._product_dialog = dialog
+        
+        list_widget = self._product_list
+        list_widget.clear()
+        list_widget.addItems([f"{product['name']} - Stock: {product['current_stock']}"
+                              for product in results])
+        
+        if self._product_dialog.exec_() == QDialog.Accepted and list_widget.currentRow() >= 0:
             self.current_product = results[list_widget.currentRow()]
             self.display_product_details()
     
@@ -853,7 +1138,7 @@ class BillingPage(QWidget):
         self.selected_product_label.setText(p['name'])
         self.selected_product_label.setStyleSheet("color: #5A7863; font-weight: bold;")
         
-        self.mrp_label.setText(f"₹{p['mrp']:.2f}")
+        self.mrp_label.setText(p['_mrp_s'])
         
         # Set discount input value (allows manual editing)
         self.discount_input.setValue(p['discount_percent'])
@@ -861,7 +1146,7 @@ class BillingPage(QWidget):
         # Calculate and display rate
         self.update_rate_from_discount()
         
-        self.stock_label.setText(str(p['current_stock']))
+        self.stock_label.setText(p['_stock_s'])
         
         # Set max quantity to available stock
         self.quantity_spin.setMaximum(p['current_stock'] if p['current_stock'] > 0 else 1)
@@ -882,7 +1167,7 @@ class BillingPage(QWidget):
         # Calculate rate after discount
         rate = mrp * (1 - discount_percent / 100)
         
-        self.rate_label.setText(f"₹{rate:.2f}")
+        self.rate_label.setText(_RUPEE(rate))
     
     def add_to_cart(self):
         """Add selected product to cart"""
@@ -901,12 +1186,22 @@ class BillingPage(QWidget):
         discount = product_with_discount['discount_percent']
         product_with_discount['selling_price'] = mrp * (1 - discount / 100)
         
+        cart_size = len(billing_manager.get_cart_items())
         success, message = billing_manager.add_item_to_cart(
             product_with_discount, quantity
         )
         
         if success:
-            self.refresh_cart()
+            items = billing_manager.get_cart_items()
+            if len(items) > cart_size:
+                self.cart_model.append_item(items[-1])
+            else:
+                # Existing line had its quantity increased
+                for row, item in enumerate(items):
+                    if item.product_id == product_with_discount['id']:
+                        self.cart_model.update_quantity(row, item)
+                        break
+            self.refresh_totals(items)
             self.product_search.clear()
             self.product_search.setFocus()
             self.current_product = None
@@ -923,79 +1218,112 @@ class BillingPage(QWidget):
         """Refresh cart display and totals"""
         items = billing_manager.get_cart_items()
         
-        self.cart_table.setRowCount(len(items))
+        # Repaint the table once after the model is repopulated
+        self.cart_table.setUpdatesEnabled(False)
+        try:
+            self.cart_model.set_items(items)
+        finally:
+            self.cart_table.setUpdatesEnabled(True)
         
-        for row, item in enumerate(items):
-            self.cart_table.setItem(row, 0, QTableWidgetItem(str(row + 1)))
-            self.cart_table.setItem(row, 1, QTableWidgetItem(item['product_name']))
-            self.cart_table.setItem(row, 2, QTableWidgetItem(f"₹{item['mrp']:.2f}"))
-            self.cart_table.setItem(row, 3, QTableWidgetItem(f"{item['discount_percent']:.0f}%"))
-            self.cart_table.setItem(row, 4, QTableWidgetItem(f"₹{item['rate']:.2f}"))
-            self.cart_table.setItem(row, 5, QTableWidgetItem(str(item['quantity'])))
-            self.cart_table.setItem(row, 6, QTableWidgetItem(f"₹{item['amount']:.2f}"))
+        self.refresh_totals(items)
+    
+    def refresh_totals(self, items=None):
+        """Refresh bill summary labels without touching the cart table"""
+        if items is None:
+            items = billing_manager.get_cart_items()
+        
+        # Nothing to total: write the zero state without recomputing
+        if not items:
+            if self._last_summary is not None:
+                self._reset_summary_labels()
+            return
         
-        # Update totals
+        # Skip the label rewrite when nothing visible has changed
+        summary = (len(items), self._compute_totals())
+        if summary == self._last_summary:
+            return
+        self._last_summary = summary
+        
+        # Repaint the summary once after all of its labels are rewritten
+        self.summary_group.setUpdatesEnabled(False)
+        try:
+            self._paint_summary(*summary)
+        finally:
+            self.summary_group.setUpdatesEnabled(True)
+    
+    def _compute_totals(self) -> dict:
+        """Compute the bill totals and the CGST/SGST/IGST split in one pass"""
         is_gst_bill = self.gst_bill_checkbox.isChecked()
         totals = billing_manager.calculate_totals(is_gst_bill)
         
-        self.item_count_label.setText(f"Items: {len(items)}")
-        self.subtotal_label.setText(f"Subtotal: ₹{totals['subtotal']:.2f}")
-        self.discount_total_label.setText(f"Total Discount: ₹{totals['discount_amount']:.2f}")
-        
-        # GST live breakdown: CGST+SGST vs IGST based on GSTIN state
         if is_gst_bill and totals['total_tax'] > 0:
-            self.gst_frame.setVisible(True)
-            
-            cgst = 0.0
-            sgst = 0.0
-            igst = 0.0
-            
             company_state_code = company_settings.get('state_code', '').strip()
-            customer_gstin = self.customer_gstin.text().strip()
+            customer_gstin = self.get_customer_gstin()
             customer_state_code = customer_gstin[:2] if len(customer_gstin) >= 2 else ""
             
             if company_state_code and customer_state_code == company_state_code:
                 # Intra‑state → CGST + SGST
-                cgst = totals['total_tax'] / 2
-                sgst = totals['total_tax'] / 2
-                igst = 0.0
-                self.igst_label.setVisible(False)
+                totals['cgst_amount'] = totals['total_tax'] / 2
+                totals['sgst_amount'] = totals['total_tax'] / 2
             else:
                 # Inter‑state → IGST
-                igst = totals['total_tax']
-                cgst = 0.0
-                sgst = 0.0
-                self.igst_label.setVisible(True)
+                totals['igst_amount'] = totals['total_tax']
+        
+        return totals
+    
+    def _paint_summary(self, item_count: int, totals: dict):
+        """Write computed totals into the bill summary labels"""
+        self.item_count_label.setText(f"Items: {item_count}")
+        self.subtotal_label.setText("Subtotal: " + _RUPEE(totals['subtotal']))
+        self.discount_total_label.setText("Total Discount: " + _RUPEE(totals['discount_amount']))
+        
+        # GST live breakdown: CGST+SGST vs IGST based on GSTIN state
+        if totals['total_tax'] > 0:
+            if self.gst_frame is None:
+                self.create_gst_frame()
+            self.gst_frame.setVisible(True)
             
-            self.cgst_label.setText(f"CGST @ 2.5%: ₹{cgst:.2f}")
-            self.sgst_label.setText(f"SGST @ 2.5%: ₹{sgst:.2f}")
-            self.igst_label.setText(f"IGST @ 5%: ₹{igst:.2f}")
-            self.total_tax_label.setText(f"Total Tax: ₹{totals['total_tax']:.2f}")
-        else:
+            lines = ["CGST @ 2.5%: " + _RUPEE(totals['cgst_amount']),
+                     "SGST @ 2.5%: " + _RUPEE(totals['sgst_amount'])]
+            if totals['igst_amount']:
+                lines.append("IGST @ 5%: " + _RUPEE(totals['igst_amount']))
+            lines.append("<b>Total Tax: " + _RUPEE(totals['total_tax']) + "</b>")
+            self.gst_breakdown_label.setText("<br>".join(lines))
+        elif self.gst_frame is not None:
+            self.gst_frame.setVisible(False)
+            self.gst_breakdown_label.clear()
+        
+        self.roundoff_label.setText("Round Off: " + _RUPEE(totals['round_off']))
+        self.grand_total_label.setText(_RUPEE(totals['grand_total']))
+    
+    def _reset_summary_labels(self):
+        """Show the empty-cart bill summary"""
+        self._last_summary = None
+        self.item_count_label.setText("Items: 0")
+        self.subtotal_label.setText("Subtotal: ₹0.00")
+        self.discount_total_label.setText("Total Discount: ₹0.00")
+        if self.gst_frame is not None:
             self.gst_frame.setVisible(False)
-            self.cgst_label.setText("CGST @ 2.5%: ₹0.00")
-            self.sgst_label.setText("SGST @ 2.5%: ₹0.00")
-            self.igst_label.setText("IGST @ 5%: ₹0.00")
-            self.igst_label.setVisible(False)
-            self.total_tax_label.setText("Total Tax: ₹0.00")
-        
-        self.roundoff_label.setText(f"Round Off: ₹{totals['round_off']:.2f}")
-        self.grand_total_label.setText(f"₹{totals['grand_total']:.2f}")
+            self.gst_breakdown_label.clear()
+        self.roundoff_label.setText("Round Off: ₹0.00")
+        self.grand_total_label.setText("₹0.00")
     
     def remove_from_cart(self):
         """Remove selected item from cart"""
-        current_row = self.cart_table.currentRow()
+        current_row = self.cart_table.currentIndex().row()
         
         if current_row < 0:
             self.show_styled_message("No Selection", "Please select an item to remove", QMessageBox.Warning)
             return
         
-        billing_manager.remove_item_from_cart(current_row)
-        self.refresh_cart()
+        if not billing_manager.remove_item_from_cart(current_row):
+            return
+        self.cart_model.remove_row(current_row)
+        self.refresh_totals()
     
     def clear_cart(self):
         """Clear entire cart"""
-        if not billing_manager.get_cart_items():
+        if billing_manager.cart_is_empty():
             return
         
         msg_box = QMessageBox(self)
@@ -1013,7 +1341,7 @@ class BillingPage(QWidget):
     def generate_bill(self):
         """Generate bill"""
         # Validate cart
-        if not billing_manager.get_cart_items():
+        if billing_manager.cart_is_empty():
             self.show_styled_message("Empty Cart", "Please add items to cart first", QMessageBox.Warning)
             return
         
@@ -1032,17 +1360,32 @@ class BillingPage(QWidget):
         
         # Validate GSTIN for GST bills
         is_gst_bill = self.gst_bill_checkbox.isChecked()
-        customer_gstin = self.customer_gstin.text().strip()
+        customer_gstin = self.get_customer_gstin()
         
         if is_gst_bill and not customer_gstin:
             self.show_styled_message("Validation Error", "GSTIN is required for GST bills", QMessageBox.Warning)
             self.customer_gstin.setFocus()
             return
         
+        # Reject malformed GSTIN/phone here rather than in the bill transaction
+        if is_gst_bill:
+            valid, msg = validate_gstin(customer_gstin)
+            if not valid:
+                self.show_styled_message("Validation Error", msg, QMessageBox.Warning)
+                self.customer_gstin.setFocus()
+                return
+        
+        customer_phone = self.customer_phone.text().strip()
+        valid, msg = validate_phone(customer_phone)
+        if not valid:
+            self.show_styled_message("Validation Error", msg, QMessageBox.Warning)
+            self.customer_phone.setFocus()
+            return
+        
         # Prepare customer data
         customer_data = {
             'customer_name': customer_name,
-            'customer_phone': self.customer_phone.text().strip(),
+            'customer_phone': customer_phone,
             'customer_address': self.customer_address.toPlainText().strip(),
             'customer_city': '',
             'customer_pin_code': '',
@@ -1055,51 +1398,83 @@ class BillingPage(QWidget):
         )
         
         if success:
-            # Generate PDF
-            from utils.pdf_generator import pdf_generator
-            pdf_success, pdf_path = pdf_generator.generate_invoice(bill_data)
+            # The bill has lowered stock: apply it and tell other pages now,
+            # whether or not its PDF renders
+            self.refresh_entire_app(bill_data['items'])
             
-            if pdf_success:
-                # Show preview dialog
-                from ui.bill_preview_dialog import BillPreviewDialog
-                preview_dialog = BillPreviewDialog(bill_data, pdf_path, self)
-                preview_dialog.exec_()
-                
-                # Refresh entire app
-                self.refresh_entire_app()
-                
-                # Clear cart and form after closing preview
-                billing_manager.clear_cart()
-                self.refresh_cart()
-                self.clear_form()
-            else:
-                self.show_styled_message(
-                    "PDF Error",
-                    f"Bill saved but PDF generation failed.\n\nInvoice No: {bill_data['invoice_number']}",
-                    QMessageBox.Warning
-                )
+            # Render the PDF in a worker thread; results arrive in on_pdf_finished
+            self.generate_btn.setEnabled(False)
+            self.pdf_progress = PdfProgressDialog("Generating invoice PDF...", None, 0, 0, self)
+            self.pdf_progress.setWindowTitle("Please Wait")
+            self.pdf_progress.setWindowModality(Qt.WindowModal)
+            self.pdf_progress.setMinimumDuration(0)
+            self.pdf_progress.show()
+            
+            job = PdfJob(bill_data)
+            job.signals.finished.connect(self.on_pdf_finished)
+            QThreadPool.globalInstance().start(job)
         else:
             self.show_styled_message("Error", message, QMessageBox.Warning)
     
+    def on_pdf_finished(self, bill_data: dict, pdf_success: bool, pdf_path: str):
+        """Show the invoice once the worker thread has rendered its PDF"""
+        # hide() rather than close(): the dialog ignores close requests
+        self.pdf_progress.hide()
+        self.pdf_progress.deleteLater()
+        self.pdf_progress = None
+        self.generate_btn.setEnabled(True)
+        
+        if pdf_success:
+            # Show preview dialog
+            from ui.bill_preview_dialog import BillPreviewDialog
+            preview_dialog = BillPreviewDialog(bill_data, pdf_path, self)
+            preview_dialog.exec_()
+            
+            # Clear cart and form after closing preview
+            self._reset_after_bill()
+        else:
+            self.show_styled_message(
+                "PDF Error",
+                f"Bill saved but PDF generation failed.\n\nInvoice No: {bill_data['invoice_number']}",
+                QMessageBox.Warning
+            )
+    
+    def _reset_after_bill(self):
+        """Empty the cart and customer form for the next bill"""
+        # Empty the cart first so the form's GST/GSTIN handlers find
+        # nothing left to total
+        billing_manager.clear_cart()
+        self.refresh_cart()
+        self.clear_form()
+    
     def clear_form(self):
         """Clear customer form"""
         self.customer_name.clear()
         self.customer_phone.clear()
         self.customer_address.clear()
-        self.customer_gstin.clear()
+        if self.customer_gstin is not None:
+            self.customer_gstin.clear()
         self.customer_search.clear()
         self.gst_bill_checkbox.setChecked(False)
         self.customer_name.setFocus()
     
-    def on_customer_search(self):
-        """Handle customer search with autocomplete"""
+    def _do_customer_search(self):
+        """Run the customer search once typing has paused"""
         search_text = self.customer_search.text().strip()
         
         if len(search_text) < 2:
             return
         
-        # Search customers
-        customers = db.search_customers(search_text)
+        # Search customers in a worker thread; results arrive in on_customers_found
+        task = CustomerSearchTask(search_text)
+        task.signals.finished.connect(self.on_customers_found)
+        QThreadPool.globalInstance().start(task)
+    
+    def on_customers_found(self, search_text: str, customers: list):
+        """Handle customer search results from the worker thread"""
+        # Ignore results for a query the user has already typed past
+        if search_text != self.customer_search.text().strip():
+            return
         
         if not customers:
             return
@@ -1109,79 +1484,96 @@ class BillingPage(QWidget):
             self.fill_customer_data(customers[0])
             return
         
-        # Show dropdown for multiple matches
-        if len(customers) > 0:
-            self.show_customer_selection_dialog(customers)
+        # Offer the matches in the completer popup
+        self._cust_results = customers
+        self._cust_model.setStringList(
+            [f"{c['name']} - {c.get('phone') or 'No phone'}" for c in customers])
+        if self.customer_search.hasFocus():
+            self._cust_completer.setCompletionPrefix(search_text)
+            self._cust_completer.complete()
     
-    def show_customer_selection_dialog(self, customers: list):
-        """Show dialog to select from multiple customers"""
-        dialog = QDialog(self)
-        dialog.setWindowTitle("Select Customer")
-        dialog.setMinimumWidth(450)
-        dialog.setStyleSheet("""
-            QDialog {
-                background-color: #EBF4DD;
-            }
-            QLabel {
-                color: #3B4953;
-            }
-            QListWidget {
-                background-color: white;
-                border: 2px solid #90AB8B;
-                border-radius: 5px;
-                color: #3B4953;
-            }
-            QListWidget::item:selected {
-                background-color: #90AB8B;
-                color: #EBF4DD;
-            }
-            QPushButton {
-                background-color: #5A7863;
-                color: #EBF4DD;
-                padding: 8px 20px;
-                border-radius: 5px;
-                font-weight: bold;
-                min-width: 80px;
-            }
-            QPushButton:hover {
-                background-color: #90AB8B;
-            }
-        """)
-        
-        layout = QVBoxLayout()
-        
-        info_label = QLabel(f"Found {len(customers)} customer(s). Select one:")
-        layout.addWidget(info_label)
-        
-        list_widget = QListWidget()
-        for customer in customers:
-            phone = customer.get('phone', 'No phone')
-            address = customer.get('address', 'No address')
-            item_text = f"{customer['name']} - {phone}\n   {address[:50]}..."
-            list_widget.addItem(item_text)
-        
-        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-        buttons.accepted.connect(dialog.accept)
-        buttons.rejected.connect(dialog.reject)
-        
-        layout.addWidget(list_widget)
-        layout.addWidget(buttons)
-        
-        dialog.setLayout(layout)
-        
-        if dialog.exec_() == QDialog.Accepted and list_widget.currentRow() >= 0:
-            self.fill_customer_data(customers[list_widget.currentRow()])
+    def on_customer_activated(self, index: QModelIndex):
+        """Fill the form from the customer picked in the completer popup"""
+        # Picking an entry rewrites the search text; don't search for it
+        self._cust_timer.stop()
+        row = self._cust_completer.completionModel().mapToSource(index).row()
+        if 0 <= row < len(self._cust_results):
+            self.fill_customer_data(self._cust_results[row])
     
     def fill_customer_data(self, customer: dict):
         """Fill customer form with data"""
         self.customer_name.setText(customer.get('name', ''))
         self.customer_phone.setText(customer.get('phone', ''))
         self.customer_address.setPlainText(customer.get('address', ''))
-        self.customer_gstin.setText(customer.get('gstin', ''))
+        gstin = customer.get('gstin') or ''
+        if gstin and self.customer_gstin is None:
+            self.create_gstin_fields()
+        if self.customer_gstin is not None:
+            self.customer_gstin.setText(gstin)
     
-    def refresh_entire_app(self):
-        """Emit signal to refresh other pages"""
-        app_signals.inventory_updated.emit()
+    def on_inventory_updated(self):
+        """Reload products now, or on next show if the page is hidden"""
+        if self._skip_inventory_reload:
+            return
+        if self.isVisible():
+            self.load_products()
+        else:
+            self._products_dirty = True
+    
+    def on_sales_persons_updated(self):
+        """Reload sales persons now, or on next show if the page is hidden"""
+        if self.isVisible():
+            self.reload_sales_persons()
+        else:
+            self._sales_persons_dirty = True
+    
+    def reload_sales_persons(self):
+        """Reload the sales person dropdown, keeping the current selection"""
+        selected_id = self.sales_person_combo.currentData()
+        self.load_sales_persons()
+        index = self.sales_person_combo.findData(selected_id)
+        if index >= 0:
+            self.sales_person_combo.setCurrentIndex(index)
+    
+    def showEvent(self, event):
+        """Apply changes that arrived while the page was hidden"""
+        super().showEvent(event)
+        if self._products_dirty:
+            self._products_dirty = False
+            self.load_products()
+        if self._sales_persons_dirty:
+            self._sales_persons_dirty = False
+            self.reload_sales_persons()
+    
+    def closeEvent(self, event):
+        """Stop listening for app-wide changes once the page is closed"""
+        for signal, slot in ((app_signals.inventory_updated, self.on_inventory_updated),
+                             (app_signals.sales_persons_updated, self.on_sales_persons_updated)):
+            try:
+                signal.disconnect(slot)
+            except TypeError:
+                pass
+        super().closeEvent(event)
+    
+    def refresh_entire_app(self, sold_items=()):
+        """Apply a bill's stock changes here and signal other pages
+        
+        sold_items are the item dicts create_bill saved with the bill.
+        """
+        # Only the sold products changed, so patch their cached stock
+        # instead of reloading every product
+        for item in sold_items:
+            product = self.products_dict.get(item['product_name'].casefold())
+            if product is not None:
+                product['current_stock'] -= item['quantity']
+                self.prepare_product_display(product)
+        self.current_product = None
+        
+        self._skip_inventory_reload = True
+        try:
+            app_signals.inventory_updated.emit()
+        finally:
+            self._skip_inventory_reload = False
     
     def show_styled_message(self, title: str, message: str, icon=QMessageBox.Information):
         """Show styled message box"""
@@ -1194,23 +1586,4 @@ class BillingPage(QWidget):
     
     def get_message_box_style(self) -> str:
         """Get consistent message box styling"""
-        return """
-            QMessageBox {
-                background-color: #EBF4DD;
-            }
-            QLabel {
-                color: #3B4953;
-                font-size: 11pt;
-            }
-            QPushButton {
-                background-color: #5A7863;
-                color: #EBF4DD;
-                padding: 8px 20px;
-                border-radius: 5px;
-                font-weight: bold;
-                min-width: 80px;
-            }
-            QPushButton:hover {
-                background-color: #90AB8B;
-            }
-        """
+        return MESSAGE_BOX_STYLE
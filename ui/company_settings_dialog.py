@@ -8,6 +8,22 @@ from PyQt5.QtGui import QFont
 from utils.company_settings import company_settings
 
 
+# Input styling, applied once through the dialog stylesheet
+INPUT_STYLE = """
+    QLineEdit {
+        background-color: #EBF4DD;
+        border: 2px solid #90AB8B;
+        border-radius: 5px;
+        padding: 8px;
+        color: #3B4953;
+        font-size: 10pt;
+    }
+    QLineEdit:focus {
+        border: 2px solid #5A7863;
+    }
+"""
+
+
 class CompanySettingsDialog(QDialog):
     """Dialog for managing company settings including dual banking"""
     
@@ -39,7 +55,7 @@ class CompanySettingsDialog(QDialog):
                 left: 10px;
                 padding: 0 5px 0 5px;
             }
-        """)
+        """ + INPUT_STYLE)
         
         self.init_ui()
         self.load_settings()
@@ -71,9 +87,11 @@ class CompanySettingsDialog(QDialog):
         company_tab = self.create_company_tab()
         tabs.addTab(company_tab, "📋 Company Info")
         
-        # Banking Details Tab
-        banking_tab = self.create_banking_tab()
-        tabs.addTab(banking_tab, "🏦 Banking Details")
+        # Banking Details Tab is built the first time it is opened
+        self._banking_built = False
+        self._banking_index = tabs.addTab(QWidget(), "🏦 Banking Details")
+        tabs.currentChanged.connect(self.ensure_banking_tab)
+        self.tabs = tabs
         
         layout.addWidget(tabs)
         
@@ -127,71 +145,73 @@ class CompanySettingsDialog(QDialog):
         
         # Company fields
         self.company_name_input = QLineEdit()
-        self.company_name_input.setStyleSheet(self.get_input_style())
         layout.addRow("Company Name:", self.company_name_input)
         
         self.company_tagline_input = QLineEdit()
-        self.company_tagline_input.setStyleSheet(self.get_input_style())
         layout.addRow("Tagline:", self.company_tagline_input)
         
         self.company_subtitle_input = QLineEdit()
-        self.company_subtitle_input.setStyleSheet(self.get_input_style())
         layout.addRow("Subtitle:", self.company_subtitle_input)
         
         self.company_cert_input = QLineEdit()
-        self.company_cert_input.setStyleSheet(self.get_input_style())
         layout.addRow("Certifications:", self.company_cert_input)
         
         self.factory_address_input = QLineEdit()
-        self.factory_address_input.setStyleSheet(self.get_input_style())
         layout.addRow("Factory Address:", self.factory_address_input)
         
         self.office_address_input = QLineEdit()
-        self.office_address_input.setStyleSheet(self.get_input_style())
         layout.addRow("Office Address:", self.office_address_input)
         
         self.phone_input = QLineEdit()
-        self.phone_input.setStyleSheet(self.get_input_style())
         layout.addRow("Phone:", self.phone_input)
         
         self.email_input = QLineEdit()
-        self.email_input.setStyleSheet(self.get_input_style())
         layout.addRow("Email:", self.email_input)
 
         self.instagram_input = QLineEdit()
-        self.instagram_input.setStyleSheet(self.get_input_style())
         layout.addRow("Instagram:", self.instagram_input)
 
         self.gstin_input = QLineEdit()
-        self.gstin_input.setStyleSheet(self.get_input_style())
         layout.addRow("GSTIN:", self.gstin_input)
         
         self.state_name_input = QLineEdit()
-        self.state_name_input.setStyleSheet(self.get_input_style())
         layout.addRow("State Name:", self.state_name_input)
         
         self.state_code_input = QLineEdit()
-        self.state_code_input.setStyleSheet(self.get_input_style())
         layout.addRow("State Code:", self.state_code_input)
 
         self.invoice_note_input = QTextEdit()
-        self.invoice_note_input.setStyleSheet(self.get_input_style())
         self.invoice_note_input.setFixedHeight(60)
         layout.addRow("Invoice Note:", self.invoice_note_input)
 
         self.invoice_prefix_input = QLineEdit()
-        self.invoice_prefix_input.setStyleSheet(self.get_input_style())
         layout.addRow("Invoice Prefix:", self.invoice_prefix_input)
 
         # Next Invoice Number
         self.next_invoice_input = QSpinBox()
         self.next_invoice_input.setRange(1, 9999999)
-        self.next_invoice_input.setStyleSheet(self.get_input_style())
         layout.addRow("Next Invoice Number:", self.next_invoice_input)
         
         tab.setLayout(layout)
         return tab
     
+    def ensure_banking_tab(self, index: int):
+        """Swap the Banking placeholder for the real tab on first visit"""
+        if index != self._banking_index or self._banking_built:
+            return
+        self._banking_built = True
+        self.tabs.currentChanged.disconnect(self.ensure_banking_tab)
+        
+        placeholder = self.tabs.widget(index)
+        self.tabs.blockSignals(True)
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, self.create_banking_tab(), "🏦 Banking Details")
+        self.tabs.setCurrentIndex(index)
+        self.tabs.blockSignals(False)
+        placeholder.deleteLater()
+        
+        self.load_banking_settings(company_settings.get_all())
+    
     def create_banking_tab(self) -> QWidget:
         """Create banking details tab with GST and Non-GST sections"""
         tab = QWidget()
@@ -203,24 +223,19 @@ class CompanySettingsDialog(QDialog):
         gst_layout.setSpacing(10)
         
         self.gst_bank_name_input = QLineEdit()
-        self.gst_bank_name_input.setStyleSheet(self.get_input_style())
         gst_layout.addRow("Bank Name:", self.gst_bank_name_input)
         
         self.gst_account_no_input = QLineEdit()
-        self.gst_account_no_input.setStyleSheet(self.get_input_style())
         gst_layout.addRow("Account Number:", self.gst_account_no_input)
         
         self.gst_ifsc_input = QLineEdit()
-        self.gst_ifsc_input.setStyleSheet(self.get_input_style())
         gst_layout.addRow("IFSC Code:", self.gst_ifsc_input)
         
         self.gst_branch_input = QLineEdit()
-        self.gst_branch_input.setStyleSheet(self.get_input_style())
         self.gst_branch_input.setPlaceholderText("Optional")
         gst_layout.addRow("Branch:", self.gst_branch_input)
         
         self.gst_upi_input = QLineEdit()
-        self.gst_upi_input.setStyleSheet(self.get_input_style())
         self.gst_upi_input.setPlaceholderText("Optional - e.g., business@paytm")
         gst_layout.addRow("UPI ID:", self.gst_upi_input)
         
@@ -238,27 +253,22 @@ class CompanySettingsDialog(QDialog):
         non_gst_layout.addRow("", info_label)
         
         self.non_gst_bank_name_input = QLineEdit()
-        self.non_gst_bank_name_input.setStyleSheet(self.get_input_style())
         self.non_gst_bank_name_input.setPlaceholderText("Optional - Different bank for Non-GST")
         non_gst_layout.addRow("Bank Name:", self.non_gst_bank_name_input)
         
         self.non_gst_account_no_input = QLineEdit()
-        self.non_gst_account_no_input.setStyleSheet(self.get_input_style())
         self.non_gst_account_no_input.setPlaceholderText("Optional")
         non_gst_layout.addRow("Account Number:", self.non_gst_account_no_input)
         
         self.non_gst_ifsc_input = QLineEdit()
-        self.non_gst_ifsc_input.setStyleSheet(self.get_input_style())
         self.non_gst_ifsc_input.setPlaceholderText("Optional")
         non_gst_layout.addRow("IFSC Code:", self.non_gst_ifsc_input)
         
         self.non_gst_branch_input = QLineEdit()
-        self.non_gst_branch_input.setStyleSheet(self.get_input_style())
         self.non_gst_branch_input.setPlaceholderText("Optional")
         non_gst_layout.addRow("Branch:", self.non_gst_branch_input)
         
         self.non_gst_upi_input = QLineEdit()
-        self.non_gst_upi_input.setStyleSheet(self.get_input_style())
         self.non_gst_upi_input.setPlaceholderText("Optional")
         non_gst_layout.addRow("UPI ID:", self.non_gst_upi_input)
         
@@ -291,6 +301,11 @@ class CompanySettingsDialog(QDialog):
         # Next invoice number (default 1)
         self.next_invoice_input.setValue(int(settings.get('next_invoice_number', 1) or 1))
         
+        if self._banking_built:
+            self.load_banking_settings(settings)
+    
+    def load_banking_settings(self, settings: dict):
+        """Load banking settings into the Banking tab"""
         # GST Banking
         self.gst_bank_name_input.setText(settings.get('gst_bank_name', ''))
         self.gst_account_no_input.setText(settings.get('gst_bank_account_no', ''))
@@ -324,7 +339,31 @@ class CompanySettingsDialog(QDialog):
             'invoice_prefix': self.invoice_prefix_input.text().strip(),
             'invoice_note': self.invoice_note_input.toPlainText().strip(),
             'next_invoice_number': self.next_invoice_input.value(),
-            
+        }
+        
+        # Banking keys are left untouched if the tab was never opened
+        if self._banking_built:
+            settings.update(self.get_banking_settings())
+        
+        success = company_settings.update(settings)
+        
+        if success:
+            QMessageBox.information(
+                self,
+                "Success",
+                "Settings saved successfully!"
+            )
+            self.accept()
+        else:
+            QMessageBox.warning(
+                self,
+                "Error",
+                "Failed to save settings. Please try again."
+            )
+    
+    def get_banking_settings(self) -> dict:
+        """Collect banking settings from the Banking tab"""
+        return {
             # GST Banking
             'gst_bank_name': self.gst_bank_name_input.text().strip(),
             'gst_bank_account_no': self.gst_account_no_input.text().strip(),
@@ -344,35 +383,3 @@ class CompanySettingsDialog(QDialog):
             'bank_account_no': self.gst_account_no_input.text().strip(),
             'bank_ifsc': self.gst_ifsc_input.text().strip(),
         }
-        
-        success = company_settings.update(settings)
-        
-        if success:
-            QMessageBox.information(
-                self,
-                "Success",
-                "Settings saved successfully!"
-            )
-            self.accept()
-        else:
-            QMessageBox.warning(
-                self,
-                "Error",
-                "Failed to save settings. Please try again."
-            )
-    
-    def get_input_style(self) -> str:
-        """Get input field styling"""
-        return """
-            QLineEdit {
-                background-color: #EBF4DD;
-                border: 2px solid #90AB8B;
-                border-radius: 5px;
-                padding: 8px;
-                color: #3B4953;
-                font-size: 10pt;
-            }
-            QLineEdit:focus {
-                border: 2px solid #5A7863;
-            }
-        """
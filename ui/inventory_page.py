@@ -1,13 +1,680 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-                            QLineEdit, QPushButton, QTableWidget, QTableWidgetItem,
+                            QLineEdit, QPushButton, QTableView, QAbstractItemView,
                             QComboBox, QMessageBox, QFrame, QHeaderView,
-                            QDialog, QFormLayout, QDialogButtonBox, QSpinBox,
-                            QDoubleSpinBox, QGroupBox, QDateEdit)
-from PyQt5.QtCore import Qt, QDate
-from PyQt5.QtGui import QFont, QColor
+                            QDialog, QFormLayout, QGridLayout, QDialogButtonBox, QSpinBox,
+                            QGroupBox, QDateEdit,
+                            QStyledItemDelegate)
+from PyQt5.QtCore import (Qt, QDate, QAbstractTableModel, QModelIndex, QTimer,
+                          QEvent, QRect, QObject, QRunnable, QThreadPool, QLocale,
+                          pyqtSignal)
+from PyQt5.QtGui import (QFont, QColor, QBrush, QPainter, QStandardItemModel, QStandardItem,
+                         QDoubleValidator)
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
 from modules.inventory import inventory_manager
 from utils.constants import PRODUCT_CATEGORIES, UNITS, DEFAULT_HSN_CODE
 from utils.logger import logger
+from utils.signals import app_signals
+
+
+# Delay after the last keystroke before the inventory search runs (ms)
+SEARCH_DELAY_MS = 250
+
+# Styling for the page's message boxes, built once
+MESSAGE_BOX_STYLE = """
+    QMessageBox {
+        background-color: #3B4953;
+    }
+    QLabel {
+        color: #3B4953;
+        font-size: 11pt;
+    }
+    QPushButton {
+        background-color: #3B4953;
+        color: white;
+        padding: 8px 20px;
+        border-radius: 5px;
+        font-weight: bold;
+        min-width: 80px;
+    }
+    QPushButton:hover {
+        background-color: white;
+    }
+"""
+
+# ProductDialog price fields as (attribute, form label, product key)
+PRICE_FIELDS = (
+    ("mrp_input", "MRP: *", 'mrp'),
+    ("purchase_price_input", "Purchase Price:", 'purchase_price'),
+)
+
+
+def field_text(field: QLineEdit) -> str:
+    """Return the text of a line edit with surrounding whitespace removed"""
+    return field.text().strip()
+
+
+def price_value(field: QLineEdit) -> float:
+    """Return the price typed into a price field, 0.0 if blank or incomplete"""
+    try:
+        return float(field.text())
+    except ValueError:
+        return 0.0
+
+# ProductDialog stock fields as (attribute, form label, product key, default,
+# shown only when adding)
+STOCK_FIELDS = (
+    ("min_stock_input", "Min Stock Level:", 'min_stock_level', 10, False),
+    ("initial_stock_input", "Initial Stock:", 'current_stock', 0, True),
+)
+
+# Theme colours; the dialog stylesheets below are rendered from them once
+THEME = {
+    "bg": "#EBF4DD",
+    "accent": "#5A7863",
+    "accent_light": "#90AB8B",
+    "fg": "#3B4953",
+}
+
+# Product and stock dialog rules, appended to the page STYLESHEET so dialogs
+# opened from the page pick them up without a stylesheet of their own. Rules
+# are scoped by dialog object name to stay off the page's message boxes, and
+# child selectors (> ...) keep them off the editors inside spin boxes and the
+# date picker's calendar.
+DIALOG_STYLESHEET = """
+QDialog#productDialog, QDialog#stockDialog {
+    background-color: %(bg)s;
+}
+#productDialog QLabel, #stockDialog QLabel {
+    color: %(fg)s;
+    font-weight: bold;
+}
+#productDialog QDialogButtonBox QPushButton, #stockDialog QDialogButtonBox QPushButton {
+    background-color: %(accent)s;
+    color: %(bg)s;
+    padding: 8px 20px;
+    border-radius: 5px;
+    font-weight: bold;
+    min-width: 80px;
+}
+#productDialog QDialogButtonBox QPushButton:hover, #stockDialog QDialogButtonBox QPushButton:hover {
+    background-color: %(accent_light)s;
+}
+
+QDialog#productDialog > QLineEdit {
+    background-color: %(bg)s;
+    border: 2px solid %(accent_light)s;
+    border-radius: 5px;
+    padding: 8px;
+    color: %(fg)s;
+    font-size: 11pt;
+}
+QDialog#productDialog > QComboBox {
+    padding: 8px;
+    font-weight: bold;
+    background-color: %(bg)s;
+    border: 2px solid %(accent_light)s;
+    border-radius: 5px;
+    color: %(fg)s;
+}
+QDialog#productDialog > QComboBox::drop-down {
+    border: none;
+}
+QDialog#productDialog > QComboBox QAbstractItemView {
+    background-color: %(bg)s;
+    selection-background-color: %(accent_light)s;
+    selection-color: %(bg)s;
+}
+QDialog#productDialog > QSpinBox, QDialog#productDialog > QDateEdit {
+    background-color: %(bg)s;
+    border: 2px solid %(accent_light)s;
+    border-radius: 5px;
+    padding: 8px;
+    color: %(fg)s;
+    font-weight: bold;
+}
+QDialog#productDialog > QDateEdit::drop-down {
+    border: none;
+}
+
+QLabel#currentStockLabel {
+    color: %(accent)s;
+    font-size: 14pt;
+}
+QDialog#stockDialog > QSpinBox {
+    background-color: %(bg)s;
+    border: 2px solid %(accent_light)s;
+    border-radius: 5px;
+    padding: 8px;
+    color: %(fg)s;
+    font-weight: bold;
+    font-size: 11pt;
+}
+QDialog#stockDialog > QLineEdit {
+    background-color: %(bg)s;
+    border: 2px solid %(accent_light)s;
+    border-radius: 5px;
+    padding: 8px;
+    color: %(fg)s;
+}
+
+QDialog#productDialog > QLineEdit:focus, QDialog#productDialog > QComboBox:focus,
+QDialog#productDialog > QSpinBox:focus, QDialog#productDialog > QDateEdit:focus,
+QDialog#stockDialog > QSpinBox:focus, QDialog#stockDialog > QLineEdit:focus {
+    border: 2px solid %(accent)s;
+}
+""" % THEME
+
+# Fixed inventory row height and width of every column except Name (px)
+ROW_HEIGHT = 31
+COLUMN_WIDTH = 104
+
+# Low stock warning colours for the Stock column, shared by every cell
+_LOW_STOCK_BG = QBrush(QColor(255, 200, 200))
+_LOW_STOCK_FG = QBrush(QColor(200, 0, 0))
+
+# Theme colours for painted (non-QSS) elements, allocated once
+PALETTE = {name: QColor(value) for name, value in THEME.items()}
+
+# Combo index of each category / unit, for selecting a product's value in O(1)
+_CATEGORY_INDEX = {c: i for i, c in enumerate(PRODUCT_CATEGORIES)}
+_UNIT_INDEX = {u: i for i, u in enumerate(UNITS)}
+
+
+@lru_cache(maxsize=None)
+def combo_model(items: tuple) -> QStandardItemModel:
+    """Return the item model shared by every combo listing these items"""
+    model = QStandardItemModel()
+    for item in items:
+        model.appendRow(QStandardItem(item))
+    return model
+
+
+@lru_cache(maxsize=None)
+def price_validator() -> QDoubleValidator:
+    """Return the validator shared by every price field (0 to 999999.99, 2 dp)"""
+    validator = QDoubleValidator(0.0, 999999.99, 2)
+    # Standard notation with a '.' separator, so float() can parse it
+    validator.setNotation(QDoubleValidator.StandardNotation)
+    validator.setLocale(QLocale.c())
+    return validator
+
+
+# Page-wide stylesheet, applied once on the InventoryPage root. The ancestor
+# rule comes first so the per-widget rules below override it; the dialog
+# rules are appended last.
+STYLESHEET = """
+QWidget#inventoryPage, #inventoryPage QWidget {
+    background-color: #EBF4DD;
+}
+
+QLabel#inventoryTitle {
+    color: #5A7863;
+    border: none;
+}
+QLabel#filterLabel {
+    color: #3B4953;
+    font-weight: bold;
+}
+QLabel#loadingLabel {
+    color: #90AB8B;
+    font-style: italic;
+}
+
+QLineEdit#inventorySearch {
+    background-color: #EBF4DD;
+    border: 2px solid #90AB8B;
+    border-radius: 5px;
+    padding: 8px;
+    color: #3B4953;
+    font-size: 11pt;
+}
+QLineEdit#inventorySearch:focus {
+    border: 2px solid #5A7863;
+}
+
+QComboBox#categoryFilter {
+    padding: 8px;
+    font-weight: bold;
+    background-color: #EBF4DD;
+    border: 2px solid #90AB8B;
+    border-radius: 5px;
+    color: #3B4953;
+    min-width: 150px;
+}
+QComboBox#categoryFilter:focus {
+    border: 2px solid #5A7863;
+}
+QComboBox#categoryFilter::drop-down {
+    border: none;
+}
+#categoryFilter QAbstractItemView {
+    background-color: #EBF4DD;
+    selection-background-color: #90AB8B;
+    selection-color: #EBF4DD;
+}
+
+QTableView#inventoryTable {
+    background-color: #EBF4DD;
+    alternate-background-color: #EBF4DD;
+    border: 2px solid #90AB8B;
+    border-radius: 8px;
+    gridline-color: #90AB8B;
+    color: #3B4953;
+}
+QTableView#inventoryTable::item {
+    padding: 5px;
+}
+QTableView#inventoryTable::item:selected {
+    background-color: #90AB8B;
+    color: #EBF4DD;
+}
+#inventoryTable QHeaderView::section {
+    background-color: #5A7863;
+    color: #EBF4DD;
+    padding: 10px;
+    border: none;
+    font-weight: bold;
+    font-size: 11pt;
+}
+
+QFrame#inventoryToolbar {
+    background-color: #EBF4DD;
+    border-radius: 8px;
+    padding: 10px;
+    border: 2px solid #90AB8B;
+}
+QPushButton#addProductButton, QPushButton#refreshButton, QPushButton#lowStockButton {
+    color: #EBF4DD;
+    padding: 10px 20px;
+    border-radius: 5px;
+    font-weight: bold;
+    font-size: 11pt;
+}
+QPushButton#addProductButton {
+    background-color: #5A7863;
+}
+QPushButton#refreshButton {
+    background-color: #90AB8B;
+}
+QPushButton#lowStockButton {
+    background-color: #3B4953;
+}
+QPushButton#addProductButton:hover {
+    background-color: #90AB8B;
+}
+QPushButton#refreshButton:hover, QPushButton#lowStockButton:hover {
+    background-color: #5A7863;
+}
+
+QFrame#inventorySummary, #inventorySummary QLabel {
+    background-color: #5A7863;
+    border-radius: 8px;
+    padding: 15px;
+    border: 2px solid #90AB8B;
+}
+#inventorySummary QLabel {
+    color: #EBF4DD;
+    font-weight: bold;
+}
+""" + DIALOG_STYLESHEET
+
+
+class InventoryFetchSignals(QObject):
+    """Signals emitted by InventoryFetchTask"""
+    finished = pyqtSignal(int, str, object)
+
+
+class InventoryFetchTask(QRunnable):
+    """Run an inventory query off the GUI thread
+
+    The result is handed back through signals.finished as
+    (request_id, kind, result); result is None if the query failed.
+    """
+
+    def __init__(self, request_id: int, kind: str, fetch):
+        super().__init__()
+        self.request_id = request_id
+        self.kind = kind
+        self.fetch = fetch
+        self.signals = InventoryFetchSignals()
+
+    def run(self):
+        try:
+            result = self.fetch()
+        except Exception as e:
+            logger.error(f"Error fetching inventory ({self.kind}): {e}")
+            result = None
+        self.signals.finished.emit(self.request_id, self.kind, result)
+
+
+def _text_or_blank(value) -> str:
+    """Show a missing optional value as an empty cell"""
+    return value or ''
+
+
+def _sort_value(value, descending: bool = False) -> tuple:
+    """Sort key for a raw product value; missing values sort after present ones
+
+    The missing-value flag is flipped for descending sorts (done with
+    reverse=True), so missing values stay last in both orders.
+    """
+    if value is None:
+        return (not descending, 0)
+    return (descending, value)
+
+
+# Inventory table columns as (header, product key, formatter). The Actions
+# column has no key; ActionsDelegate draws it.
+COLUMNS = (
+    ("ID", 'id', str),
+    ("Name", 'name', str),
+    ("Category", 'category', str),
+    ("HSN", 'hsn_code', _text_or_blank),
+    ("Batch No.", 'batch_number', _text_or_blank),
+    ("Expiry", 'expiry_date', _text_or_blank),
+    # MRP with rupee symbol and 2 decimal places
+    ("MRP", 'mrp', lambda mrp: f"₹{mrp:.2f}"),
+    ("Stock", 'current_stock', str),
+    ("Min Stock", 'min_stock_level', str),
+    ("Actions", None, None),
+)
+
+
+class ProductTableModel(QAbstractTableModel):
+    """Table model for the inventory list
+
+    Holds the product dicts as fetched. Rows are handed to the view a page
+    at a time through canFetchMore/fetchMore, and each page's cell text is
+    formatted once as it is exposed, so data() only indexes into it.
+    """
+
+    HEADERS = tuple(header for header, _, _ in COLUMNS)
+    STOCK_COLUMN = 7
+    ACTIONS_COLUMN = 9
+    # Rows exposed to the view per fetchMore
+    PAGE_SIZE = 200
+
+    def __init__(self, parent=None):
+        # Initialize the parent model class
+        super().__init__(parent)
+        # Product dicts in display order
+        self._rows = []
+        # Number of rows exposed to the view so far
+        self._fetched = 0
+        # Display strings of the exposed rows, one tuple per row
+        self._display = []
+        # Low stock flag of the exposed rows
+        self._low_stock = []
+        # Row index of each product id
+        self._by_id = {}
+        # Column and order picked on the header (-1: keep the fetched order)
+        self._sort_column = -1
+        self._sort_order = Qt.AscendingOrder
+
+    @staticmethod
+    def format_row(product: dict) -> tuple:
+        """Return the display strings of one product, one per column"""
+        return tuple(fmt(product.get(key)) if key else None for _, key, fmt in COLUMNS)
+
+    @staticmethod
+    def is_low_stock(product: dict) -> bool:
+        """Return True if a product is at or below its minimum stock level"""
+        return product['current_stock'] <= product['min_stock_level']
+
+    def _format_rows(self, first: int, last: int):
+        """Format rows first..last and append them to the display cache"""
+        page = self._rows[first:last + 1]
+        self._display.extend([self.format_row(p) for p in page])
+        self._low_stock.extend([self.is_low_stock(p) for p in page])
+
+    def set_products(self, products):
+        """Replace all rows, exposing only the first page"""
+        # Reset so the view drops every cached row at once
+        self.beginResetModel()
+        self._rows = list(products)
+        # New results keep the order picked on the header
+        self._sort_rows()
+        self._by_id = {p['id']: row for row, p in enumerate(self._rows)}
+        self._fetched = min(len(self._rows), self.PAGE_SIZE)
+        self._display = []
+        self._low_stock = []
+        self._format_rows(0, self._fetched - 1)
+        self.endResetModel()
+
+    def _sort_rows(self) -> bool:
+        """Order every loaded row by the sort column; False if there is none"""
+        key = COLUMNS[self._sort_column][1] if self._sort_column >= 0 else None
+        # No column picked yet, or the Actions column
+        if key is None:
+            return False
+        descending = self._sort_order == Qt.DescendingOrder
+        self._rows.sort(key=lambda p: _sort_value(p.get(key), descending), reverse=descending)
+        return True
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Sort all loaded rows, not just the exposed ones, by raw value"""
+        # The Actions column has no value to sort by; keep the current order
+        if column >= 0 and COLUMNS[column][1] is None:
+            return
+        self._sort_column = column
+        self._sort_order = order
+        # Nothing to reorder (no rows, or no column picked)
+        if not self._rows or column < 0:
+            return
+        self.layoutAboutToBeChanged.emit()
+        # Remember which product each persistent index (selection) points at
+        old = self.persistentIndexList()
+        old_ids = [self._rows[index.row()]['id'] for index in old]
+        self._sort_rows()
+        self._by_id = {p['id']: row for row, p in enumerate(self._rows)}
+        # Re-format the exposed rows in their new order
+        self._display = []
+        self._low_stock = []
+        self._format_rows(0, self._fetched - 1)
+        # Follow each product to its new row; rows moved past the exposed
+        # ones drop out of the selection
+        new = []
+        for product_id, index in zip(old_ids, old):
+            row = self._by_id[product_id]
+            new.append(self.index(row, index.column()) if row < self._fetched else QModelIndex())
+        self.changePersistentIndexList(old, new)
+        self.layoutChanged.emit()
+
+    def sort_state(self) -> tuple:
+        """Return the (column, order) the rows are sorted by"""
+        return self._sort_column, self._sort_order
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._fetched < len(self._rows)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        # Expose the next page of already-loaded products
+        count = min(len(self._rows) - self._fetched, self.PAGE_SIZE)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._fetched, self._fetched + count - 1)
+        self._format_rows(self._fetched, self._fetched + count - 1)
+        self._fetched += count
+        self.endInsertRows()
+
+    def product_at(self, row: int) -> dict:
+        """Return the product dict shown in a row"""
+        return self._rows[row]
+
+    def _insert_position(self, product: dict) -> int:
+        """Return the row a new product goes in: its place in the header sort, else the end"""
+        key = COLUMNS[self._sort_column][1] if self._sort_column >= 0 else None
+        if key is None:
+            return len(self._rows)
+        descending = self._sort_order == Qt.DescendingOrder
+        value = _sort_value(product.get(key), descending)
+        keys = [_sort_value(p.get(key), descending) for p in self._rows]
+        if descending:
+            # Search the ascending reversed keys; land after equal values
+            return len(keys) - bisect_left(keys[::-1], value)
+        return bisect_right(keys, value)
+
+    def insert_product(self, product: dict):
+        """Insert a product in sort order, showing it at once if its row is exposed"""
+        # A product already listed is updated in place rather than duplicated
+        if product['id'] in self._by_id:
+            self.update_product(product)
+            return
+        row = self._insert_position(product)
+        # Rows in the not yet fetched tail are exposed later by fetchMore
+        if self._fetched < len(self._rows) and row >= self._fetched:
+            self._rows.insert(row, product)
+        else:
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._rows.insert(row, product)
+            self._display.insert(row, self.format_row(product))
+            self._low_stock.insert(row, self.is_low_stock(product))
+            self._fetched += 1
+            self.endInsertRows()
+        # The new row and every row below it have new indexes
+        for moved in range(row, len(self._rows)):
+            self._by_id[self._rows[moved]['id']] = moved
+
+    def update_product(self, product: dict):
+        """Replace the row holding product['id'] and repaint just that row
+
+        If the table is sorted by a value that changed, the row is moved to
+        its new sorted place instead.
+        """
+        row = self.row_of(product['id'])
+        if row < 0:
+            return
+        key = COLUMNS[self._sort_column][1] if self._sort_column >= 0 else None
+        if key is not None and product.get(key) != self._rows[row].get(key):
+            self.remove_product(product['id'])
+            self.insert_product(product)
+            return
+        self._rows[row] = product
+        # Rows not yet exposed are formatted when fetched
+        if row < self._fetched:
+            self._display[row] = self.format_row(product)
+            self._low_stock[row] = self.is_low_stock(product)
+            self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+
+    def remove_product(self, product_id: int):
+        """Remove the row holding a product id"""
+        row = self.row_of(product_id)
+        if row < 0:
+            return
+        # Rows not yet exposed can go without notifying the view
+        if row >= self._fetched:
+            del self._rows[row]
+        else:
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._rows[row]
+            del self._display[row]
+            del self._low_stock[row]
+            self._fetched -= 1
+            self.endRemoveRows()
+        # Rows below the removed one moved up by one
+        del self._by_id[product_id]
+        for moved in range(row, len(self._rows)):
+            self._by_id[self._rows[moved]['id']] = moved
+
+    def row_of(self, product_id: int) -> int:
+        """Return the row holding a product id, or -1 if it is not listed"""
+        return self._by_id.get(product_id, -1)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._fetched
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        row = index.row()
+        column = index.column()
+
+        if role == Qt.DisplayRole:
+            # Cell text was formatted when the row was exposed
+            return self._display[row][column]
+
+        if role == Qt.UserRole:
+            # Product id, so callers need not hold on to the row number
+            return self._rows[row]['id']
+
+        # Low stock warning colours on the Stock column
+        if column == self.STOCK_COLUMN and self._low_stock[row]:
+            if role == Qt.BackgroundRole:
+                # Light red background for low stock warning
+                return _LOW_STOCK_BG
+            if role == Qt.ForegroundRole:
+                # Dark red text for low stock warning
+                return _LOW_STOCK_FG
+        return None
+
+
+class ActionsDelegate(QStyledItemDelegate):
+    """Paints the edit/stock/delete buttons of the Actions column
+
+    One delegate serves every row: the buttons are drawn rather than
+    created as widgets, and a click is resolved to its button by position.
+    """
+
+    # Emitted with the action name ("edit", "stock" or "delete") and product id
+    actionTriggered = pyqtSignal(str, int)
+
+    # (action, glyph, background colour) for each button, left to right
+    BUTTONS = (
+        ("edit", "✏️", PALETTE["accent"]),
+        ("stock", "📦", PALETTE["accent_light"]),
+        ("delete", "🗑️", PALETTE["fg"]),
+    )
+    BUTTON_WIDTH = 30
+    SPACING = 2
+    MARGIN = 2
+
+    def button_rects(self, rect: QRect) -> list:
+        """Return the rect of each button inside a cell rect"""
+        # Buttons sit side by side, centred in the cell
+        count = len(self.BUTTONS)
+        width = count * self.BUTTON_WIDTH + (count - 1) * self.SPACING
+        left = rect.left() + max(self.MARGIN, (rect.width() - width) // 2)
+        # Fill the cell height apart from the margins
+        top = rect.top() + self.MARGIN
+        height = rect.height() - 2 * self.MARGIN
+        return [QRect(left + i * (self.BUTTON_WIDTH + self.SPACING), top,
+                      self.BUTTON_WIDTH, height)
+                for i in range(count)]
+
+    def paint(self, painter, option, index):
+        # Draw the cell background and selection as usual
+        super().paint(painter, option, index)
+        painter.save()
+        # Smooth the rounded button corners
+        painter.setRenderHint(QPainter.Antialiasing)
+        for rect, (_, glyph, colour) in zip(self.button_rects(option.rect), self.BUTTONS):
+            # Rounded button background
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(colour)
+            painter.drawRoundedRect(rect, 3, 3)
+            # Emoji glyph centred on the button
+            painter.setPen(PALETTE["bg"])
+            painter.drawText(rect, Qt.AlignCenter, glyph)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        # Only a left-button release counts as a click
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            for rect, (action, _, _) in zip(self.button_rects(option.rect), self.BUTTONS):
+                if rect.contains(event.pos()):
+                    # Report which button of which product was clicked
+                    self.actionTriggered.emit(action, index.data(Qt.UserRole))
+                    return True
+        return super().editorEvent(event, model, option, index)
 
 
 class InventoryPage(QWidget):
@@ -16,6 +683,27 @@ class InventoryPage(QWidget):
     def __init__(self):
         # Initialize the parent QWidget class
         super().__init__()
+        # Id of the latest fetch; results of older fetches are dropped
+        self._fetch_id = 0
+        # What the table lists: ("all",), ("low_stock",) or
+        # ("filter", search text, category), set when a fetch is shown
+        self._listing = ("all",)
+        # Listing the latest fetch will show once it arrives
+        self._fetch_listing = ("all",)
+        # Summary statistics shown, kept current as single products change
+        self._inventory_value = None
+        # Summary label texts last shown, to skip unchanged updates
+        self._last_summary = None
+        # Message box reused by show_styled_message, created on first use
+        self._msg_box = None
+        # Stock adjustment dialog reused by adjust_stock, created on first use
+        self._stock_dialog = None
+        # Recent filter results, keyed by (search text, category)
+        self._filter_cache = lru_cache(maxsize=64)(self._query_filter)
+        # Last full product list and summary, reused until inventory changes
+        self._all_cache = lru_cache(maxsize=1)(self._query_all)
+        # Any product or stock change makes cached results stale
+        app_signals.inventory_updated.connect(self.clear_result_caches)
         # Initialize the user interface components
         self.init_ui()
         # Load inventory data from database
@@ -27,8 +715,10 @@ class InventoryPage(QWidget):
         main_layout = QVBoxLayout()
         # Set spacing between layout items to 10 pixels
         main_layout.setSpacing(10)
-        # Set light cream background color for the entire widget
-        self.setStyleSheet("background-color: #EBF4DD;")
+        # Name the page so its stylesheet rules are scoped to it
+        self.setObjectName("inventoryPage")
+        # Apply the page-wide stylesheet once; child widgets are styled by object name
+        self.setStyleSheet(STYLESHEET)
 
         # Header section with title
         header_layout = QHBoxLayout()
@@ -37,8 +727,8 @@ class InventoryPage(QWidget):
         title = QLabel("Inventory Management")
         # Set font to Arial, 16pt, Bold
         title.setFont(QFont("Arial", 16, QFont.Bold))
-        # Apply medium green color and remove border
-        title.setStyleSheet("color: #5A7863; border: none;")
+        # Name the widget for its page stylesheet rule
+        title.setObjectName("inventoryTitle")
 
         # Add title to header layout
         header_layout.addWidget(title)
@@ -60,22 +750,15 @@ class InventoryPage(QWidget):
         self.search_input = QLineEdit()
         # Set placeholder text for search field
         self.search_input.setPlaceholderText("Search products...")
-        # Connect text change event to search function
-        self.search_input.textChanged.connect(self.search_products)
-        # Apply styling with cream background and sage border
-        self.search_input.setStyleSheet("""
-            QLineEdit {
-                background-color: #EBF4DD;
-                border: 2px solid #90AB8B;
-                border-radius: 5px;
-                padding: 8px;
-                color: #3B4953;
-                font-size: 11pt;
-            }
-            QLineEdit:focus {
-                border: 2px solid #5A7863;
-            }
-        """)
+        # Single-shot timer so a burst of keystrokes runs one search
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DELAY_MS)
+        self._search_timer.timeout.connect(self.apply_filters)
+        # Restart the search delay on every text change
+        self.search_input.textChanged.connect(lambda _: self._search_timer.start())
+        # Name the widget for its page stylesheet rule
+        self.search_input.setObjectName("inventorySearch")
 
         # Create category filter dropdown
         self.category_filter = QComboBox()
@@ -84,40 +767,19 @@ class InventoryPage(QWidget):
         # Add all product categories from constants
         self.category_filter.addItems(PRODUCT_CATEGORIES)
         # Connect selection change event to filter function
-        self.category_filter.currentTextChanged.connect(self.filter_by_category)
-        # Apply sage green styling to dropdown
-        self.category_filter.setStyleSheet("""
-            QComboBox {
-                padding: 8px;
-                font-weight: bold;
-                background-color: #EBF4DD;
-                border: 2px solid #90AB8B;
-                border-radius: 5px;
-                color: #3B4953;
-                min-width: 150px;
-            }
-            QComboBox:focus {
-                border: 2px solid #5A7863;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #EBF4DD;
-                selection-background-color: #90AB8B;
-                selection-color: #EBF4DD;
-            }
-        """)
+        self.category_filter.currentTextChanged.connect(self.apply_filters)
+        # Name the widget for its page stylesheet rule
+        self.category_filter.setObjectName("categoryFilter")
 
         # Create "Search:" label
         search_label = QLabel("Search:")
-        # Apply dark text color and bold font
-        search_label.setStyleSheet("color: #3B4953; font-weight: bold;")
+        # Name the widget for its page stylesheet rule
+        search_label.setObjectName("filterLabel")
 
         # Create "Category:" label
         category_label = QLabel("Category:")
-        # Apply dark text color and bold font
-        category_label.setStyleSheet("color: #3B4953; font-weight: bold;")
+        # Name the widget for its page stylesheet rule
+        category_label.setObjectName("filterLabel")
 
         # Add search label to layout
         search_layout.addWidget(search_label)
@@ -128,55 +790,56 @@ class InventoryPage(QWidget):
         # Add category dropdown to layout
         search_layout.addWidget(self.category_filter)
 
+        # Create label shown while products are being fetched
+        self.loading_label = QLabel("Loading...")
+        # Name the widget for its page stylesheet rule
+        self.loading_label.setObjectName("loadingLabel")
+        # Hidden until a fetch starts
+        self.loading_label.hide()
+        # Add loading label to layout
+        search_layout.addWidget(self.loading_label)
+
         # Add search layout to main layout
         main_layout.addLayout(search_layout)
 
-        # Create inventory table widget
-        self.inventory_table = QTableWidget()
-        # Set number of columns to 10 (REMOVED DISCOUNT & SELLING PRICE)
-        self.inventory_table.setColumnCount(10)
-        # Set column headers (NO DISCOUNT OR SELLING PRICE)
-        self.inventory_table.setHorizontalHeaderLabels([
-            "ID", "Name", "Category", "HSN", "Batch No.", "Expiry", "MRP", 
-            "Stock", "Min Stock", "Actions"
-        ])
-
+        # Create inventory table view over the product model
+        self.inventory_table = QTableView()
+        # Model holding the products; its headers exclude discount & selling price
+        self.product_model = ProductTableModel(self)
+        # Attach the model to the view
+        self.inventory_table.setModel(self.product_model)
+        # One delegate paints the action buttons for every row
+        self.actions_delegate = ActionsDelegate(self.inventory_table)
+        self.inventory_table.setItemDelegateForColumn(
+            ProductTableModel.ACTIONS_COLUMN, self.actions_delegate)
+        # Queued so the handlers (which may reload the model) run after the click
+        self.actions_delegate.actionTriggered.connect(self.on_action, Qt.QueuedConnection)
+
+        # Give every row the same fixed height so rows are never measured
+        vertical_header = self.inventory_table.verticalHeader()
+        vertical_header.setSectionResizeMode(QHeaderView.Fixed)
+        vertical_header.setDefaultSectionSize(ROW_HEIGHT)
+        # Fix the width of every column but Name
+        horizontal_header = self.inventory_table.horizontalHeader()
+        horizontal_header.setSectionResizeMode(QHeaderView.Fixed)
+        horizontal_header.setDefaultSectionSize(COLUMN_WIDTH)
         # Make "Name" column stretch to fill available space
-        self.inventory_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
+        horizontal_header.setSectionResizeMode(1, QHeaderView.Stretch)
         # Disable editing of table cells
-        self.inventory_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.inventory_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         # Select entire rows when clicking
-        self.inventory_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.inventory_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         # Enable alternating row colors
         self.inventory_table.setAlternatingRowColors(True)
         # Hide the ID column (column 0)
         self.inventory_table.hideColumn(0)
-        # Apply table styling with sage green theme
-        self.inventory_table.setStyleSheet("""
-            QTableWidget {
-                background-color: #EBF4DD;
-                alternate-background-color: #EBF4DD;
-                border: 2px solid #90AB8B;
-                border-radius: 8px;
-                gridline-color: #90AB8B;
-                color: #3B4953;
-            }
-            QTableWidget::item {
-                padding: 5px;
-            }
-            QTableWidget::item:selected {
-                background-color: #90AB8B;
-                color: #EBF4DD;
-            }
-            QHeaderView::section {
-                background-color: #5A7863;
-                color: #EBF4DD;
-                padding: 10px;
-                border: none;
-                font-weight: bold;
-                font-size: 11pt;
-            }
-        """)
+        # Sort on header clicks; no column is sorted until one is picked
+        horizontal_header.setSortIndicator(-1, Qt.AscendingOrder)
+        self.inventory_table.setSortingEnabled(True)
+        # Keep the sort arrow off the Actions column
+        horizontal_header.sortIndicatorChanged.connect(self.on_sort_indicator_changed)
+        # Name the widget for its page stylesheet rule
+        self.inventory_table.setObjectName("inventoryTable")
 
         # Add inventory table to main layout
         main_layout.addWidget(self.inventory_table)
@@ -193,73 +856,30 @@ class InventoryPage(QWidget):
         """Create toolbar with action buttons"""
         # Create frame container for toolbar
         toolbar = QFrame()
-        # Apply #EBF4DD background with sage border
-        toolbar.setStyleSheet("""
-            QFrame {
-                background-color: #EBF4DD;
-                border-radius: 8px;
-                padding: 10px;
-                border: 2px solid #90AB8B;
-            }
-        """)
+        # Name the widget for its page stylesheet rule
+        toolbar.setObjectName("inventoryToolbar")
 
         # Create horizontal layout for toolbar
         layout = QHBoxLayout(toolbar)
 
         # Create "Add Product" button with plus icon
         add_btn = QPushButton("➕ Add Product")
-        # Apply medium green background with cream text
-        add_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #5A7863;
-                color: #EBF4DD;
-                padding: 10px 20px;
-                border-radius: 5px;
-                font-weight: bold;
-                font-size: 11pt;
-            }
-            QPushButton:hover {
-                background-color: #90AB8B;
-            }
-        """)
+        # Name the widget for its page stylesheet rule
+        add_btn.setObjectName("addProductButton")
         # Connect click event to add_product method
         add_btn.clicked.connect(self.add_product)
 
         # Create "Refresh" button with refresh icon
         refresh_btn = QPushButton("🔄 Refresh")
-        # Apply sage green background with cream text
-        refresh_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #90AB8B;
-                color: #EBF4DD;
-                padding: 10px 20px;
-                border-radius: 5px;
-                font-weight: bold;
-                font-size: 11pt;
-            }
-            QPushButton:hover {
-                background-color: #5A7863;
-            }
-        """)
-        # Connect click event to load_inventory method
-        refresh_btn.clicked.connect(self.load_inventory)
+        # Name the widget for its page stylesheet rule
+        refresh_btn.setObjectName("refreshButton")
+        # Connect click event to refresh_inventory method
+        refresh_btn.clicked.connect(self.refresh_inventory)
 
         # Create "Low Stock" button with warning icon
         low_stock_btn = QPushButton("⚠️ Low Stock")
-        # Apply dark blue-grey background with cream text
-        low_stock_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3B4953;
-                color: #EBF4DD;
-                padding: 10px 20px;
-                border-radius: 5px;
-                font-weight: bold;
-                font-size: 11pt;
-            }
-            QPushButton:hover {
-                background-color: #5A7863;
-            }
-        """)
+        # Name the widget for its page stylesheet rule
+        low_stock_btn.setObjectName("lowStockButton")
         # Connect click event to show_low_stock method
         low_stock_btn.clicked.connect(self.show_low_stock)
 
@@ -279,15 +899,8 @@ class InventoryPage(QWidget):
         """Create summary section"""
         # Create frame container for summary
         summary = QFrame()
-        # Apply #EBF4DD background with sage border
-        summary.setStyleSheet("""
-            QFrame {
-                background-color: #5A7863;
-                border-radius: 8px;
-                padding: 15px;
-                border: 2px solid #90AB8B;
-            }
-        """)
+        # Name the widget for its page stylesheet rule
+        summary.setObjectName("inventorySummary")
 
         # Create horizontal layout for summary items
         layout = QHBoxLayout(summary)
@@ -296,22 +909,16 @@ class InventoryPage(QWidget):
         self.total_products_label = QLabel("Total Products: 0")
         # Set font to Arial, 11pt, Bold
         self.total_products_label.setFont(QFont("Arial", 11, QFont.Bold))
-        # Apply dark text color
-        self.total_products_label.setStyleSheet("color: #EBF4DD;")
 
         # Create label for total stock quantity
         self.total_stock_label = QLabel("Total Stock: 0")
         # Set font to Arial, 11pt, Bold
         self.total_stock_label.setFont(QFont("Arial", 11, QFont.Bold))
-        # Apply dark text color
-        self.total_stock_label.setStyleSheet("color: #EBF4DD;")
 
         # Create label for inventory value in rupees
         self.inventory_value_label = QLabel("Inventory Value: ₹0.00")
         # Set font to Arial, 11pt, Bold
         self.inventory_value_label.setFont(QFont("Arial", 11, QFont.Bold))
-        # Apply medium green color to highlight value
-        self.inventory_value_label.setStyleSheet("color: #EBF4DD; font-weight: bold;")
 
         # Add total products label to layout
         layout.addWidget(self.total_products_label)
@@ -325,144 +932,224 @@ class InventoryPage(QWidget):
         # Return the configured summary frame
         return summary
 
+    def refresh_inventory(self):
+        """Drop cached results and reload inventory from the database"""
+        # Forget cached results so they are re-queried
+        self.clear_result_caches()
+        # Reload the full product list
+        self.load_inventory()
+
+    def clear_result_caches(self):
+        """Forget cached full, search and category results"""
+        # Clear cached full product list and summary
+        self._all_cache.cache_clear()
+        # Clear cached filter results
+        self._filter_cache.cache_clear()
+
+    def _query_filter(self, search_text: str, category) -> tuple:
+        """Run a search and/or category query (cached through _filter_cache)"""
+        return tuple(inventory_manager.query_products(search_text, category))
+
+    def _query_all(self) -> tuple:
+        """Fetch all products with the summary statistics (cached through _all_cache)"""
+        # One query; the totals are worked out from the fetched rows
+        products = inventory_manager.get_all_products()
+        inventory_value = {
+            'total_products': len(products),
+            'total_stock': sum(p['current_stock'] for p in products),
+            'selling_value': sum(p['current_stock'] * (p['selling_price'] or 0) for p in products),
+        }
+        return tuple(products), inventory_value
+
+    def start_fetch(self, kind: str, fetch, listing: tuple = None):
+        """Run fetch in the thread pool; the result arrives in on_fetch_finished
+
+        listing describes what the result lists (see _listing); it
+        defaults to (kind,).
+        """
+        # A new fetch supersedes any still in flight
+        self._fetch_id += 1
+        # Remember what this fetch lists, for patching rows later
+        self._fetch_listing = listing or (kind,)
+        # Create the worker task for this fetch
+        task = InventoryFetchTask(self._fetch_id, kind, fetch)
+        # Deliver the result back on the GUI thread
+        task.signals.finished.connect(self.on_fetch_finished)
+        # Show the loading indicator while the query runs
+        self.loading_label.show()
+        # Start the query in a worker thread
+        QThreadPool.globalInstance().start(task)
+
+    def on_fetch_finished(self, request_id: int, kind: str, result):
+        """Show the result of a finished fetch"""
+        # Ignore results of fetches that were superseded
+        if request_id != self._fetch_id:
+            return
+        # Nothing is in flight any more
+        self.loading_label.hide()
+        # The query failed; the error was already logged by the task
+        if result is None:
+            return
+
+        if kind == "all":
+            # Full reload: products plus summary statistics
+            products, summary = result
+            # Copy the summary; single-product patches adjust it in place
+            self._inventory_value = dict(summary)
+            # Display products in the table
+            self.display_products(products)
+            self._listing = self._fetch_listing
+            # Update summary statistics
+            self.update_summary(self._inventory_value)
+        elif kind == "low_stock":
+            # Check if no low stock products found
+            if not result:
+                # Show information message
+                self.show_styled_message("Low Stock", "No products with low stock", QMessageBox.Information)
+                # Exit function
+                return
+            # Display low stock products in table
+            self.display_products(result)
+            self._listing = self._fetch_listing
+            # Drop any search still waiting to run over the low stock list
+            self._search_timer.stop()
+            # Reset the filters without re-running a query for each of them
+            self.search_input.blockSignals(True)
+            self.category_filter.blockSignals(True)
+            # Clear search input field
+            self.search_input.clear()
+            # Reset category filter to "All Categories"
+            self.category_filter.setCurrentIndex(0)
+            self.search_input.blockSignals(False)
+            self.category_filter.blockSignals(False)
+        else:
+            # Search and/or category results
+            self.display_products(result)
+            self._listing = self._fetch_listing
+
     def load_inventory(self):
         """Load inventory data"""
-        # Fetch all products from inventory manager
-        products = inventory_manager.get_all_products()
-        # Display products in the table
-        self.display_products(products)
-        # Update summary statistics
-        self.update_summary()
+        # Fetch all products and the summary in a worker thread (cached)
+        self.start_fetch("all", self._all_cache)
 
     def display_products(self, products):
         """Display products in table"""
-        # Set table row count to match number of products
-        self.inventory_table.setRowCount(len(products))
-
-        # Loop through each product with index
-        for row, product in enumerate(products):
-            # Set ID in column 0 (hidden column)
-            self.inventory_table.setItem(row, 0, QTableWidgetItem(str(product['id'])))
-            # Set product name in column 1
-            self.inventory_table.setItem(row, 1, QTableWidgetItem(product['name']))
-            # Set category in column 2
-            self.inventory_table.setItem(row, 2, QTableWidgetItem(product['category']))
-            # Set HSN code in column 3
-            self.inventory_table.setItem(row, 3, QTableWidgetItem(product['hsn_code']))
-            # Set Batch Number in column 4
-            self.inventory_table.setItem(row, 4, QTableWidgetItem(product.get('batch_number', '')))
-            # Set Expiry Date in column 5
-            self.inventory_table.setItem(row, 5, QTableWidgetItem(product.get('expiry_date', '')))
-            # Set MRP with rupee symbol and 2 decimal places in column 6
-            self.inventory_table.setItem(row, 6, QTableWidgetItem(f"₹{product['mrp']:.2f}"))
-
-            # Create stock item for column 7
-            stock_item = QTableWidgetItem(str(product['current_stock']))
-            # Check if stock is at or below minimum level
-            if product['current_stock'] <= product['min_stock_level']:
-                # Set light red background for low stock warning
-                stock_item.setBackground(QColor(255, 200, 200))
-                # Set dark red text for low stock warning
-                stock_item.setForeground(QColor(200, 0, 0))
-            # Set stock item in column 7
-            self.inventory_table.setItem(row, 7, stock_item)
-
-            # Set minimum stock level in column 8
-            self.inventory_table.setItem(row, 8, QTableWidgetItem(str(product['min_stock_level'])))
-
-            # Create widget container for action buttons
-            actions_widget = QWidget()
-            # Create horizontal layout for action buttons
-            actions_layout = QHBoxLayout(actions_widget)
-            # Set minimal margins for compact button layout
-            actions_layout.setContentsMargins(2, 2, 2, 2)
-            # Set spacing between buttons to 2 pixels
-            actions_layout.setSpacing(2)
-
-            # Create edit button with pencil icon
-            edit_btn = QPushButton("✏️")
-            # Set maximum width to 30 pixels for compact size
-            edit_btn.setMaximumWidth(30)
-            # Apply medium green background
-            edit_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #5A7863;
-                    color: #EBF4DD;
-                    border-radius: 3px;
-                }
-                QPushButton:hover {
-                    background-color: #90AB8B;
-                }
-            """)
-            # Connect click event to edit_product method with product data
-            edit_btn.clicked.connect(lambda checked, p=product: self.edit_product(p))
-
-            # Create stock adjustment button with package icon
-            stock_btn = QPushButton("📦")
-            # Set maximum width to 30 pixels
-            stock_btn.setMaximumWidth(30)
-            # Apply sage green background
-            stock_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #90AB8B;
-                    color: #EBF4DD;
-                    border-radius: 3px;
-                }
-                QPushButton:hover {
-                    background-color: #5A7863;
-                }
-            """)
-            # Connect click event to adjust_stock method with product data
-            stock_btn.clicked.connect(lambda checked, p=product: self.adjust_stock(p))
-
-            # Create delete button with trash icon
-            delete_btn = QPushButton("🗑️")
-            # Set maximum width to 30 pixels
-            delete_btn.setMaximumWidth(30)
-            # Apply dark blue-grey background
-            delete_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #3B4953;
-                    color: #3B4953;
-                    border-radius: 3px;
-                }
-                QPushButton:hover {
-                    background-color: #5A7863;
-                }
-            """)
-            # Connect click event to delete_product method with product data
-            delete_btn.clicked.connect(lambda checked, p=product: self.delete_product(p))
-
-            # Add edit button to actions layout
-            actions_layout.addWidget(edit_btn)
-            # Add stock button to actions layout
-            actions_layout.addWidget(stock_btn)
-            # Add delete button to actions layout
-            actions_layout.addWidget(delete_btn)
-
-            # Set actions widget in column 9
-            self.inventory_table.setCellWidget(row, 9, actions_widget)
-
-    def update_summary(self):
-        """Update summary labels"""
+        # Hold repaints while the model resets and the view re-lays out
+        self.inventory_table.setUpdatesEnabled(False)
         try:
-            # Fetch inventory value statistics from inventory manager
-            inventory_value = inventory_manager.get_inventory_value()
+            # Hand the products to the model; cells are formatted per page
+            self.product_model.set_products(products)
+        finally:
+            # Paint the new rows once
+            self.inventory_table.setUpdatesEnabled(True)
+            self.inventory_table.viewport().update()
+
+    def on_sort_indicator_changed(self, column: int, order):
+        """Put the sort arrow back if the Actions header was clicked"""
+        if column == ProductTableModel.ACTIONS_COLUMN:
+            # The model ignored the click, so show the order it still has
+            self.inventory_table.horizontalHeader().setSortIndicator(*self.product_model.sort_state())
+
+    def on_action(self, action: str, product_id: int):
+        """Run the action of a clicked button for the product it belongs to"""
+        # Look the product up by id; the rows may have changed since the click
+        row = self.product_model.row_of(product_id)
+        # Ignore clicks on products that went away before the handler ran
+        if row < 0:
+            return
+        # Product the clicked button belongs to
+        product = self.product_model.product_at(row)
+        if action == "edit":
+            self.edit_product(product)
+        elif action == "stock":
+            self.adjust_stock(product)
+        elif action == "delete":
+            self.delete_product(product)
+
+    def apply_summary_change(self, old: dict, new: dict):
+        """Adjust the summary for one product going from old to new
+
+        Either side may be None for an added or deleted product.
+        """
+        # Nothing to adjust until the first full load has arrived
+        if self._inventory_value is None:
+            return
+        value = self._inventory_value
+        # Take the old product out of the totals
+        if old:
+            value['total_products'] -= 1
+            value['total_stock'] -= old['current_stock']
+            value['selling_value'] -= old['current_stock'] * (old['selling_price'] or 0)
+        # Add the new product to the totals
+        if new:
+            value['total_products'] += 1
+            value['total_stock'] += new['current_stock']
+            value['selling_value'] += new['current_stock'] * (new['selling_price'] or 0)
+        # Show the adjusted totals
+        self.update_summary(value)
+
+    def patch_product(self, old: dict, product_id: int):
+        """Show a changed product without reloading the whole list"""
+        # Re-read just the changed product
+        product = inventory_manager.get_product_by_id(product_id)
+        if product is None:
+            # Fall back to a full reload if it cannot be read back
+            self.load_inventory()
+            return
+        # The summary covers the whole inventory, whatever is listed
+        self.apply_summary_change(old, product)
+        listing = self._listing
+        if listing[0] == "filter" and listing[1]:
+            # Search matches are decided by the database (barcode, full-text
+            # and LIKE stages), so re-run the search instead of guessing
+            self.apply_filters()
+            return
+        if listing[0] == "low_stock":
+            # Restocked products leave the low stock list
+            listed = ProductTableModel.is_low_stock(product)
+        elif listing[0] == "filter":
+            # Category filter without search text
+            listed = product['category'] == listing[2]
+        else:
+            listed = True
+        if not listed:
+            # Drop the product if it no longer matches (no-op if not shown)
+            self.product_model.remove_product(product_id)
+        elif old is None:
+            # Newly added product goes at its place in the header sort (else the end)
+            self.product_model.insert_product(product)
+        else:
+            # Repaint the product's existing row
+            self.product_model.update_product(product)
 
-            # Safely get total products with default 0 if None
-            total_products = inventory_value.get('total_products') if inventory_value.get('total_products') is not None else 0
-            # Safely get total stock with default 0 if None
-            total_stock = inventory_value.get('total_stock') if inventory_value.get('total_stock') is not None else 0
-            # Safely get selling value with default 0.0 if None
-            selling_value = inventory_value.get('selling_value') if inventory_value.get('selling_value') is not None else 0.0
+    def update_summary(self, inventory_value: dict):
+        """Update summary labels from inventory value statistics"""
+        try:
+            # Get total products, 0 if missing or None
+            total_products = inventory_value.get('total_products') or 0
+            # Get total stock, 0 if missing or None
+            total_stock = inventory_value.get('total_stock') or 0
+            # Get selling value, 0.0 if missing or None
+            selling_value = inventory_value.get('selling_value') or 0.0
+
+            # Render the label texts (value with rupee symbol and 2 decimals)
+            texts = (f"Total Products: {total_products}",
+                     f"Total Stock: {total_stock}",
+                     f"Inventory Value: ₹{selling_value:.2f}")
+            # Leave the labels alone if the shown totals have not changed
+            if texts == self._last_summary:
+                return
+            self._last_summary = texts
 
             # Update total products label with fetched value
-            self.total_products_label.setText(f"Total Products: {total_products}")
+            self.total_products_label.setText(texts[0])
             # Update total stock label with fetched value
-            self.total_stock_label.setText(f"Total Stock: {total_stock}")
-            # Update inventory value label with rupee symbol and 2 decimals
-            self.inventory_value_label.setText(f"Inventory Value: ₹{selling_value:.2f}")
+            self.total_stock_label.setText(texts[1])
+            # Update inventory value label
+            self.inventory_value_label.setText(texts[2])
         except Exception as e:
+            # Labels no longer match any rendered summary
+            self._last_summary = None
             # Log error message if update fails
             logger.error(f"Error updating summary: {e}")
             # Set total products to 0 on error
@@ -472,37 +1159,25 @@ class InventoryPage(QWidget):
             # Set inventory value to 0.00 on error
             self.inventory_value_label.setText("Inventory Value: ₹0.00")
 
-    def search_products(self):
-        """Search products"""
+    def apply_filters(self):
+        """Show the products matching both the search text and the category"""
         # Get search text from input and remove whitespace
         search_text = self.search_input.text().strip()
+        # Get selected category; "All Categories" means no category filter
+        category = self.category_filter.currentText()
+        if category == "All Categories":
+            category = None
 
-        # Check if search text is empty
-        if not search_text:
-            # Load all inventory if search is empty
+        # Check if neither filter is set
+        if not search_text and not category:
+            # Load all inventory (with the summary) if nothing is filtered
             self.load_inventory()
             # Exit function
             return
 
-        # Search products using inventory manager
-        products = inventory_manager.search_products(search_text)
-        # Display filtered products in table
-        self.display_products(products)
-
-    def filter_by_category(self):
-        """Filter products by category"""
-        # Get selected category from dropdown
-        category = self.category_filter.currentText()
-        # Check if "All Categories" is selected
-        if category == "All Categories":
-            # Get all products without category filter
-            products = inventory_manager.get_all_products()
-        else:
-            # Get products filtered by selected category
-            products = inventory_manager.get_all_products(category)
-
-        # Display filtered products in table
-        self.display_products(products)
+        # Query both filters at once in a worker thread, reusing a recent identical query
+        self.start_fetch("filter", lambda: self._filter_cache(search_text, category),
+                         ("filter", search_text, category))
 
     def add_product(self):
         """Open add product dialog"""
@@ -520,8 +1195,8 @@ class InventoryPage(QWidget):
             if success:
                 # Show success message to user
                 self.show_styled_message("Success", message, QMessageBox.Information)
-                # Reload inventory to show new product
-                self.load_inventory()
+                # Show the new product without reloading the list
+                self.patch_product(None, product_id)
             else:
                 # Show error message to user
                 self.show_styled_message("Error", message, QMessageBox.Warning)
@@ -542,16 +1217,20 @@ class InventoryPage(QWidget):
             if success:
                 # Show success message to user
                 self.show_styled_message("Success", message, QMessageBox.Information)
-                # Reload inventory to show updated product
-                self.load_inventory()
+                # Repaint just the updated product's row
+                self.patch_product(product, product['id'])
             else:
                 # Show error message to user
                 self.show_styled_message("Error", message, QMessageBox.Warning)
 
     def adjust_stock(self, product):
         """Open stock adjustment dialog"""
-        # Create stock adjustment dialog with product data
-        dialog = StockAdjustmentDialog(self, product)
+        # Build the stock adjustment dialog once and reuse it for every product
+        if self._stock_dialog is None:
+            self._stock_dialog = StockAdjustmentDialog(self)
+        dialog = self._stock_dialog
+        # Point the dialog at this product
+        dialog.reset(product)
 
         # Check if user clicked Save button
         if dialog.exec_() == QDialog.Accepted:
@@ -566,8 +1245,8 @@ class InventoryPage(QWidget):
             if success:
                 # Show success message to user
                 self.show_styled_message("Success", message, QMessageBox.Information)
-                # Reload inventory to show updated stock
-                self.load_inventory()
+                # Repaint just the adjusted product's row
+                self.patch_product(product, product['id'])
             else:
                 # Show error message to user
                 self.show_styled_message("Error", message, QMessageBox.Warning)
@@ -597,69 +1276,39 @@ class InventoryPage(QWidget):
             if success:
                 # Show success message to user
                 self.show_styled_message("Success", message, QMessageBox.Information)
-                # Reload inventory to remove deleted product
-                self.load_inventory()
+                # Drop just the deleted product's row
+                self.product_model.remove_product(product['id'])
+                # Take it out of the summary
+                self.apply_summary_change(product, None)
             else:
                 # Show error message to user
                 self.show_styled_message("Error", message, QMessageBox.Warning)
 
     def show_low_stock(self):
         """Show low stock products"""
-        # Get list of low stock products from inventory manager
-        low_stock = inventory_manager.get_low_stock_products()
-
-        # Check if no low stock products found
-        if not low_stock:
-            # Show information message
-            self.show_styled_message("Low Stock", "No products with low stock", QMessageBox.Information)
-            # Exit function
-            return
-
-        # Display low stock products in table
-        self.display_products(low_stock)
-        # Clear search input field
-        self.search_input.clear()
-        # Reset category filter to "All Categories"
-        self.category_filter.setCurrentIndex(0)
+        # Fetch low stock products in a worker thread
+        self.start_fetch("low_stock", inventory_manager.get_low_stock_products)
 
     def show_styled_message(self, title: str, message: str, icon=QMessageBox.Information):
         """Show styled message box"""
-        # Create message box with this widget as parent
-        msg_box = QMessageBox(self)
+        # Build the styled message box on first use and reuse it afterwards
+        if self._msg_box is None:
+            # Create message box with this widget as parent
+            self._msg_box = QMessageBox(self)
+            # Apply consistent styling once
+            self._msg_box.setStyleSheet(self.get_message_box_style())
         # Set message box icon (Information, Warning, etc.)
-        msg_box.setIcon(icon)
+        self._msg_box.setIcon(icon)
         # Set window title
-        msg_box.setWindowTitle(title)
+        self._msg_box.setWindowTitle(title)
         # Set message text
-        msg_box.setText(message)
-        # Apply consistent styling
-        msg_box.setStyleSheet(self.get_message_box_style())
+        self._msg_box.setText(message)
         # Show message box and wait for user response
-        msg_box.exec_()
+        self._msg_box.exec_()
 
     def get_message_box_style(self) -> str:
         """Get consistent message box styling"""
-        # Return CSS stylesheet for message boxes
-        return """
-            QMessageBox {
-                background-color: #3B4953;
-            }
-            QLabel {
-                color: #3B4953;
-                font-size: 11pt;
-            }
-            QPushButton {
-                background-color: #3B4953;
-                color: white;
-                padding: 8px 20px;
-                border-radius: 5px;
-                font-weight: bold;
-                min-width: 80px;
-            }
-            QPushButton:hover {
-                background-color: white;
-            }
-        """
+        return MESSAGE_BOX_STYLE
 
 
 class ProductDialog(QDialog):
@@ -677,72 +1326,51 @@ class ProductDialog(QDialog):
 
     def init_ui(self):
         """Initialize dialog UI"""
+        # Existing product values; empty in add mode so fields get their defaults
+        p = self.product or {}
         # Set window title based on mode (Edit or Add)
         self.setWindowTitle("Edit Product" if self.is_edit else "Add Product")
         # Set minimum dialog width to 500 pixels
         self.setMinimumWidth(500)
-        # Apply cream background to dialog
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #EBF4DD;
-            }
-            QLabel {
-                color: #3B4953;
-                font-weight: bold;
-            }
-        """)
+        # Styled by the parent page's stylesheet through this object name
+        self.setObjectName("productDialog")
 
-        # Create form layout for input fields
-        layout = QFormLayout()
+        # Create grid layout for input fields: labels in column 0, fields in column 1
+        layout = QGridLayout()
         # Set spacing between form rows
         layout.setSpacing(10)
 
         # Product name input field
-        self.name_input = QLineEdit()
-        # If editing, populate with existing product name
-        if self.product:
-            self.name_input.setText(self.product['name'])
-        # Apply input field styling
-        self.name_input.setStyleSheet(self.get_input_style())
+        # Built with the existing product name (blank when adding)
+        self.name_input = QLineEdit(p.get('name', ''))
         # Add product name field to form with label
-        layout.addRow("Product Name: *", self.name_input)
+        self.add_form_row(layout, "Product Name: *", self.name_input)
 
         # Category dropdown
         self.category_combo = QComboBox()
-        # Add all product categories to dropdown
-        self.category_combo.addItems(PRODUCT_CATEGORIES)
-        # If editing, select existing category
-        if self.product:
-            # Find index of product's category in dropdown
-            index = self.category_combo.findText(self.product['category'])
-            # If category found, select it
-            if index >= 0:
-                self.category_combo.setCurrentIndex(index)
-        # Apply dropdown styling
-        self.category_combo.setStyleSheet(self.get_combo_style())
+        # List the product categories from the model shared by every dialog
+        self.category_combo.setModel(combo_model(tuple(PRODUCT_CATEGORIES)))
+        # Look up index of product's category in dropdown
+        index = _CATEGORY_INDEX.get(p.get('category'), -1)
+        # If editing and category found, select it
+        if index >= 0:
+            self.category_combo.setCurrentIndex(index)
         # Add category field to form with label
-        layout.addRow("Category: *", self.category_combo)
+        self.add_form_row(layout, "Category: *", self.category_combo)
 
         # HSN Code input field
-        self.hsn_input = QLineEdit()
-        # If editing, use existing HSN, otherwise use default
-        self.hsn_input.setText(self.product['hsn_code'] if self.product else DEFAULT_HSN_CODE)
-        # Apply input field styling
-        self.hsn_input.setStyleSheet(self.get_input_style())
+        # Built with the existing HSN when editing, otherwise the default
+        self.hsn_input = QLineEdit(p.get('hsn_code', DEFAULT_HSN_CODE))
         # Add HSN code field to form with label
-        layout.addRow("HSN Code:", self.hsn_input)
+        self.add_form_row(layout, "HSN Code:", self.hsn_input)
 
         # Batch Number input field (NOW MANDATORY)
-        self.batch_input = QLineEdit()
-        # If editing and batch number exists, populate field
-        if self.product and self.product.get('batch_number'):
-            self.batch_input.setText(self.product['batch_number'])
+        # Built with the existing batch number, if any
+        self.batch_input = QLineEdit(p.get('batch_number') or '')
         # Set placeholder text
         self.batch_input.setPlaceholderText("Enter batch number")
-        # Apply input field styling
-        self.batch_input.setStyleSheet(self.get_input_style())
         # Add batch number field to form with label (ASTERISK FOR REQUIRED)
-        layout.addRow("Batch Number: *", self.batch_input)
+        self.add_form_row(layout, "Batch Number: *", self.batch_input)
 
         # Expiry Date picker (NOW MANDATORY)
         self.expiry_input = QDateEdit()
@@ -751,10 +1379,10 @@ class ProductDialog(QDialog):
         # Set date display format
         self.expiry_input.setDisplayFormat("dd-MM-yyyy")
         # If editing and expiry date exists, populate field
-        if self.product and self.product.get('expiry_date'):
+        if p.get('expiry_date'):
             try:
                 # Parse date from database (YYYY-MM-DD format)
-                date_parts = self.product['expiry_date'].split('-')
+                date_parts = p['expiry_date'].split('-')
                 self.expiry_input.setDate(QDate(int(date_parts[0]), int(date_parts[1]), int(date_parts[2])))
             except:
                 # If parsing fails, set to 2 years from now
@@ -762,104 +1390,66 @@ class ProductDialog(QDialog):
         else:
             # Set default to 2 years from now
             self.expiry_input.setDate(QDate.currentDate().addYears(2))
-        # Apply date picker styling
-        self.expiry_input.setStyleSheet(self.get_date_style())
         # Add expiry date field to form with label (ASTERISK FOR REQUIRED)
-        layout.addRow("Expiry Date: *", self.expiry_input)
+        self.add_form_row(layout, "Expiry Date: *", self.expiry_input)
 
         # Unit dropdown
         self.unit_combo = QComboBox()
-        # Add all unit types to dropdown
-        self.unit_combo.addItems(UNITS)
-        # If editing, select existing unit
-        if self.product:
-            # Find index of product's unit in dropdown
-            index = self.unit_combo.findText(self.product['unit'])
-            # If unit found, select it
-            if index >= 0:
-                self.unit_combo.setCurrentIndex(index)
-        # Apply dropdown styling
-        self.unit_combo.setStyleSheet(self.get_combo_style())
+        # List the unit types from the model shared by every dialog
+        self.unit_combo.setModel(combo_model(tuple(UNITS)))
+        # Look up index of product's unit in dropdown
+        index = _UNIT_INDEX.get(p.get('unit'), -1)
+        # If editing and unit found, select it
+        if index >= 0:
+            self.unit_combo.setCurrentIndex(index)
         # Add unit field to form with label
-        layout.addRow("Unit:", self.unit_combo)
+        self.add_form_row(layout, "Unit:", self.unit_combo)
 
         # Package size input field
-        self.package_input = QLineEdit()
-        # If editing and package size exists, populate field
-        if self.product and self.product.get('package_size'):
-            self.package_input.setText(self.product['package_size'])
+        # Built with the existing package size, if any
+        self.package_input = QLineEdit(p.get('package_size') or '')
         # Set placeholder text as example
         self.package_input.setPlaceholderText("e.g., 30 Nos, 100 ml")
-        # Apply input field styling
-        self.package_input.setStyleSheet(self.get_input_style())
         # Add package size field to form with label
-        layout.addRow("Package Size:", self.package_input)
-
-        # MRP (Maximum Retail Price) spin box
-        self.mrp_input = QDoubleSpinBox()
-        # Set maximum value to 999999.99
-        self.mrp_input.setMaximum(999999.99)
-        # Set decimal places to 2
-        self.mrp_input.setDecimals(2)
-        # Set rupee symbol prefix
-        self.mrp_input.setPrefix("₹ ")
-        # If editing, populate with existing MRP
-        if self.product:
-            self.mrp_input.setValue(self.product['mrp'])
-        # Apply spin box styling
-        self.mrp_input.setStyleSheet(self.get_spinbox_style())
-        # Add MRP field to form with label
-        layout.addRow("MRP: *", self.mrp_input)
-
-        # Purchase price spin box
-        self.purchase_price_input = QDoubleSpinBox()
-        # Set maximum value to 999999.99
-        self.purchase_price_input.setMaximum(999999.99)
-        # Set decimal places to 2
-        self.purchase_price_input.setDecimals(2)
-        # Set rupee symbol prefix
-        self.purchase_price_input.setPrefix("₹ ")
-        # If editing, populate with existing purchase price
-        if self.product:
-            self.purchase_price_input.setValue(self.product.get('purchase_price', 0))
-        # Apply spin box styling
-        self.purchase_price_input.setStyleSheet(self.get_spinbox_style())
-        # Add purchase price field to form with label
-        layout.addRow("Purchase Price:", self.purchase_price_input)
-
-        # Minimum stock level spin box
-        self.min_stock_input = QSpinBox()
-        # Set maximum value to 99999
-        self.min_stock_input.setMaximum(99999)
-        # If editing, use existing min stock, otherwise default 10
-        self.min_stock_input.setValue(self.product['min_stock_level'] if self.product else 10)
-        # Apply spin box styling
-        self.min_stock_input.setStyleSheet(self.get_spinbox_style())
-        # Add min stock field to form with label
-        layout.addRow("Min Stock Level:", self.min_stock_input)
-
-        # Initial stock field (only shown when adding new product)
-        if not self.is_edit:
-            # Create spin box for initial stock quantity
-            self.initial_stock_input = QSpinBox()
-            # Set maximum value to 99999
-            self.initial_stock_input.setMaximum(99999)
-            # Set default value to 0
-            self.initial_stock_input.setValue(0)
-            # Apply spin box styling
-            self.initial_stock_input.setStyleSheet(self.get_spinbox_style())
-            # Add initial stock field to form with label
-            layout.addRow("Initial Stock:", self.initial_stock_input)
+        self.add_form_row(layout, "Package Size:", self.package_input)
+
+        # Price fields (MRP, purchase price): plain line edits limited to prices
+        for attr, label, key in PRICE_FIELDS:
+            field = QLineEdit()
+            # Accept 0 to 999999.99 with at most 2 decimal places
+            field.setValidator(price_validator())
+            # Show the rupee hint while the field is empty
+            field.setPlaceholderText("₹ 0.00")
+            # Populate with existing price (blank when adding or unset)
+            price = p.get(key)
+            field.setText(f"{price:.2f}" if price else '')
+            # Keep the field as e.g. self.mrp_input
+            setattr(self, attr, field)
+            # Add price field to form with label
+            self.add_form_row(layout, label, field)
+
+        # Stock level spin boxes (min stock, and initial stock when adding)
+        for attr, label, key, default, add_only in STOCK_FIELDS:
+            # Initial stock is only shown when adding a new product
+            if add_only and self.is_edit:
+                continue
+            spin = QSpinBox()
+            # Allow 0 to 99999
+            spin.setRange(0, 99999)
+            # Emit valueChanged once on commit rather than per typed digit
+            spin.setKeyboardTracking(False)
+            # If editing, use existing value, otherwise the default
+            spin.setValue(p.get(key, default))
+            # Keep the spin box as e.g. self.min_stock_input
+            setattr(self, attr, spin)
+            # Add stock field to form with label
+            self.add_form_row(layout, label, spin)
 
         # Description input field
-        self.description_input = QLineEdit()
-        # If editing and description exists, populate field
-        if self.product and self.product.get('description'):
-            self.description_input.setText(self.product['description'])
-        # Apply input field styling
-        self.description_input.setStyleSheet(self.get_input_style())
+        # Built with the existing description, if any
+        self.description_input = QLineEdit(p.get('description') or '')
         # Add description field to form with label
-        layout.addRow("Description:", self.description_input)
+        self.add_form_row(layout, "Description:", self.description_input)
 
         # Create dialog button box with Save and Cancel buttons
         buttons = QDialogButtonBox(QDialogButtonBox.Save | QDialogButtonBox.Cancel)
@@ -867,31 +1457,24 @@ class ProductDialog(QDialog):
         buttons.accepted.connect(self.validate_and_accept)
         # Connect rejected signal to dialog reject (Cancel button)
         buttons.rejected.connect(self.reject)
-        # Apply button styling
-        buttons.setStyleSheet("""
-            QPushButton {
-                background-color: #5A7863;
-                color: #EBF4DD;
-                padding: 8px 20px;
-                border-radius: 5px;
-                font-weight: bold;
-                min-width: 80px;
-            }
-            QPushButton:hover {
-                background-color: #90AB8B;
-            }
-        """)
 
-        # Add button box to form layout
-        layout.addRow(buttons)
+        # Add button box below the fields, spanning both grid columns
+        layout.addWidget(buttons, layout.count() // 2, 0, 1, 2)
 
-        # Set form layout as dialog layout
+        # Set grid layout as dialog layout
         self.setLayout(layout)
 
+    def add_form_row(self, layout: QGridLayout, text: str, widget: QWidget):
+        """Add a label and its field as the next row of the form grid"""
+        # Every row so far holds exactly two items (label and field)
+        row = layout.count() // 2
+        layout.addWidget(QLabel(text), row, 0)
+        layout.addWidget(widget, row, 1)
+
     def validate_and_accept(self):
         """Validate required fields before accepting"""
         # Check if batch number is empty
-        if not self.batch_input.text().strip():
+        if not field_text(self.batch_input):
             QMessageBox.warning(
                 self,
                 "Validation Error",
@@ -915,34 +1498,36 @@ class ProductDialog(QDialog):
 
     def get_product_data(self):
         """Get product data from form"""
+        # Parse MRP once; it also seeds the selling price
+        mrp = price_value(self.mrp_input)
         # Create dictionary to store form data
         data = {
             # Get product name and remove whitespace
-            'name': self.name_input.text().strip(),
+            'name': field_text(self.name_input),
             # Get selected category
             'category': self.category_combo.currentText(),
             # Get HSN code and remove whitespace
-            'hsn_code': self.hsn_input.text().strip(),
+            'hsn_code': field_text(self.hsn_input),
             # Get selected unit
             'unit': self.unit_combo.currentText(),
             # Get package size and remove whitespace
-            'package_size': self.package_input.text().strip(),
+            'package_size': field_text(self.package_input),
             # Get MRP value
-            'mrp': self.mrp_input.value(),
+            'mrp': mrp,
             # Get purchase price
-            'purchase_price': self.purchase_price_input.value(),
+            'purchase_price': price_value(self.purchase_price_input),
             # Get minimum stock level
             'min_stock_level': self.min_stock_input.value(),
             # Get description and remove whitespace
-            'description': self.description_input.text().strip(),
+            'description': field_text(self.description_input),
             # Get batch number (MANDATORY)
-            'batch_number': self.batch_input.text().strip(),
+            'batch_number': field_text(self.batch_input),
             # Get expiry date in YYYY-MM-DD format (MANDATORY)
             'expiry_date': self.expiry_input.date().toString("yyyy-MM-dd"),
             # Set default discount to 0 (will be set at billing time)
             'discount_percent': 0.0,
             # Set selling_price same as MRP (will be calculated at billing time)
-            'selling_price': self.mrp_input.value()
+            'selling_price': mrp
         }
 
         # If adding new product (not editing)
@@ -953,147 +1538,64 @@ class ProductDialog(QDialog):
         # Return complete product data dictionary
         return data
 
-    def get_input_style(self) -> str:
-        """Get input field styling"""
-        # Return CSS stylesheet for line edit fields
-        return """
-            QLineEdit {
-                background-color: #EBF4DD;
-                border: 2px solid #90AB8B;
-                border-radius: 5px;
-                padding: 8px;
-                color: #3B4953;
-                font-size: 11pt;
-            }
-            QLineEdit:focus {
-                border: 2px solid #5A7863;
-            }
-        """
-
-    def get_combo_style(self) -> str:
-        """Get combo box styling"""
-        # Return CSS stylesheet for combo boxes
-        return """
-            QComboBox {
-                padding: 8px;
-                font-weight: bold;
-                background-color: #EBF4DD;
-                border: 2px solid #90AB8B;
-                border-radius: 5px;
-                color: #3B4953;
-            }
-            QComboBox:focus {
-                border: 2px solid #5A7863;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #EBF4DD;
-                selection-background-color: #90AB8B;
-                selection-color: #EBF4DD;
-            }
-        """
-
-    def get_spinbox_style(self) -> str:
-        """Get spin box styling"""
-        # Return CSS stylesheet for spin boxes
-        return """
-            QSpinBox, QDoubleSpinBox {
-                background-color: #EBF4DD;
-                border: 2px solid #90AB8B;
-                border-radius: 5px;
-                padding: 8px;
-                color: #3B4953;
-                font-weight: bold;
-            }
-            QSpinBox:focus, QDoubleSpinBox:focus {
-                border: 2px solid #5A7863;
-            }
-        """
-
-    def get_date_style(self) -> str:
-        """Get date picker styling"""
-        # Return CSS stylesheet for date picker
-        return """
-            QDateEdit {
-                background-color: #EBF4DD;
-                border: 2px solid #90AB8B;
-                border-radius: 5px;
-                padding: 8px;
-                color: #3B4953;
-                font-weight: bold;
-            }
-            QDateEdit:focus {
-                border: 2px solid #5A7863;
-            }
-            QDateEdit::drop-down {
-                border: none;
-            }
-        """
-
 
 class StockAdjustmentDialog(QDialog):
-    """Dialog for adjusting stock"""
+    """Dialog for adjusting stock
+
+    Built once and pointed at each product in turn through reset().
+    """
 
     def __init__(self, parent=None, product=None):
         # Initialize parent QDialog class
         super().__init__(parent)
-        # Store product data for stock adjustment
-        self.product = product
+        # Product being adjusted; set by reset()
+        self.product = None
         # Initialize dialog user interface
         self.init_ui()
+        # Fill the fields for the given product, if any
+        if product is not None:
+            self.reset(product)
+
+    def reset(self, product):
+        """Point the dialog at a product and clear the previous entry"""
+        # Store product data for stock adjustment
+        self.product = product
+        # Set window title with product name
+        self.setWindowTitle(f"Adjust Stock - {product['name']}")
+        # Show current stock in bold
+        self.current_label.setText(f"<b>{product['current_stock']}</b>")
+        # Set initial value to current stock
+        self.new_stock_input.setValue(product['current_stock'])
+        # Clear notes left from the previous product
+        self.notes_input.clear()
+        # Start typing in the new stock field
+        self.new_stock_input.setFocus()
 
     def init_ui(self):
         """Initialize dialog UI"""
-        # Set window title with product name
-        self.setWindowTitle(f"Adjust Stock - {self.product['name']}")
         # Set minimum dialog width to 400 pixels
         self.setMinimumWidth(400)
-        # Apply cream background to dialog
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #EBF4DD;
-            }
-            QLabel {
-                color: #3B4953;
-                font-weight: bold;
-            }
-        """)
+        # Styled by the parent page's stylesheet through this object name
+        self.setObjectName("stockDialog")
 
         # Create form layout for input fields
         layout = QFormLayout()
         # Set spacing between form rows
         layout.setSpacing(10)
 
-        # Create label to display current stock in bold
-        current_label = QLabel(f"<b>{self.product['current_stock']}</b>")
-        # Apply dark text color
-        current_label.setStyleSheet("color: #5A7863; font-size: 14pt;")
+        # Create label to display current stock (filled by reset)
+        self.current_label = QLabel()
+        # Name the label for its larger green dialog stylesheet rule
+        self.current_label.setObjectName("currentStockLabel")
         # Add current stock to form with label
-        layout.addRow("Current Stock:", current_label)
+        layout.addRow("Current Stock:", self.current_label)
 
         # Create spin box for new stock value
         self.new_stock_input = QSpinBox()
-        # Set maximum value to 999999
-        self.new_stock_input.setMaximum(999999)
-        # Set initial value to current stock
-        self.new_stock_input.setValue(self.product['current_stock'])
-        # Apply spin box styling
-        self.new_stock_input.setStyleSheet("""
-            QSpinBox {
-                background-color: #EBF4DD;
-                border: 2px solid #90AB8B;
-                border-radius: 5px;
-                padding: 8px;
-                color: #3B4953;
-                font-weight: bold;
-                font-size: 11pt;
-            }
-            QSpinBox:focus {
-                border: 2px solid #5A7863;
-            }
-        """)
+        # Allow 0 to 999999
+        self.new_stock_input.setRange(0, 999999)
+        # Emit valueChanged once on commit rather than per typed digit
+        self.new_stock_input.setKeyboardTracking(False)
         # Add new stock field to form with label
         layout.addRow("New Stock: *", self.new_stock_input)
 
@@ -1101,19 +1603,6 @@ class StockAdjustmentDialog(QDialog):
         self.notes_input = QLineEdit()
         # Set placeholder text
         self.notes_input.setPlaceholderText("Reason for adjustment...")
-        # Apply input field styling
-        self.notes_input.setStyleSheet("""
-            QLineEdit {
-                background-color: #EBF4DD;
-                border: 2px solid #90AB8B;
-                border-radius: 5px;
-                padding: 8px;
-                color: #3B4953;
-            }
-            QLineEdit:focus {
-                border: 2px solid #5A7863;
-            }
-        """)
         # Add notes field to form with label
         layout.addRow("Notes:", self.notes_input)
 
@@ -1123,20 +1612,6 @@ class StockAdjustmentDialog(QDialog):
         buttons.accepted.connect(self.accept)
         # Connect rejected signal to dialog reject (Cancel button)
         buttons.rejected.connect(self.reject)
-        # Apply button styling
-        buttons.setStyleSheet("""
-            QPushButton {
-                background-color: #5A7863;
-                color: #EBF4DD;
-                padding: 8px 20px;
-                border-radius: 5px;
-                font-weight: bold;
-                min-width: 80px;
-            }
-            QPushButton:hover {
-                background-color: #90AB8B;
-            }
-        """)
 
         # Add button box to form layout
         layout.addRow(buttons)
@@ -1147,4 +1622,4 @@ class StockAdjustmentDialog(QDialog):
     def get_stock_data(self):
         """Get stock adjustment data"""
         # Return tuple of new stock value and notes (with whitespace removed)
-        return self.new_stock_input.value(), self.notes_input.text().strip()
\ No newline at end of file
+        return self.new_stock_input.value(), field_text(self.notes_input)
\ No newline at end of file
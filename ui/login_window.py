@@ -1,12 +1,148 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                             QLineEdit, QPushButton, QMessageBox, QFrame, QGraphicsDropShadowEffect)
-from PyQt5.QtCore import Qt, pyqtSignal, QPropertyAnimation, QEasingCurve
+from PyQt5.QtCore import (Qt, pyqtSignal, QPropertyAnimation, QEasingCurve, QObject,
+                          QRunnable, QThreadPool)
 from PyQt5.QtGui import QFont, QIcon, QPalette, QLinearGradient, QColor, QBrush, QPainter
 from modules.auth import auth_manager
 from config import APP_NAME, COMPANY_NAME
 from utils.logger import logger
 
 
+# Whole login window stylesheet, applied once on the window. Card and input
+# rules also cover the QFrames inside them (labels included), as the old
+# per-frame sheets did; input rules come after card rules so they win.
+STYLESHEET = """
+QFrame#loginCard, #loginCard QFrame {
+    background-color: #EBF4DD;
+    border-radius: 15px;
+}
+QFrame#loginInput, #loginInput QFrame {
+    background-color: white;
+    border-radius: 8px;
+    border: 2px solid #90AB8B;
+}
+QFrame#loginInput:focus-within {
+    border: 2px solid #5A7863;
+}
+#loginInput QLineEdit {
+    background: transparent;
+    border: none;
+    font-size: 12pt;
+    color: #3B4953;
+}
+#loginInput QLineEdit:focus {
+    outline: none;
+}
+
+QLabel#loginIcon {
+    font-size: 48pt;
+}
+QLabel#companyLabel {
+    color: #5A7863;
+    font-size: 20pt;
+    font-weight: bold;
+    font-family: 'Segoe UI', 'Arial', sans-serif;
+}
+QLabel#taglineLabel {
+    color: #90AB8B;
+    font-size: 11pt;
+    font-style: italic;
+    margin-bottom: 10px;
+}
+QLabel#loginTitle {
+    color: #3B4953;
+    font-size: 16pt;
+    font-weight: bold;
+    margin-bottom: 10px;
+}
+QLabel#inputIcon {
+    font-size: 18pt;
+    color: #90AB8B;
+}
+QLabel#hintLabel {
+    color: #90AB8B;
+    font-size: 9pt;
+    margin-top: 10px;
+}
+QLabel#loginFooter {
+    color: #EBF4DD;
+    font-size: 10pt;
+    opacity: 0.9;
+}
+
+QPushButton#loginButton {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+        stop:0 #5A7863, stop:1 #3B4953);
+    color: #EBF4DD;
+    font-size: 14pt;
+    font-weight: bold;
+    padding: 15px;
+    border-radius: 8px;
+    border: none;
+}
+QPushButton#loginButton:hover {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+        stop:0 #90AB8B, stop:1 #5A7863);
+}
+QPushButton#loginButton:pressed {
+    background: #3B4953;
+}
+QPushButton#loginButton:disabled {
+    background: #90AB8B;
+    opacity: 0.6;
+}
+"""
+
+# Login error message box stylesheet
+MESSAGE_BOX_STYLE = """
+    QMessageBox {
+        background-color: #EBF4DD;
+    }
+    QLabel {
+        color: #3B4953;
+        font-size: 11pt;
+    }
+    QPushButton {
+        background-color: #5A7863;
+        color: #EBF4DD;
+        padding: 8px 20px;
+        border-radius: 5px;
+        font-weight: bold;
+        min-width: 80px;
+    }
+    QPushButton:hover {
+        background-color: #90AB8B;
+    }
+"""
+
+
+class LoginSignals(QObject):
+    """Signals emitted by LoginTask"""
+    done = pyqtSignal(bool, str, object)
+
+
+class LoginTask(QRunnable):
+    """Run auth_manager.login off the GUI thread
+
+    The result is handed back through signals.done as
+    (success, message, user_data).
+    """
+
+    def __init__(self, username: str, password: str):
+        super().__init__()
+        self.username = username
+        self.password = password
+        self.signals = LoginSignals()
+
+    def run(self):
+        try:
+            result = auth_manager.login(self.username, self.password)
+        except Exception as e:
+            logger.error(f"Error during login: {e}")
+            result = (False, "Login error occurred", None)
+        self.signals.done.emit(*result)
+
+
 class LoginWindow(QWidget):
     """Modern login window with gradient background"""
     
@@ -19,7 +155,6 @@ class LoginWindow(QWidget):
     def init_ui(self):
         """Initialize the user interface"""
         self.setWindowTitle(f"{APP_NAME} - Login")
-        self.setFixedSize(800, 800)
         
         # Set gradient background using color palette
         self.setAutoFillBackground(True)
@@ -49,10 +184,15 @@ class LoginWindow(QWidget):
         # Footer
         footer = QLabel("© 2026 Natural Health World")
         footer.setAlignment(Qt.AlignCenter)
-        footer.setStyleSheet("color: #EBF4DD; font-size: 10pt; opacity: 0.9;")
+        footer.setObjectName("loginFooter")
         main_layout.addWidget(footer)
         
         self.setLayout(main_layout)
+
+        # Fix the geometry and style once every widget is in place
+        self.setFixedSize(800, 800)
+        # One stylesheet for the whole window; widgets are matched by object name
+        self.setStyleSheet(STYLESHEET)
         
         # Set focus
         self.username_input.setFocus()
@@ -60,12 +200,7 @@ class LoginWindow(QWidget):
     def create_login_card(self) -> QFrame:
         """Create the login card with shadow effect"""
         card = QFrame()
-        card.setStyleSheet("""
-            QFrame {
-                background-color: #EBF4DD;
-                border-radius: 15px;
-            }
-        """)
+        card.setObjectName("loginCard")
         
         # Add shadow effect
         shadow = QGraphicsDropShadowEffect()
@@ -86,27 +221,17 @@ class LoginWindow(QWidget):
         # Icon
         icon_label = QLabel("🌿")
         icon_label.setAlignment(Qt.AlignCenter)
-        icon_label.setStyleSheet("font-size: 48pt;")
+        icon_label.setObjectName("loginIcon")
         
         # Company name
         company_label = QLabel("Natural Health World")
         company_label.setAlignment(Qt.AlignCenter)
-        company_label.setStyleSheet("""
-            color: #5A7863;
-            font-size: 20pt;
-            font-weight: bold;
-            font-family: 'Segoe UI', 'Arial', sans-serif;
-        """)
+        company_label.setObjectName("companyLabel")
         
         # Tagline
         tagline_label = QLabel("The Herbal Healing")
         tagline_label.setAlignment(Qt.AlignCenter)
-        tagline_label.setStyleSheet("""
-            color: #90AB8B;
-            font-size: 11pt;
-            font-style: italic;
-            margin-bottom: 10px;
-        """)
+        tagline_label.setObjectName("taglineLabel")
         
         logo_layout.addWidget(icon_label)
         logo_layout.addWidget(company_label)
@@ -118,12 +243,7 @@ class LoginWindow(QWidget):
         # Login title
         login_title = QLabel("Sign In")
         login_title.setAlignment(Qt.AlignCenter)
-        login_title.setStyleSheet("""
-            color: #3B4953;
-            font-size: 16pt;
-            font-weight: bold;
-            margin-bottom: 10px;
-        """)
+        login_title.setObjectName("loginTitle")
         layout.addWidget(login_title)
         
         # Username field
@@ -144,29 +264,7 @@ class LoginWindow(QWidget):
         
         # Login button
         self.login_btn = QPushButton("LOGIN")
-        self.login_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #5A7863, stop:1 #3B4953);
-                color: #EBF4DD;
-                font-size: 14pt;
-                font-weight: bold;
-                padding: 15px;
-                border-radius: 8px;
-                border: none;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #90AB8B, stop:1 #5A7863);
-            }
-            QPushButton:pressed {
-                background: #3B4953;
-            }
-            QPushButton:disabled {
-                background: #90AB8B;
-                opacity: 0.6;
-            }
-        """)
+        self.login_btn.setObjectName("loginButton")
         self.login_btn.setCursor(Qt.PointingHandCursor)
         self.login_btn.clicked.connect(self.on_login)
         layout.addWidget(self.login_btn)
@@ -174,11 +272,7 @@ class LoginWindow(QWidget):
         # Default credentials hint
         hint_label = QLabel("Default: admin / admin123")
         hint_label.setAlignment(Qt.AlignCenter)
-        hint_label.setStyleSheet("""
-            color: #90AB8B;
-            font-size: 9pt;
-            margin-top: 10px;
-        """)
+        hint_label.setObjectName("hintLabel")
         layout.addWidget(hint_label)
         
         # Connect return key
@@ -190,16 +284,7 @@ class LoginWindow(QWidget):
     def create_input_field(self, icon: str, placeholder: str, is_password: bool) -> QFrame:
         """Create a styled input field with icon"""
         container = QFrame()
-        container.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border-radius: 8px;
-                border: 2px solid #90AB8B;
-            }
-            QFrame:focus-within {
-                border: 2px solid #5A7863;
-            }
-        """)
+        container.setObjectName("loginInput")
         
         layout = QHBoxLayout(container)
         layout.setContentsMargins(15, 10, 15, 10)
@@ -207,23 +292,12 @@ class LoginWindow(QWidget):
         
         # Icon
         icon_label = QLabel(icon)
-        icon_label.setStyleSheet("font-size: 18pt; color: #90AB8B;")
+        icon_label.setObjectName("inputIcon")
         layout.addWidget(icon_label)
         
         # Input field
         input_field = QLineEdit()
         input_field.setPlaceholderText(placeholder)
-        input_field.setStyleSheet("""
-            QLineEdit {
-                background: transparent;
-                border: none;
-                font-size: 12pt;
-                color: #3B4953;
-            }
-            QLineEdit:focus {
-                outline: none;
-            }
-        """)
         
         if is_password:
             input_field.setEchoMode(QLineEdit.Password)
@@ -234,6 +308,10 @@ class LoginWindow(QWidget):
     
     def on_login(self):
         """Handle login button click"""
+        # A login is already running (Return pressed again)
+        if not self.login_btn.isEnabled():
+            return
+
         username = self.username_input.text().strip()
         password = self.password_input.text()
         
@@ -245,15 +323,20 @@ class LoginWindow(QWidget):
         self.login_btn.setEnabled(False)
         self.login_btn.setText("LOGGING IN...")
         
-        # Authenticate
-        success, message, user_data = auth_manager.login(username, password)
-        
+        # Authenticate in a worker thread (password hashing is slow); the
+        # result arrives in on_login_done
+        task = LoginTask(username, password)
+        task.signals.done.connect(self.on_login_done)
+        QThreadPool.globalInstance().start(task)
+
+    def on_login_done(self, success: bool, message: str, user_data):
+        """Handle the result of a finished login"""
         # Re-enable login button
         self.login_btn.setEnabled(True)
         self.login_btn.setText("LOGIN")
         
         if success:
-            logger.info(f"Login successful: {username}")
+            logger.info(f"Login successful: {user_data.get('username')}")
             self.login_successful.emit(user_data)
             self.close()
         else:
@@ -267,26 +350,7 @@ class LoginWindow(QWidget):
         msg_box.setIcon(QMessageBox.Warning)
         msg_box.setWindowTitle("Login Error")
         msg_box.setText(message)
-        msg_box.setStyleSheet("""
-            QMessageBox {
-                background-color: #EBF4DD;
-            }
-            QLabel {
-                color: #3B4953;
-                font-size: 11pt;
-            }
-            QPushButton {
-                background-color: #5A7863;
-                color: #EBF4DD;
-                padding: 8px 20px;
-                border-radius: 5px;
-                font-weight: bold;
-                min-width: 80px;
-            }
-            QPushButton:hover {
-                background-color: #90AB8B;
-            }
-        """)
+        msg_box.setStyleSheet(MESSAGE_BOX_STYLE)
         msg_box.exec_()
     
     def keyPressEvent(self, event):
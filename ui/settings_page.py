@@ -10,6 +10,22 @@ from modules.auth import auth_manager
 from database.db_manager import db
 from config import APP_VERSION
 from utils.logger import logger
+from utils.signals import app_signals
+
+
+# Input styling, applied once through each container's stylesheet
+INPUT_STYLE = """
+    QLineEdit {
+        background-color: #EBF4DD;
+        border: 2px solid #90AB8B;
+        border-radius: 5px;
+        padding: 8px;
+        color: #3B4953;
+    }
+    QLineEdit:focus {
+        border: 2px solid #5A7863;
+    }
+"""
 
 
 class SettingsPage(QWidget):
@@ -233,6 +249,7 @@ class SettingsPage(QWidget):
             if success:
                 self.show_styled_message("Success", message, QMessageBox.Information)
                 self.load_sales_persons()
+                app_signals.sales_persons_updated.emit()
             else:
                 self.show_styled_message("Error", message, QMessageBox.Warning)
     
@@ -261,6 +278,7 @@ class SettingsPage(QWidget):
             if success:
                 self.show_styled_message("Success", message, QMessageBox.Information)
                 self.load_sales_persons()
+                app_signals.sales_persons_updated.emit()
             else:
                 self.show_styled_message("Error", message, QMessageBox.Warning)
     
@@ -292,6 +310,7 @@ class SettingsPage(QWidget):
             if success:
                 self.show_styled_message("Success", message, QMessageBox.Information)
                 self.load_sales_persons()
+                app_signals.sales_persons_updated.emit()
             else:
                 self.show_styled_message("Error", message, QMessageBox.Warning)
     
@@ -632,7 +651,7 @@ class SettingsPage(QWidget):
                 left: 10px;
                 padding: 0 5px;
             }
-        """)
+        """ + INPUT_STYLE)
         
         layout = QVBoxLayout()
         layout.setSpacing(10)
@@ -641,21 +660,18 @@ class SettingsPage(QWidget):
         self.old_password = QLineEdit()
         self.old_password.setEchoMode(QLineEdit.Password)
         self.old_password.setMinimumHeight(30)
-        self.old_password.setStyleSheet(self.get_input_style())
         layout.addWidget(self.old_password)
         
         layout.addWidget(self.create_form_label("New Password:"))
         self.new_password = QLineEdit()
         self.new_password.setEchoMode(QLineEdit.Password)
         self.new_password.setMinimumHeight(30)
-        self.new_password.setStyleSheet(self.get_input_style())
         layout.addWidget(self.new_password)
         
         layout.addWidget(self.create_form_label("Confirm Password:"))
         self.confirm_password = QLineEdit()
         self.confirm_password.setEchoMode(QLineEdit.Password)
         self.confirm_password.setMinimumHeight(30)
-        self.confirm_password.setStyleSheet(self.get_input_style())
         layout.addWidget(self.confirm_password)
         
         change_btn = QPushButton("🔒 Change Password")
@@ -686,21 +702,6 @@ class SettingsPage(QWidget):
         label.setStyleSheet("color: #3B4953; font-weight: bold;")
         return label
     
-    def get_input_style(self) -> str:
-        """Get input field styling"""
-        return """
-            QLineEdit {
-                background-color: #EBF4DD;
-                border: 2px solid #90AB8B;
-                border-radius: 5px;
-                padding: 8px;
-                color: #3B4953;
-            }
-            QLineEdit:focus {
-                border: 2px solid #5A7863;
-            }
-        """
-    
     def change_password(self):
         """Change user password"""
         old_pass = self.old_password.text()
@@ -783,7 +784,7 @@ class SalesPersonDialog(QDialog):
                 color: #3B4953;
                 font-weight: bold;
             }
-        """)
+        """ + INPUT_STYLE)
         
         layout = QFormLayout()
         layout.setSpacing(10)
@@ -792,21 +793,18 @@ class SalesPersonDialog(QDialog):
         self.name_input.setMinimumHeight(30)
         if self.sales_person:
             self.name_input.setText(self.sales_person['name'])
-        self.name_input.setStyleSheet(self.get_input_style())
         layout.addRow("Name: *", self.name_input)
         
         self.phone_input = QLineEdit()
         self.phone_input.setMinimumHeight(30)
         if self.sales_person:
             self.phone_input.setText(self.sales_person.get('phone', ''))
-        self.phone_input.setStyleSheet(self.get_input_style())
         layout.addRow("Phone:", self.phone_input)
         
         self.email_input = QLineEdit()
         self.email_input.setMinimumHeight(30)
         if self.sales_person:
             self.email_input.setText(self.sales_person.get('email', ''))
-        self.email_input.setStyleSheet(self.get_input_style())
         layout.addRow("Email:", self.email_input)
         
         buttons = QDialogButtonBox(QDialogButtonBox.Save | QDialogButtonBox.Cancel)
@@ -837,18 +835,3 @@ class SalesPersonDialog(QDialog):
             self.phone_input.text().strip(),
             self.email_input.text().strip()
         )
-    
-    def get_input_style(self) -> str:
-        """Get input field styling"""
-        return """
-            QLineEdit {
-                background-color: #EBF4DD;
-                border: 2px solid #90AB8B;
-                border-radius: 5px;
-                padding: 8px;
-                color: #3B4953;
-            }
-            QLineEdit:focus {
-                border: 2px solid #5A7863;
-            }
-        """
@@ -1,4 +1,5 @@
 import os
+import io
 from datetime import datetime
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import inch
@@ -17,6 +18,74 @@ class PDFGenerator:
     def __init__(self):
         self.page_width, self.page_height = A4
         os.makedirs(PDF_OUTPUT_DIR, exist_ok=True)
+        # Paragraph styles and logo bytes, built once (see prepare)
+        self._styles = None
+        self._logo_key = None
+        self._logo_bytes = None
+    
+    def prepare(self):
+        """Build styles and read the logo ahead of the first invoice"""
+        self.get_styles()
+        
+        from utils.company_settings import company_settings
+        logo_path = company_settings.logo_path
+        if logo_path and os.path.exists(logo_path):
+            try:
+                self.get_logo_bytes(logo_path)
+            except OSError as e:
+                logger.warning(f"Could not load logo: {e}")
+    
+    def get_styles(self) -> dict:
+        """Return the invoice paragraph styles, building them on first use"""
+        if self._styles is None:
+            styles = getSampleStyleSheet()
+            self._styles = {
+                'sample': styles,
+                'title': ParagraphStyle(
+                    'CustomTitle',
+                    parent=styles['Heading1'],
+                    fontSize=22,
+                    textColor=colors.HexColor('#4CAF50'),
+                    alignment=TA_CENTER,
+                    spaceAfter=3
+                ),
+                'subtitle': ParagraphStyle(
+                    'Subtitle',
+                    parent=styles['Normal'],
+                    fontSize=9,
+                    alignment=TA_CENTER,
+                    spaceAfter=2
+                ),
+                'heading': ParagraphStyle(
+                    'Heading',
+                    parent=styles['Heading2'],
+                    fontSize=12,
+                    textColor=colors.HexColor('#333333'),
+                    spaceAfter=10
+                ),
+                # ✅ Invoice Number at the very top - CENTER ALIGNED
+                'invoice_header': ParagraphStyle(
+                    'InvoiceHeader',
+                    parent=styles['Normal'],
+                    fontSize=11,
+                    fontName='Helvetica-Bold',
+                    alignment=TA_CENTER,
+                    spaceAfter=8
+                ),
+                'note': ParagraphStyle('Note', parent=styles['Normal'], fontSize=9, textColor=colors.grey),
+                'terms': ParagraphStyle('Terms', parent=styles['Normal'], fontSize=8),
+                'signature': ParagraphStyle('Signature', parent=styles['Normal'], alignment=TA_RIGHT),
+            }
+        return self._styles
+    
+    def get_logo_bytes(self, logo_path: str) -> bytes:
+        """Return the logo file contents, re-reading only when the file changes"""
+        key = (logo_path, os.path.getmtime(logo_path))
+        if key != self._logo_key:
+            with open(logo_path, 'rb') as f:
+                self._logo_bytes = f.read()
+            self._logo_key = key
+        return self._logo_bytes
     
     def generate_invoice(self, bill: dict) -> tuple:
         """
@@ -41,14 +110,19 @@ class PDFGenerator:
             elements = []
             
             # Styles
-            styles = getSampleStyleSheet()
+            invoice_styles = self.get_styles()
+            styles = invoice_styles['sample']
+            title_style = invoice_styles['title']
+            subtitle_style = invoice_styles['subtitle']
+            heading_style = invoice_styles['heading']
+            invoice_header_style = invoice_styles['invoice_header']
 
             # ===== ADD LOGO =====
             logo_path = company_settings.logo_path
             if logo_path and os.path.exists(logo_path):
                 try:
-                    # Create logo image
-                    logo = Image(logo_path, width=1.5*inch, height=0.75*inch)
+                    # Create logo image from the cached file contents
+                    logo = Image(io.BytesIO(self.get_logo_bytes(logo_path)), width=1.5*inch, height=0.75*inch)
                     # Center align logo
                     logo.hAlign = 'CENTER'
                     elements.append(logo)
@@ -57,42 +131,6 @@ class PDFGenerator:
                     logger.warning(f"Could not load logo: {e}")
                     # Continue without logo if loading fails
             
-            # Custom styles
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Heading1'],
-                fontSize=22,
-                textColor=colors.HexColor('#4CAF50'),
-                alignment=TA_CENTER,
-                spaceAfter=3
-            )
-            
-            subtitle_style = ParagraphStyle(
-                'Subtitle',
-                parent=styles['Normal'],
-                fontSize=9,
-                alignment=TA_CENTER,
-                spaceAfter=2
-            )
-            
-            heading_style = ParagraphStyle(
-                'Heading',
-                parent=styles['Heading2'],
-                fontSize=12,
-                textColor=colors.HexColor('#333333'),
-                spaceAfter=10
-            )
-            
-            # ✅ Invoice Number at the very top - CENTER ALIGNED
-            invoice_header_style = ParagraphStyle(
-                'InvoiceHeader',
-                parent=styles['Normal'],
-                fontSize=11,
-                fontName='Helvetica-Bold',
-                alignment=TA_CENTER,
-                spaceAfter=8
-            )
-            
             invoice_header_text = f"<b>Invoice No: {bill['invoice_number']}</b>"
             elements.append(Paragraph(invoice_header_text, invoice_header_style))
             elements.append(Spacer(1, 0.05*inch))
@@ -319,7 +357,7 @@ class PDFGenerator:
             # Note
             invoice_note = company_settings.get('invoice_note', '')
             if invoice_note:
-                note_style = ParagraphStyle('Note', parent=styles['Normal'], fontSize=9, textColor=colors.grey)
+                note_style = invoice_styles['note']
                 elements.append(Paragraph(invoice_note, note_style))
                 elements.append(Spacer(1, 0.2*inch))
             
@@ -327,12 +365,12 @@ class PDFGenerator:
             if is_gst_bill:
                 terms_text = "" \
                            ""
-                terms_style = ParagraphStyle('Terms', parent=styles['Normal'], fontSize=8)
+                terms_style = invoice_styles['terms']
                 elements.append(Paragraph(terms_text, terms_style))
                 elements.append(Spacer(1, 0.2*inch))
             
             # Signature
-            signature_style = ParagraphStyle('Signature', parent=styles['Normal'], alignment=TA_RIGHT)
+            signature_style = invoice_styles['signature']
             elements.append(Paragraph(f"<b>FOR, {company_settings.get('company_name', 'NATURAL HEALTH WORLD')}</b>", signature_style))
             elements.append(Spacer(1, 0.5*inch))
             elements.append(Paragraph("<b>AUTHORISED SIGNATORY</b>", signature_style))
@@ -2,5 +2,6 @@ from PyQt5.QtCore import QObject, pyqtSignal
 
 class AppSignals(QObject):
     inventory_updated = pyqtSignal()
+    sales_persons_updated = pyqtSignal()
 
 app_signals = AppSignals()
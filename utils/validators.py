@@ -2,6 +2,12 @@ import re
 from typing import Tuple
 from utils.constants import GSTIN_PATTERN, PHONE_PATTERN, EMAIL_PATTERN, PIN_CODE_PATTERN
 
+# Patterns compiled once at import
+_GSTIN_RE = re.compile(GSTIN_PATTERN)
+_PHONE_RE = re.compile(PHONE_PATTERN)
+_EMAIL_RE = re.compile(EMAIL_PATTERN)
+_PIN_CODE_RE = re.compile(PIN_CODE_PATTERN)
+
 def validate_gstin(gstin: str) -> Tuple[bool, str]:
     """Validate GST Identification Number"""
     if not gstin:
@@ -9,7 +15,7 @@ def validate_gstin(gstin: str) -> Tuple[bool, str]:
     
     gstin = gstin.strip().upper()
     
-    if not re.match(GSTIN_PATTERN, gstin):
+    if not _GSTIN_RE.match(gstin):
         return False, "Invalid GSTIN format. Must be 15 characters (e.g., 22AAAAA0000A1Z5)"
     
     return True, ""
@@ -21,7 +27,7 @@ def validate_phone(phone: str) -> Tuple[bool, str]:
     
     phone = phone.strip().replace(" ", "").replace("-", "")
     
-    if not re.match(PHONE_PATTERN, phone):
+    if not _PHONE_RE.match(phone):
         return False, "Invalid phone number. Must be 10 digits starting with 6-9"
     
     return True, ""
@@ -33,7 +39,7 @@ def validate_email(email: str) -> Tuple[bool, str]:
     
     email = email.strip()
     
-    if not re.match(EMAIL_PATTERN, email):
+    if not _EMAIL_RE.match(email):
         return False, "Invalid email format"
     
     return True, ""
@@ -45,7 +51,7 @@ def validate_pin_code(pin_code: str) -> Tuple[bool, str]:
     
     pin_code = pin_code.strip()
     
-    if not re.match(PIN_CODE_PATTERN, pin_code):
+    if not _PIN_CODE_RE.match(pin_code):
         return False, "Invalid PIN code. Must be 6 digits"
     
     return True, ""